@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_cmd_alloc.py
+Stress the locked counter allocator (scripts/cmd_alloc.py) against the
+previous new_cmd.sh loop (ls|sed|sort scan, mkdir, random sleep, 5 attempts;
+run through bash as before).
+
+Usage: python3 benchmarks/bench_cmd_alloc.py [--repeat N] [--procs N] [--cmds N] [--skip-legacy]
+
+Each run creates --cmds cmd directories (default 1000) from --procs
+concurrent processes (default 32) in a fresh temp work/ dir, then checks:
+  - every allocated number is unique and the numbers are exactly 1..N
+  - one directory per number, counter file == N
+Crash-recovery cases (missing/corrupt counter, directory created without a
+counter update) are checked once before timing.
+"""
+
+import argparse
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from cmd_alloc import COUNTER_FILE, allocate, cmd_dir_name  # noqa: E402
+
+CMD_DIR_RE = re.compile(r'^cmd_(\d+)$')
+
+
+# Allocation loop from the previous scripts/new_cmd.sh (prints the number or nothing)
+LEGACY_LOOP = r'''
+cd "$1"
+for i in $(seq 1 5); do
+  LAST=$(ls . 2>/dev/null | sed -n 's/^cmd_\([0-9]*\)$/\1/p' | sort -n | tail -1)
+  NEXT=$(printf "%03d" $(( 10#${LAST:-0} + 1 )))
+  if mkdir "cmd_${NEXT}" 2>/dev/null; then
+    echo "$NEXT"
+    exit 0
+  fi
+  sleep 0.$((RANDOM % 500))
+done
+exit 1
+'''
+
+
+def legacy_allocate(work_root):
+    """Previous new_cmd.sh loop. Returns number or None after 5 failed attempts."""
+    proc = subprocess.run(['bash', '-c', LEGACY_LOOP, 'legacy', work_root],
+                          capture_output=True, text=True)
+    return int(proc.stdout, 10) if proc.returncode == 0 else None
+
+
+def worker(args):
+    work_root, count, legacy = args
+    if legacy:
+        return [legacy_allocate(work_root) for _ in range(count)]
+    return [allocate(work_root)[0] for _ in range(count)]
+
+
+def run(procs, cmds, legacy):
+    """Returns (seconds, allocated numbers incl. None for failures, work_root)."""
+    work_root = tempfile.mkdtemp(prefix='bench_cmd_alloc_')
+    shares = [cmds // procs + (1 if i < cmds % procs else 0) for i in range(procs)]
+    with multiprocessing.Pool(procs) as pool:
+        start = time.perf_counter()
+        results = pool.map(worker, [(work_root, n, legacy) for n in shares])
+        elapsed = time.perf_counter() - start
+    return elapsed, [n for chunk in results for n in chunk], work_root
+
+
+def check_allocations(numbers, work_root, cmds):
+    assert len(numbers) == len(set(numbers)) == cmds, 'duplicate cmd numbers'
+    assert sorted(numbers) == list(range(1, cmds + 1)), 'skipped cmd numbers'
+    dirs = [d for d in os.listdir(work_root) if CMD_DIR_RE.match(d)]
+    assert len(dirs) == cmds, f'{len(dirs)} directories for {cmds} cmds'
+    with open(os.path.join(work_root, COUNTER_FILE)) as f:
+        assert int(f.read()) == cmds
+
+
+def check_recovery():
+    with tempfile.TemporaryDirectory() as work_root:
+        # Existing cmds, no counter yet: bootstrap by scan
+        os.mkdir(os.path.join(work_root, 'cmd_041'))
+        assert allocate(work_root)[0] == 42
+        # Crash after mkdir, before counter update: skip the orphan dir
+        os.mkdir(os.path.join(work_root, 'cmd_043'))
+        assert allocate(work_root)[0] == 44
+        # Corrupt counter: rebuild from scan
+        with open(os.path.join(work_root, COUNTER_FILE), 'w') as f:
+            f.write('garbage')
+        assert allocate(work_root)[0] == 45
+        # Deleted cmds are not reused
+        os.rmdir(os.path.join(work_root, 'cmd_045'))
+        assert allocate(work_root)[0] == 46
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--procs', type=int, default=32)
+    parser.add_argument('--cmds', type=int, default=1000)
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help='skip the previous mkdir/sleep loop (slow under contention)')
+    args = parser.parse_args()
+
+    check_recovery()
+    print('recovery: OK')
+
+    best = None
+    for _ in range(args.repeat):
+        elapsed, numbers, work_root = run(args.procs, args.cmds, legacy=False)
+        check_allocations(numbers, work_root, args.cmds)
+        shutil.rmtree(work_root)
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'counter: {args.cmds} cmds / {args.procs} procs in {best:.3f}s '
+          f'({args.cmds / best:,.0f} allocations/s), ids unique and contiguous')
+
+    if not args.skip_legacy:
+        elapsed, numbers, work_root = run(args.procs, args.cmds, legacy=True)
+        shutil.rmtree(work_root)
+        failed = numbers.count(None)
+        print(f'legacy:  {args.cmds} cmds / {args.procs} procs in {elapsed:.3f}s, '
+              f'{failed} allocations failed after 5 attempts')
+
+
+if __name__ == '__main__':
+    main()
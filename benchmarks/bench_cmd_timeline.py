@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_cmd_timeline.py
+Concurrency curve in scripts/cmd_timeline.py: one sorted sweep over
+start/end events vs recounting every running entry at each change point.
+
+Usage: python3 benchmarks/bench_cmd_timeline.py [--repeat N] [--tasks N] [--seed N]
+
+Generates a plan with --tasks tasks in dependency waves (max_parallel 10
+per wave), an execution log with staggered starts, retried tasks and
+a few unfinished entries, then times the full analysis as well.
+
+Before timing, both curves are checked to be identical, and the critical
+path is checked against the longest path found by exhaustive search over
+the dependency graph.
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from cmd_timeline import analyze, build_runs, concurrency_curve, parse_plan  # noqa: E402
+
+START = datetime(2026, 2, 7, 10, 0, 0)
+
+
+def make_cmd(rng, count):
+    plan = ['## Tasks', '| # | Task | Persona | Model | Depends On | Output |',
+            '|---|------|---------|-------|------------|--------|']
+    entries = [{'id': 1, 'role': 'decomposer', 'task': None, 'started': START,
+                'finished': START + timedelta(seconds=90), 'retries': 0, 'status': 'success'}]
+    finish = {}
+    for n in range(1, count + 1):
+        wave = (n - 1) // 10
+        deps = sorted(rng.sample(range(wave * 10 - 9, wave * 10 + 1), rng.randint(1, 3))) if wave else []
+        plan.append(f'| {n} | task {n} | worker_coder | sonnet | '
+                    f'{", ".join(map(str, deps)) or "-"} | `results/result_{n}.md` |')
+        ready = max((finish[d] for d in deps), default=START + timedelta(seconds=120))
+        started = ready + timedelta(seconds=rng.randint(0, 60))
+        if rng.random() < 0.1:  # failed first attempt, logged as its own entry
+            failed = started + timedelta(seconds=rng.randint(30, 300))
+            entries.append({'id': len(entries) + 1, 'role': 'worker_coder', 'task': f'task_{n}',
+                            'started': started, 'finished': failed, 'retries': 0,
+                            'status': 'failure'})
+            started = failed + timedelta(seconds=5)
+        finished = started + timedelta(seconds=rng.randint(60, 900))
+        open_entry = n > count - 3 and rng.random() < 0.5
+        entries.append({'id': len(entries) + 1, 'role': 'worker_coder', 'task': f'task_{n}',
+                        'started': started, 'finished': None if open_entry else finished,
+                        'retries': rng.choice([0, 0, 0, 1]), 'status': 'running' if open_entry else 'success'})
+        finish[n] = finished
+    log = {'cmd_id': 'cmd_999', 'started': START, 'status': 'running', 'tasks': entries}
+    return log, '\n'.join(plan) + '\n'
+
+
+def recount_curve(runs):
+    """Running entries recounted from scratch at every start/end time."""
+    times = sorted({t for r in runs if r.end > r.start for t in (r.start, r.end)})
+    curve = []
+    for time in times:
+        level = sum(1 for r in runs if r.end > r.start and r.start <= time < r.end)
+        if not curve or curve[-1][1] != level:
+            curve.append((time, level))
+    return curve
+
+
+def longest_path(tasks, durations):
+    """Exhaustive search: every chain ending at every task."""
+    def best(task):
+        deps = [best(d) for d in tasks[task].depends_on]
+        return durations.get(task, 0.0) + max(deps, default=0.0)
+    return max((best(t) for t in tasks), default=0.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--tasks', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    log, plan = make_cmd(random.Random(args.seed), args.tasks)
+    runs, _, _ = build_runs(log)
+    curve = concurrency_curve(runs)
+    assert curve == recount_curve(runs), 'concurrency curves differ'
+    report = analyze(log, plan, 10)
+
+    small_log, small_plan = make_cmd(random.Random(args.seed), 40)
+    small_runs, _, _ = build_runs(small_log)
+    durations = {run.task: run.duration for run in small_runs if run.task is not None}
+    expected = longest_path(parse_plan(small_plan)[0], durations)
+    assert abs(analyze(small_log, small_plan, 10)['critical_path']['length_sec'] - expected) < 1e-6, \
+        'critical path is not the longest chain'
+    print(f'equivalence: OK ({len(runs)} entries, {len(curve)} curve points, peak '
+          f'{report["concurrency"]["peak"]}; critical path checked on a 40-task cmd)')
+
+    t_recount = min(timeit.repeat(lambda: recount_curve(runs), number=1, repeat=args.repeat))
+    t_sweep = min(timeit.repeat(lambda: concurrency_curve(runs), number=1, repeat=args.repeat))
+    t_full = min(timeit.repeat(lambda: analyze(log, plan, 10), number=1, repeat=args.repeat))
+    print(f'{len(runs)} entries (best of {args.repeat}):')
+    print(f'  recount per change point   {t_recount * 1000:8.2f} ms')
+    print(f'  event sweep                {t_sweep * 1000:8.2f} ms  ({t_recount / t_sweep:.0f}x)')
+    print(f'  full analysis              {t_full * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
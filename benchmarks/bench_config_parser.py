@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_config_parser.py
+Parse time of merged cmd config snapshots (work/cmd_NNN/config.yaml): the
+stdlib-only parser in validate_config.py vs PyYAML.
+
+Usage: python3 benchmarks/bench_config_parser.py [--repeat N] [--snapshots N] [--seed N]
+
+Snapshots are written the way merge_config.py does (header comments, then
+yaml_io.dump of config.yaml with a local override): phase_instructions.*
+carry markdown with quotes, backslashes, tabs and non-ASCII text, which
+the dumper folds into multi-line quoted (several paragraphs) or plain
+(one long line) scalars. Random documents dumped at narrow widths, in
+single- and double-quoted style and in plain style, exercise line
+folding, empty lines and escaped line breaks.
+
+Before timing, every document is checked to parse to the same value with
+validate_config.parse_yaml_dict() as with yaml_io.loads(), as are a few
+fixed edge cases (single-pair mappings in flow sequences; a block
+sequence after a mapping value, which both must reject).
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'scripts'))
+
+import yaml  # noqa: E402
+import yaml_io  # noqa: E402
+from validate_config import YAMLSubsetError, parse_yaml_dict  # noqa: E402
+
+HEADER = '# Merged config: config.yaml + local/config.yaml\n# Generated at cmd start. Do not edit.\n'
+WORDS = ['Before', 'finalizing,', 'apply', 'review.', 'List', '2', 'failure', 'scenarios:',
+         "it's", '"could be"', '—', 'disprove', 'it.', '≥1', 'baseline', 'claim', 'C:\\tmp',
+         '#tag', 'key: value', '[x]', '{y}', '*bold*', '`code`', 'テスト', 'path/to/file']
+CHARS = 'ab cd  e\tf"\'\\#:-\n\n é漢\x85'
+EDGE_CASES = ['a: [b: 1]', 'a: [b: 1, c, d: ]', 'a: ["b": [1, 2], c: {d: e}]', 'a: [\n  b: 1,\n  c: 2\n]',
+              'a: [b:1]', 'a: x\n  - b', 'a: - b', 'a: -', 'x:\n  - a: - b', 'a: [[1]: 2]']
+
+
+def paragraph(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 40)))
+
+
+def instructions(rng):
+    blocks = []
+    for _ in range(rng.randint(1, 6)):
+        if rng.random() < 0.3:
+            blocks.append('\n'.join(f'- {paragraph(rng)}' for _ in range(rng.randint(1, 4))))
+        else:
+            blocks.append(paragraph(rng))
+    text = '\n\n'.join(blocks)
+    if rng.random() < 0.3:
+        text += '\n'
+    if rng.random() < 0.2:
+        text = '\t' + text + '  '
+    return text
+
+
+def make_snapshot(rng, base):
+    merged = dict(base)
+    merged['phase_instructions'] = {phase: instructions(rng) if rng.random() < 0.8 else ''
+                                    for phase in ('decompose', 'execute', 'aggregate', 'retrospect')}
+    merged['_merged_from'] = 'config.yaml + local/config.yaml'
+    return HEADER + yaml_io.dump(merged)
+
+
+def make_folded(rng):
+    if rng.random() < 0.5:
+        doc = {f'k{i}': ''.join(rng.choice(CHARS) for _ in range(rng.randint(0, 120))) for i in range(4)}
+        style = rng.choice('"\'')
+    else:
+        doc = {f'k{i}': paragraph(rng) for i in range(4)}
+        style = None
+    doc['nested'] = {'list': [doc['k0'], {'x': doc['k1']}]}
+    return yaml_io.dump(doc, width=rng.randint(10, 40), default_style=style)
+
+
+def multiline_styles(text):
+    """Styles ('quoted', 'plain') of the scalars in text that span lines."""
+    styles = set()
+    lines = text.splitlines()
+    for line, nxt in zip(lines, lines[1:] + ['']):
+        key, sep, value = line.partition(': ')
+        if not sep or not value:
+            continue
+        indent = len(line) - len(line.lstrip())
+        if value[0] in '\'"':
+            if len(value) == 1 or value[-1] != value[0] or value.endswith('\\' + value[0]):
+                styles.add('quoted')
+        elif nxt.strip() and len(nxt) - len(nxt.lstrip()) > indent:
+            styles.add('plain')
+    return styles
+
+
+def parse_or_error(parse, text):
+    try:
+        return parse(text)
+    except (YAMLSubsetError, yaml_io.YAMLError):
+        return 'error'
+
+
+def time_ms(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--snapshots', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with open(os.path.join(PROJECT_ROOT, 'config.yaml')) as f:
+        base = yaml_io.loads(f.read())
+    snapshots = [make_snapshot(rng, base) for _ in range(args.snapshots)]
+    folded = [make_folded(rng) for _ in range(args.snapshots * 5)]
+    for text in snapshots + folded:
+        assert parse_yaml_dict(text) == yaml_io.loads(text), f'parse differs:\n{text}'
+    for text in EDGE_CASES:
+        assert parse_or_error(parse_yaml_dict, text) == parse_or_error(yaml_io.loads, text), \
+            f'parse differs:\n{text}'
+    styles = [multiline_styles(text) for text in snapshots]
+    print(f'equivalence: OK ({len(snapshots)} snapshots: '
+          f'{sum("quoted" in s for s in styles)} with multi-line quoted, '
+          f'{sum("plain" in s for s in styles)} with multi-line plain instructions; '
+          f'{len(folded)} narrow-width documents, {len(EDGE_CASES)} edge cases)')
+
+    print(f'libyaml available: {yaml_io.has_libyaml()}')
+    print(f'parse all {len(snapshots)} snapshots (best of {args.repeat}):')
+    flows = [
+        ('yaml.safe_load (pure)', lambda: [yaml.load(t, Loader=yaml.SafeLoader) for t in snapshots]),
+        ('yaml_io.loads', lambda: [yaml_io.loads(t) for t in snapshots]),
+        ('parse_yaml_dict', lambda: [parse_yaml_dict(t) for t in snapshots]),
+    ]
+    for label, fn in flows:
+        print(f'  {label:<22} {time_ms(fn, args.repeat):8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
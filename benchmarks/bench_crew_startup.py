@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_crew_startup.py
+Wall-clock comparison of the single-process crew CLI (scripts/crew.py)
+against the previous one-interpreter-per-script flow.
+
+Usage: python3 benchmarks/bench_crew_startup.py [--repeat N]
+
+Runs in a throwaway copy of the project (scripts/, config.yaml, a
+local/config.yaml override) so work/ is never touched.
+
+Scenarios:
+  new-cmd  - previous new_cmd.sh (bash + error_codes.sh + python3
+             cmd_alloc.py + python3 merge_config.py) vs new_cmd.sh
+             (exec crew.py new-cmd) vs crew.py new-cmd
+  checks   - merge_config.py, validate_config.py, validate_exec_log.py and
+             validate_lp.py as four processes vs one crew.py chain
+
+Before timing, both flows are checked to produce the same output: same
+stdout and exit code, same cmd directory layout and config snapshot.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# new_cmd.sh before crew.py (allocation already on the locked counter)
+LEGACY_NEW_CMD = r'''#!/bin/bash
+set -euo pipefail
+cd "$(dirname "$0")/.." || exit 1
+
+source "$(dirname "$0")/error_codes.sh" 2>/dev/null || {
+  echo "ERROR: failed to load error_codes.sh" >&2
+  exit 1
+}
+
+CMD_NAME=$(python3 scripts/cmd_alloc.py work) || exit 1
+NEXT="${CMD_NAME#cmd_}"
+
+if ! mkdir -p "work/cmd_${NEXT}/tasks" 2>/dev/null; then
+  fatal E063 "work/cmd_${NEXT}/tasks"
+fi
+if ! mkdir -p "work/cmd_${NEXT}/results" 2>/dev/null; then
+  fatal E064 "work/cmd_${NEXT}/results"
+fi
+
+MERGE_EXIT=0
+python3 scripts/merge_config.py "work/cmd_${NEXT}" >/dev/null || MERGE_EXIT=$?
+if [[ $MERGE_EXIT -eq 1 ]]; then
+  error E024 "cmd_${NEXT}"
+  rm -rf "work/cmd_${NEXT}"
+  exit 1
+fi
+
+echo "cmd_${NEXT}"
+exit 0
+'''
+
+EXEC_LOG = '''cmd_id: cmd_001
+started: "2026-02-07 10:00:00"
+finished: "2026-02-07 10:20:00"
+status: success
+tasks:
+  - id: 1
+    role: decomposer
+    model: sonnet
+    started: "2026-02-07 10:00:00"
+    finished: "2026-02-07 10:02:00"
+    duration_sec: 120
+    status: success
+    retries: 0
+  - id: 2
+    role: worker_coder
+    model: sonnet
+    started: "2026-02-07 10:02:00"
+    finished: "2026-02-07 10:15:00"
+    duration_sec: 780
+    status: success
+    retries: 1
+'''
+
+LP_NAME = 'lp:defaults:typescript'
+LP_OBSERVATION = (
+    '[what] User prefers TypeScript strict mode for new modules '
+    '[evidence] Enabled strict in three consecutive cmds '
+    '[scope] New TypeScript projects '
+    '[action] Default to strict: true in tsconfig.json'
+)
+
+
+def make_project():
+    """Throwaway project copy. Returns its root."""
+    root = tempfile.mkdtemp(prefix='bench_crew_')
+    shutil.copytree(os.path.join(PROJECT_ROOT, 'scripts'), os.path.join(root, 'scripts'),
+                    ignore=shutil.ignore_patterns('__pycache__'))
+    shutil.copy(os.path.join(PROJECT_ROOT, 'config.yaml'), root)
+    os.makedirs(os.path.join(root, 'local'))
+    with open(os.path.join(root, 'local', 'config.yaml'), 'w') as f:
+        f.write('max_retries: 3\n')
+    with open(os.path.join(root, 'scripts', 'new_cmd_legacy.sh'), 'w') as f:
+        f.write(LEGACY_NEW_CMD)
+    os.makedirs(os.path.join(root, 'work'))
+    return root
+
+
+def run(argv, cwd):
+    proc = subprocess.run(argv, cwd=cwd, capture_output=True, text=True)
+    return proc.returncode, proc.stdout
+
+
+def run_flow(commands, cwd):
+    """Run commands in order. Returns (last non-zero exit code or 0, stdout)."""
+    code, out = 0, []
+    for argv in commands:
+        c, stdout = run(argv, cwd)
+        out.append(stdout)
+        code = c or code
+    return code, ''.join(out)
+
+
+def snapshot(root, name):
+    """(sorted entries, config.yaml bytes) of a cmd directory."""
+    cmd_dir = os.path.join(root, 'work', name)
+    with open(os.path.join(cmd_dir, 'config.yaml'), 'rb') as f:
+        return sorted(os.listdir(cmd_dir)), f.read()
+
+
+def check_new_cmd(root):
+    outputs = []
+    for argv in (['bash', 'scripts/new_cmd_legacy.sh'],
+                 ['bash', 'scripts/new_cmd.sh'],
+                 [sys.executable, 'scripts/crew.py', 'new-cmd']):
+        code, stdout = run(argv, root)
+        assert code == 0, (argv, code)
+        outputs.append(snapshot(root, stdout.strip()))
+    assert outputs[0] == outputs[1] == outputs[2], 'new-cmd results differ'
+
+
+def check_flows(root):
+    separate, chained = check_commands(root)
+    assert run_flow(separate, root) == run(chained, root), 'chain output differs'
+
+
+def check_commands(root):
+    name = run(['bash', 'scripts/new_cmd.sh'], root)[1].strip()
+    work_dir = f'work/{name}'
+    with open(os.path.join(root, work_dir, 'execution_log.yaml'), 'w') as f:
+        f.write(EXEC_LOG)
+    py = sys.executable
+    separate = [
+        [py, 'scripts/merge_config.py', work_dir],
+        [py, 'scripts/validate_config.py', f'{work_dir}/config.yaml'],
+        [py, 'scripts/validate_exec_log.py', f'{work_dir}/execution_log.yaml'],
+        [py, 'scripts/validate_lp.py', '--candidate', LP_NAME, LP_OBSERVATION],
+    ]
+    chained = [py, 'scripts/crew.py',
+               'merge', work_dir,
+               '+', 'validate-config', f'{work_dir}/config.yaml',
+               '+', 'validate-exec-log', f'{work_dir}/execution_log.yaml',
+               '+', 'validate-lp', '--candidate', LP_NAME, LP_OBSERVATION]
+    return separate, chained
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    root = make_project()
+    try:
+        check_new_cmd(root)
+        check_flows(root)
+        print('equivalence: OK')
+
+        print('new-cmd (best of %d):' % args.repeat)
+        for label, argv in (
+            ('previous new_cmd.sh', ['bash', 'scripts/new_cmd_legacy.sh']),
+            ('new_cmd.sh -> crew.py', ['bash', 'scripts/new_cmd.sh']),
+            ('crew.py new-cmd', [sys.executable, 'scripts/crew.py', 'new-cmd']),
+        ):
+            t = best_of(args.repeat, lambda: run(argv, root))
+            print(f'  {label:<24} {t * 1000:8.1f} ms')
+
+        separate, chained = check_commands(root)
+        print('checks: merge + validate-config + validate-exec-log + validate-lp (best of %d):'
+              % args.repeat)
+        t_sep = best_of(args.repeat, lambda: run_flow(separate, root))
+        t_chain = best_of(args.repeat, lambda: run(chained, root))
+        print(f'  {"4 processes":<24} {t_sep * 1000:8.1f} ms')
+        print(f'  {"crew.py chain":<24} {t_chain * 1000:8.1f} ms  ({t_sep / t_chain:.1f}x)')
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_deep_merge.py
+Compare copy-on-write deep_merge against the previous deepcopy-per-level
+implementation on large synthetic configs.
+
+Usage: python3 benchmarks/bench_deep_merge.py [--repeat N]
+
+Scenarios:
+  phase_instructions  - base with large phase_instructions text blocks,
+                        overlay touching one phase
+  team_overlays       - 5 layered team overlays over a wide/deep base
+"""
+
+import argparse
+import copy
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from merge_config import deep_merge  # noqa: E402
+
+
+def deep_merge_deepcopy(base, overlay):
+    """Previous implementation (deepcopy at every recursion level)."""
+    result = copy.deepcopy(base)
+    for key, value in overlay.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = deep_merge_deepcopy(result[key], value)
+        else:
+            result[key] = copy.deepcopy(value)
+    return result
+
+
+def make_tree(width, depth, leaf):
+    if depth == 0:
+        return leaf
+    return {f'k{i}': make_tree(width, depth - 1, leaf) for i in range(width)}
+
+
+def scenario_phase_instructions():
+    block = '\n'.join(f'- rule {i}: keep it short and specific' for i in range(400))
+    base = {
+        'version': '1.0',
+        'max_parallel': 10,
+        'retrospect': {'enabled': True, 'memory': {'max_candidates_per_cmd': 5}},
+        'phase_instructions': {
+            phase: {f'section_{i}': block for i in range(20)}
+            for phase in ('decompose', 'execute', 'aggregate', 'retrospect')
+        },
+        'lists': {f'l{i}': list(range(200)) for i in range(50)},
+    }
+    overlays = [{'phase_instructions': {'execute': {'section_3': 'overridden'}}}]
+    return base, overlays
+
+
+def scenario_team_overlays():
+    base = make_tree(8, 4, {'enabled': True, 'tags': ['a', 'b', 'c'], 'limit': 10})
+    overlays = [
+        {f'k{t}': {'k0': {'k1': {'k2': {'limit': t}}}}, 'k7': {f'k{t}': None}}
+        for t in range(5)
+    ]
+    return base, overlays
+
+
+def apply_layers(merge, base, overlays):
+    result = base
+    for overlay in overlays:
+        result = merge(result, overlay)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<20} {'deepcopy (ms)':>14} {'cow (ms)':>10} {'speedup':>8}")
+    for name, build in (('phase_instructions', scenario_phase_instructions),
+                        ('team_overlays', scenario_team_overlays)):
+        base, overlays = build()
+        snapshot = copy.deepcopy(base)
+
+        expected = apply_layers(deep_merge_deepcopy, base, overlays)
+        actual = apply_layers(deep_merge, base, overlays)
+        assert actual == expected, f'{name}: results differ'
+        assert base == snapshot, f'{name}: base was mutated'
+
+        old = min(timeit.repeat(lambda: apply_layers(deep_merge_deepcopy, base, overlays),
+                                number=1, repeat=args.repeat)) * 1000
+        new = min(timeit.repeat(lambda: apply_layers(deep_merge, base, overlays),
+                                number=1, repeat=args.repeat)) * 1000
+        print(f'{name:<20} {old:>14.2f} {new:>10.3f} {old / new:>7.0f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_exec_log_batch.py
+Auditing every cmd's execution log: one `validate_exec_log.py` process per
+log (the nightly loop) vs a single `--batch` run over the work root.
+
+Usage: python3 benchmarks/bench_exec_log_batch.py [--repeat N] [--cmds N] [--tasks N] [--jobs N] [--seed N]
+
+Generates a work root of cmd_NNN directories whose logs carry invalid
+statuses, orphaned tasks, long durations, excess retries and duplicate
+IDs; every 10th cmd has a merged config.json snapshot with looser limits.
+
+Before timing, --batch (with --jobs 1 and --jobs N) is checked to report,
+for every log, the same exit code and the same anomaly lines as the
+single-log run.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+SCRIPT = os.path.join(PROJECT_ROOT, 'scripts', 'validate_exec_log.py')
+STATUSES = ['success'] * 8 + ['failed', 'partial', 'bogus']
+
+
+def make_work_root(root, rng, cmds, tasks):
+    for n in range(1, cmds + 1):
+        cmd_dir = os.path.join(root, f'cmd_{n:03d}')
+        os.makedirs(cmd_dir)
+        lines = [f'cmd_id: cmd_{n:03d}', 'status: success',
+                 'started: "2026-02-07 10:00:00"', 'finished: "2026-02-07 12:00:00"', 'tasks:']
+        for t in range(1, tasks + 1):
+            finished = 'null' if rng.random() < 0.05 else '"2026-02-07 10:05:00"'
+            lines.extend([
+                f'  - id: {1 if rng.random() < 0.03 else t}',
+                '    role: worker_coder',
+                '    model: sonnet',
+                f'    status: {rng.choice(STATUSES)}',
+                '    started: "2026-02-07 10:02:00"',
+                f'    finished: {finished}',
+                f'    duration_sec: {rng.randint(10, 2400)}',
+                f'    retries: {rng.choice([0, 0, 0, 1, 2, 5])}',
+            ])
+        with open(os.path.join(cmd_dir, 'execution_log.yaml'), 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        if n % 10 == 0:
+            with open(os.path.join(cmd_dir, 'config.json'), 'w') as f:
+                json.dump({'_merged_from': 'base', 'max_cmd_duration_sec': 100000,
+                           'max_retries': 10}, f)
+
+
+def anomaly_line(anomaly):
+    """Line as the single-log report prints it."""
+    if anomaly.get('task') is not None:
+        return f"  [{anomaly['type']}] Task {anomaly['task']}: {anomaly['message']}"
+    return f"  [{anomaly['type']}] {anomaly['message']}"
+
+
+def per_process(paths):
+    results = {}
+    for path in paths:
+        proc = subprocess.run([sys.executable, SCRIPT, path], capture_output=True, text=True,
+                              cwd=PROJECT_ROOT)
+        lines = sorted(line for line in proc.stdout.splitlines() if line.startswith('  ['))
+        results[path] = (proc.returncode, lines)
+    return results
+
+
+def batch(root, jobs):
+    proc = subprocess.run([sys.executable, SCRIPT, '--batch', root, '--jobs', str(jobs),
+                           '--format', 'json'], capture_output=True, text=True, cwd=PROJECT_ROOT)
+    results = {}
+    for line in proc.stdout.splitlines():
+        record = json.loads(line)
+        if 'path' in record:
+            results[record['path']] = (record['exit_code'],
+                                       sorted(anomaly_line(a) for a in record['anomalies']))
+    return results
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cmds', type=int, default=100)
+    parser.add_argument('--tasks', type=int, default=10)
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='bench_exec_log_batch_')
+    try:
+        make_work_root(root, random.Random(args.seed), args.cmds, args.tasks)
+        paths = [os.path.join(root, f'cmd_{n:03d}', 'execution_log.yaml')
+                 for n in range(1, args.cmds + 1)]
+
+        expected = per_process(paths)
+        assert batch(root, 1) == expected, '--batch --jobs 1 differs from per-log runs'
+        assert batch(root, args.jobs) == expected, f'--batch --jobs {args.jobs} differs'
+        failing = sum(1 for code, _ in expected.values() if code)
+        anomalies = sum(len(lines) for _, lines in expected.values())
+        print(f'equivalence: OK ({len(paths)} logs, {failing} with anomalies, {anomalies} anomalies)')
+
+        t_loop = best_of(args.repeat, lambda: per_process(paths))
+        t_one = best_of(args.repeat, lambda: batch(root, 1))
+        t_jobs = best_of(args.repeat, lambda: batch(root, args.jobs))
+        print(f'{len(paths)} logs x {args.tasks} tasks (best of {args.repeat}):')
+        print(f'  one process per log     {t_loop:7.3f}s')
+        print(f'  --batch --jobs 1        {t_one:7.3f}s  ({t_loop / t_one:.1f}x)')
+        print(f'  --batch --jobs {args.jobs:<8} {t_jobs:7.3f}s  ({t_loop / t_jobs:.1f}x)')
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
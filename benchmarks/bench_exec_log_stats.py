@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_exec_log_stats.py
+Cross-cmd execution-log statistics in scripts/exec_log_stats.py: line
+scanner into TaskColumns vs parsing every log with yaml_io and keeping a
+dict per task.
+
+Usage: python3 benchmarks/bench_exec_log_stats.py [--repeat N] [--cmds N] [--tasks N] [--seed N]
+
+Logs follow the parent_guide.md layout (roles decomposer, worker_*,
+aggregator, retrospector; models haiku/sonnet/opus; some running tasks
+with null durations, retries and failures); every 20th log uses flow
+style, which the scanner hands to the YAML fallback. Some tasks carry a
+comment for a role (`role: # todo`, null) or a duration YAML 1.1 reads
+differently from float() (0x10, .inf, 017, 1:30, 1e3), which also go to
+the fallback.
+
+Before timing, both flows are checked to produce the same statistics
+(every group, every field). Peak memory is measured with tracemalloc.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import yaml_io  # noqa: E402
+from exec_log_stats import TaskColumns, group_stats  # noqa: E402
+from validate_exec_log import iter_exec_log_paths  # noqa: E402
+
+ROLES = ['decomposer', 'worker_coder', 'worker_researcher', 'worker_writer', 'aggregator',
+         'retrospector']
+MODELS = ['haiku', 'sonnet', 'sonnet', 'opus']
+STATUSES = ['success'] * 12 + ['failure', 'timeout', 'partial', 'running']
+YAML11_NUMBERS = ['0x10', '.inf', '-.inf', '.NaN', '017', '1:30', '1e3', '1.5e+3', '+12', '1_000']
+
+
+def write_log(path, rng, n, tasks, flow):
+    rows = []
+    for t in range(1, tasks + 1):
+        status = rng.choice(STATUSES)
+        duration = 'null' if status == 'running' else str(int(rng.lognormvariate(5, 0.8)))
+        if rng.random() < 0.002:
+            duration = rng.choice(YAML11_NUMBERS)
+        role = '# todo' if rng.random() < 0.005 else rng.choice(ROLES)
+        rows.append((t, role, rng.choice(MODELS), status, duration,
+                     rng.choice([0, 0, 0, 0, 1, 2])))
+    with open(path, 'w') as f:
+        f.write(f'cmd_id: cmd_{n:03d}\nstarted: "2026-02-07 10:00:00"\nfinished: null\n'
+                f'status: running\nbase_commit: "cfa49a0"\n\n')
+        if flow:
+            f.write('tasks: [' + ', '.join(
+                f'{{id: {t}, role: {"null" if r.startswith("#") else r}, model: {m}, '
+                f'status: {s}, duration_sec: {d}, retries: {x}}}'
+                for t, r, m, s, d, x in rows) + ']\n')
+            return
+        f.write('tasks:\n')
+        for t, role, model, status, duration, retries in rows:
+            f.write(f'  - id: {t}\n    role: {role}\n    task: task_{t}\n    model: {model}\n'
+                    f'    started: "2026-02-07 10:02:00"\n    finished: "2026-02-07 10:05:00"\n'
+                    f'    duration_sec: {duration}\n    status: {status}\n    error: null\n'
+                    f'    retries: {retries}\n    metadata_issues:\n'
+                    f'      - "quality missing, defaulted to YELLOW"\n')
+
+
+def columnar(root):
+    columns = TaskColumns()
+    for path in iter_exec_log_paths([root]):
+        columns.add_file(path)
+    return group_stats(columns), columns
+
+
+def dict_per_task(root):
+    """Full YAML parse of every log; task dicts kept, then loaded into columns."""
+    tasks = []
+    for path in iter_exec_log_paths([root]):
+        with open(path) as f:
+            document = yaml_io.loads(f.read())
+        tasks.extend(t for t in document.get('tasks') or [] if isinstance(t, dict))
+    columns = TaskColumns()
+    for task in tasks:
+        columns.append(task.get('role'), task.get('model'), task.get('duration_sec'),
+                       task.get('retries'), task.get('status'))
+    return group_stats(columns), tasks
+
+
+def peak_mib(fn, *args):
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cmds', type=int, default=500)
+    parser.add_argument('--tasks', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    root = tempfile.mkdtemp(prefix='bench_exec_log_stats_')
+    try:
+        for n in range(1, args.cmds + 1):
+            os.makedirs(os.path.join(root, f'cmd_{n:03d}'))
+            write_log(os.path.join(root, f'cmd_{n:03d}', 'execution_log.yaml'), rng, n,
+                      args.tasks, flow=n % 20 == 0)
+
+        stats, columns = columnar(root)
+        assert stats == dict_per_task(root)[0], 'statistics differ'
+        print(f'equivalence: OK ({columns.logs} logs, {len(columns)} tasks, '
+              f'{columns.fallbacks} via YAML fallback, {len(stats["role_model"])} role/model groups)')
+
+        t_yaml = min(timeit.repeat(lambda: dict_per_task(root), number=1, repeat=args.repeat))
+        t_cols = min(timeit.repeat(lambda: columnar(root), number=1, repeat=args.repeat))
+        m_yaml, m_cols = peak_mib(dict_per_task, root), peak_mib(columnar, root)
+        label = 'libyaml' if yaml_io.has_libyaml() else 'pure-Python'
+        print(f'{len(columns)} tasks (best of {args.repeat}):')
+        print(f'  yaml_io ({label}) + dicts  {t_yaml:7.3f}s  peak {m_yaml:6.1f} MiB')
+        print(f'  scanner + TaskColumns       {t_cols:7.3f}s  peak {m_cols:6.1f} MiB  '
+              f'({t_yaml / t_cols:.1f}x time, {m_yaml / m_cols:.1f}x memory)')
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_exec_log_watch.py
+Following a live execution log: `validate_exec_log.py --watch` re-checks
+only changed task entries vs re-validating the whole log on every change.
+
+Usage: python3 benchmarks/bench_exec_log_watch.py [--repeat N] [--tasks N] [--changes N] [--seed N]
+
+Simulates a cmd in progress: a log with --tasks entries (invalid statuses,
+orphaned tasks, long durations, excess retries, duplicate IDs) receives
+--changes edits, each a task update, an appended task, a removed task or a
+duplicated ID, as the parent session would write them.
+
+Before timing, after every edit the watcher's document (parsed entry by
+entry) is checked to equal a whole-file YAML parse, and its anomalies to
+be the same (as a multiset of code and message) as a full
+ExecutionLogValidator.validate() of the file.
+
+Timed: a one-task edit handled by a full validate() (parse and check
+everything) vs the watcher's refresh; the cost of a tick with no change
+(one stat); and the delay until an edit is noticed with inotify vs
+polling at the default interval.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), 'scripts'))
+
+import yaml_io  # noqa: E402
+from validate_exec_log import (  # noqa: E402
+    WATCH_INTERVAL_SEC, ExecutionLogValidator, ExecutionLogWatcher, _file_signature, _Inotify,
+)
+
+STATUSES = ['success'] * 6 + ['running', 'failed', 'partial', 'bogus']
+
+
+def make_task(rng, task_id):
+    finished = 'null' if rng.random() < 0.05 else '"2026-02-07 10:05:00"'
+    lines = [
+        f'  - id: {task_id}',
+        f'    role: {rng.choice(["worker_coder", "worker_researcher"])}',
+        '    model: sonnet',
+        f'    status: {rng.choice(STATUSES)}',
+        '    started: "2026-02-07 10:02:00"',
+        f'    finished: {finished}',
+        f'    duration_sec: {rng.randint(10, 2400)}',
+        f'    retries: {rng.choice([0, 0, 0, 1, 2, 5])}',
+    ]
+    if rng.random() < 0.1:
+        lines.extend(['    notes: |', '      first line', '', '      # not a comment'])
+    return lines
+
+
+def write_log(path, tasks, stamp):
+    lines = ['cmd_id: cmd_001', 'status: running', 'started: "2026-02-07 10:00:00"', 'tasks:']
+    for task in tasks:
+        lines.extend(task)
+    lines.extend(['# written by the parent session', 'finished: null'])
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    # Distinct mtime per edit even on coarse-timestamp filesystems
+    os.utime(path, ns=(stamp, stamp))
+
+
+def edit(rng, tasks, next_id):
+    """Apply one random edit in place; returns the next unused id."""
+    kind = rng.random()
+    if kind < 0.7:
+        index = rng.randrange(len(tasks))
+        task_id = tasks[index][0].split(': ', 1)[1]
+        tasks[index] = make_task(rng, task_id)
+    elif kind < 0.85:
+        tasks.append(make_task(rng, next_id))
+        next_id += 1
+    elif kind < 0.95:
+        del tasks[rng.randrange(len(tasks))]
+    else:
+        tasks[rng.randrange(len(tasks))][0] = f'  - id: {rng.randint(1, next_id - 1)}'
+    return next_id
+
+
+def full_anomalies(path):
+    validator = ExecutionLogValidator(path)
+    validator.validate()
+    return validator.anomalies
+
+
+def key(anomalies):
+    return Counter((a['type'], a['message']) for a in anomalies)
+
+
+class _Sink:
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def detection_delay(path, wait, stamp):
+    """Seconds from an edit (made 0.3 s into the wait loop) until wait() returns with it seen."""
+    signature = _file_signature(path)
+    written = []
+
+    def writer():
+        time.sleep(0.3)
+        written.append(time.perf_counter())
+        with open(path, 'a') as f:
+            f.write('# edit\n')
+        os.utime(path, ns=(stamp, stamp))
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while _file_signature(path) == signature:
+        wait()
+    seen = time.perf_counter()
+    thread.join()
+    return seen - written[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--tasks', type=int, default=400)
+    parser.add_argument('--changes', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    root = tempfile.mkdtemp(prefix='bench_exec_log_watch_')
+    path = os.path.join(root, 'execution_log.yaml')
+    stamp = time.time_ns()
+    try:
+        tasks = [make_task(rng, i) for i in range(1, args.tasks + 1)]
+        next_id = args.tasks + 1
+        write_log(path, tasks, stamp)
+        watcher = ExecutionLogWatcher(path, out=_Sink())
+        watcher.refresh()
+        assert key(watcher.anomalies()) == key(full_anomalies(path)), 'initial anomalies differ'
+        for n in range(1, args.changes + 1):
+            next_id = edit(rng, tasks, next_id)
+            write_log(path, tasks, stamp + n)
+            checks = watcher.revalidated
+            assert watcher.refresh(), f'edit {n} not detected'
+            assert key(watcher.anomalies()) == key(full_anomalies(path)), f'edit {n}: anomalies differ'
+            assert watcher.validator.exec_log == yaml_io.load(path), f'edit {n}: documents differ'
+            assert watcher.revalidated - checks <= 4, f'edit {n}: too many entries re-checked'
+        print(f'equivalence: OK ({args.changes} edits, {len(tasks)} tasks, '
+              f'{len(watcher.anomalies())} anomalies at the end)')
+
+        # Timed: the log alternates between two versions that differ in one task entry
+        with open(path) as f:
+            before = f.read()
+        tasks[0] = make_task(rng, 1)
+        write_log(path, tasks, stamp)
+        with open(path) as f:
+            after = f.read()
+        texts = [before, after]
+        rounds = args.repeat * 4
+        results = []
+        checks = watcher.revalidated
+        for label, check in (('full validate()', lambda: ExecutionLogValidator(path).validate()),
+                             ('watcher refresh', watcher.refresh)):
+            elapsed = 0.0
+            for i in range(rounds):
+                stamp += 1
+                with open(path, 'w') as f:
+                    f.write(texts[i % 2])
+                os.utime(path, ns=(stamp, stamp))
+                start = time.perf_counter()
+                check()
+                elapsed += time.perf_counter() - start
+            results.append((label, elapsed / rounds))
+        print(f'per one-task edit, {len(tasks)} tasks (mean of {rounds}):')
+        baseline = results[0][1]
+        for label, elapsed in results:
+            print(f'  {label:<19} {elapsed * 1000:8.2f} ms  ({baseline / elapsed:5.1f}x)')
+        print(f'  (entries re-checked per edit: watcher {(watcher.revalidated - checks) / rounds:.0f}, '
+              f'reporting new anomalies only; full {len(tasks)}, reporting all again)')
+
+        ticks = 10000
+        start = time.perf_counter()
+        for _ in range(ticks):
+            watcher.refresh()
+        print(f'  {"idle tick (no edit)":<19} {(time.perf_counter() - start) / ticks * 1e6:8.2f} us  '
+              f'(one stat; no YAML load)')
+
+        try:
+            notifier = _Inotify(root)
+        except OSError as e:
+            notifier = None
+            print(f'inotify unavailable ({e}); polling only')
+        delays = [('polling', lambda: time.sleep(WATCH_INTERVAL_SEC))]
+        if notifier is not None:
+            delays.insert(0, ('inotify', lambda: notifier.wait(WATCH_INTERVAL_SEC)))
+        print(f'edit -> noticed (interval {WATCH_INTERVAL_SEC:g} s):')
+        for label, wait in delays:
+            stamp += 1
+            print(f'  {label:<8} {detection_delay(path, wait, stamp) * 1000:8.1f} ms')
+        if notifier is not None:
+            notifier.close()
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_lp_cache.py
+Re-validation of an LP export with and without the verdict cache of
+scripts/validate_lp.py (--cache).
+
+Usage: python3 benchmarks/bench_lp_cache.py [--repeat N] [--entities N] [--changed F] [--seed N]
+
+Flows over the same JSON Lines export (in-process, output discarded):
+  no cache   - every entity validated
+  cold cache - empty cache file: validate and store every verdict, save
+  warm cache - cache from the previous export; --changed (default 0.05)
+               of the entities were edited since, so they miss
+
+Before timing, every flow is checked to yield the same (name, valid,
+errors) sequence, a run where every entity hits is checked to leave the
+cache file untouched, and a cache built under different rules is checked
+to start empty.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'scripts'))
+sys.path.insert(0, BENCH_DIR)
+
+import validate_lp  # noqa: E402
+from bench_lp_file import make_entity  # noqa: E402
+from validate_lp import LPValidationCache, iter_file_results  # noqa: E402
+
+
+def write_export(path, entities):
+    with open(path, 'w') as f:
+        for entity in entities:
+            f.write(json.dumps(entity) + '\n')
+
+
+def run(export, cache_path=None):
+    cache = LPValidationCache(cache_path) if cache_path else None
+    results = list(iter_file_results(export, 1, cache))
+    if cache is not None:
+        cache.save()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--entities', type=int, default=20000)
+    parser.add_argument('--changed', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    before = [make_entity(rng, i) for i in range(args.entities)]
+    after = [dict(e, observations=e['observations'] + ['[what] edited'])
+             if rng.random() < args.changed else e for e in before]
+    edited = sum(1 for a, b in zip(before, after) if a is not b)
+
+    directory = tempfile.mkdtemp(prefix='bench_lp_cache_')
+    try:
+        previous_export = os.path.join(directory, 'before.jsonl')
+        export = os.path.join(directory, 'after.jsonl')
+        cache_path = os.path.join(directory, 'lp_cache.json')
+        warm_copy = os.path.join(directory, 'lp_cache.warm.json')
+        write_export(previous_export, before)
+        write_export(export, after)
+
+        expected = run(export)
+        assert run(export, cache_path) == expected, 'cold cache differs'
+        written = os.stat(cache_path)
+        assert run(export, cache_path) == expected, 'fully warm cache differs'
+        unchanged = os.stat(cache_path)
+        assert (unchanged.st_ino, unchanged.st_mtime_ns) == (written.st_ino, written.st_mtime_ns), \
+            'fully warm run rewrote the cache file'
+        os.remove(cache_path)
+        run(previous_export, cache_path)
+        shutil.copyfile(cache_path, warm_copy)
+        assert run(export, cache_path) == expected, 'partially warm cache differs'
+        validate_lp.MAX_OBSERVATION_LENGTH += 1
+        assert not LPValidationCache(cache_path).entries, 'cache survived a rules change'
+        validate_lp.MAX_OBSERVATION_LENGTH -= 1
+        print(f'equivalence: OK ({len(expected)} entities, {edited} edited since the cached run)')
+
+        def cold():
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            run(export, cache_path)
+
+        def warm():
+            shutil.copyfile(warm_copy, cache_path)
+            run(export, cache_path)
+
+        n = len(expected)
+        t_none = min(timeit.repeat(lambda: run(export), number=1, repeat=args.repeat))
+        t_cold = min(timeit.repeat(cold, number=1, repeat=args.repeat))
+        t_warm = min(timeit.repeat(warm, number=1, repeat=args.repeat))
+        print(f'--file, {n} entities (best of {args.repeat}):')
+        print(f'  no cache     {t_none:7.3f}s  {n / t_none:9,.0f} entities/s')
+        print(f'  cold cache   {t_cold:7.3f}s  {n / t_cold:9,.0f} entities/s')
+        print(f'  warm cache   {t_warm:7.3f}s  {n / t_warm:9,.0f} entities/s  '
+              f'({t_none / t_warm:.1f}x, {edited} edited)')
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
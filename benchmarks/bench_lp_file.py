@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_lp_file.py
+Wall-clock time and peak memory of `validate_lp.py --file` on a large LP
+export: previous json.load() of the whole file vs the streamed reader.
+
+Usage: python3 benchmarks/bench_lp_file.py [--repeat N] [--entities N] [--jobs N] [--seed N]
+
+Writes the export as a JSON array and as JSON Lines to a temporary
+directory. Each run is a fresh interpreter; peak memory is its maximum RSS
+(pool workers included). Linux only (/proc/self/status).
+
+Before timing, every flow (previous, streamed array, streamed JSON Lines,
+--jobs N) is checked to print the same stdout and stderr with the same exit
+code. A copy of each export with a corrupt entity near the start is
+checked to fail with the json module's message and position after reading
+at most two chunks of the file; its run is reported alongside.
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(BENCH_DIR, '..', 'scripts', 'validate_lp.py')
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.dirname(SCRIPT))
+
+from bench_lp_keywords import make_observation  # noqa: E402
+from validate_lp import JSON_READ_CHUNK, _JSONStream  # noqa: E402
+
+# validate_from_file before streaming: whole file through json.load()
+LEGACY_RUNNER = r'''
+import json, sys
+sys.path.insert(0, sys.argv[1])
+from validate_lp import validate_lp_entity
+
+with open(sys.argv[2], 'r') as f:
+    data = json.load(f)
+entities = data if isinstance(data, list) else [data]
+total_valid = total_invalid = 0
+for entity in entities:
+    if not isinstance(entity, dict):
+        print(f"✗ INVALID: Entity is not a JSON object", file=sys.stderr)
+        total_invalid += 1
+        continue
+    name = entity.get("name", "<unnamed>")
+    valid, errors = validate_lp_entity(entity)
+    if valid:
+        print(f"✓ VALID: {name}")
+        total_valid += 1
+    else:
+        print(f"✗ INVALID: {name}", file=sys.stderr)
+        for error in errors:
+            print(f"  - {error}", file=sys.stderr)
+        total_invalid += 1
+print(f"\n=== SUMMARY ===")
+print(f"Valid: {total_valid}, Invalid: {total_invalid}")
+sys.exit(0 if total_invalid == 0 else 1)
+'''
+
+# Runs argv[1:] as a script, then reports max RSS (KiB) of itself + children.
+# VmHWM, not RUSAGE_SELF: ru_maxrss survives exec and would include the
+# RSS of this (large) benchmark process at fork time.
+MEASURE = r'''
+import resource, runpy, sys
+sys.argv = sys.argv[1:]
+try:
+    runpy.run_path(sys.argv[0], run_name='__main__')
+    code = 0
+except SystemExit as e:
+    code = e.code
+sys.stdout.flush()
+with open('/proc/self/status') as f:
+    hwm = next(int(line.split()[1]) for line in f if line.startswith('VmHWM:'))
+rss = max(hwm, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+sys.stderr.write(f'\nMAXRSS {rss}\n')
+sys.exit(code)
+'''
+
+NAMES = ['lp:defaults:typescript', 'lp:avoid:global_state', 'lp:_internal:retry_budget',
+         'lp:judgment:speed_over_polish', 'defaults:missing_prefix']
+
+
+def make_entity(rng, i):
+    name = f'{rng.choice(NAMES)}_{i}'
+    entity_type = 'lp_internal' if name.startswith('lp:_internal:') else 'learned_preference'
+    return {'name': name, 'entityType': entity_type,
+            'observations': [make_observation(rng) for _ in range(rng.randint(1, 3))]}
+
+
+def write_exports(directory, count, seed):
+    rng = random.Random(seed)
+    array_path = os.path.join(directory, 'lp_export.json')
+    lines_path = os.path.join(directory, 'lp_export.jsonl')
+    with open(array_path, 'w') as fa, open(lines_path, 'w') as fl:
+        fa.write('[\n')
+        for i in range(count):
+            line = json.dumps(make_entity(rng, i))
+            fa.write(('' if i == 0 else ',\n') + line)
+            fl.write(line + '\n')
+        fa.write('\n]\n')
+    return array_path, lines_path
+
+
+def write_corrupt(path, entity=10):
+    """Copy of the export at path with entity N's name value replaced by a bare word."""
+    with open(path) as f:
+        text = f.read()
+    start = 0
+    for _ in range(entity + 1):
+        start = text.index('"name": ', start) + len('"name": ')
+    corrupt = path.replace('lp_export', 'lp_export_corrupt')
+    with open(corrupt, 'w') as f:
+        f.write(text[:start] + 'corrupt' + text[text.index(',', start):])
+    return corrupt, f'Expecting value: char {start}'
+
+
+def read_until_error(path):
+    """(error message, characters read) of streaming path to its first malformed value."""
+    with open(path) as f:
+        stream = _JSONStream(f)
+        if stream.peek() == '[':
+            stream.pos += 1
+        try:
+            while stream.peek() not in ('', ']'):
+                stream.decode()
+                if stream.peek() == ',':
+                    stream.pos += 1
+        except ValueError as e:
+            return str(e), stream.consumed + len(stream.buf)
+    return None, stream.consumed + len(stream.buf)
+
+
+def run(argv):
+    """(exit code, stdout, stderr, seconds, max RSS MiB)"""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-c', MEASURE] + argv,
+                          capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    stderr, _, rss = proc.stderr.rpartition('\nMAXRSS ')
+    return proc.returncode, proc.stdout, stderr, elapsed, int(rss) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--entities', type=int, default=200000)
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='bench_lp_file_')
+    try:
+        array_path, lines_path = write_exports(directory, args.entities, args.seed)
+        legacy = os.path.join(directory, 'legacy_validate_from_file.py')
+        with open(legacy, 'w') as f:
+            f.write(LEGACY_RUNNER)
+        scripts_dir = os.path.dirname(SCRIPT)
+
+        flows = [
+            ('json.load (previous)', [legacy, scripts_dir, array_path]),
+            ('streamed array', [SCRIPT, '--file', array_path]),
+            ('streamed JSON Lines', [SCRIPT, '--file', lines_path]),
+            (f'streamed --jobs {args.jobs}', [SCRIPT, '--file', lines_path, '--jobs', str(args.jobs)]),
+        ]
+
+        reference = run(flows[0][1])[:3]
+        for label, argv in flows[1:]:
+            assert run(argv)[:3] == reference, f'{label}: output differs'
+        print(f'equivalence: OK ({reference[1].splitlines()[-1]})')
+
+        corrupt = []
+        for path in (array_path, lines_path):
+            corrupt_path, message = write_corrupt(path)
+            error, read = read_until_error(corrupt_path)
+            assert error == message, f'{corrupt_path}: {error!r}, expected {message!r}'
+            assert read <= 2 * JSON_READ_CHUNK, f'{corrupt_path}: read {read} characters'
+            code, _, stderr, _, _ = run([SCRIPT, '--file', corrupt_path])
+            assert code == 1 and f'Invalid JSON in file: {message}' in stderr, stderr
+            corrupt.append(corrupt_path)
+        print(f'corrupt entity near the start: OK (stops after <= {2 * JSON_READ_CHUNK} characters)')
+
+        size = os.path.getsize(array_path) / 2**20
+        print(f'--file, {args.entities} entities, {size:.0f} MiB array (best of {args.repeat}):')
+        for label, argv in flows:
+            runs = [run(argv) for _ in range(args.repeat)]
+            t = min(r[3] for r in runs)
+            rss = max(r[4] for r in runs)
+            print(f'  {label:<24} {t:7.2f}s  {args.entities / t:9,.0f} entities/s  '
+                  f'peak RSS {rss:7.1f} MiB')
+        for label, path in zip(('corrupt array', 'corrupt JSON Lines'), corrupt):
+            runs = [run([SCRIPT, '--file', path]) for _ in range(args.repeat)]
+            print(f'  {label:<24} {min(r[3] for r in runs):7.2f}s  {"(exit 1)":>20}  '
+                  f'peak RSS {max(r[4] for r in runs):7.1f} MiB')
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_lp_keywords.py
+Throughput of the LP privacy/quality keyword scans in scripts/validate_lp.py:
+compiled keyword automaton (one scan per section) vs the previous loop of
+one substring search per keyword.
+
+Usage: python3 benchmarks/bench_lp_keywords.py [--repeat N] [--observations N] [--seed N]
+
+Before timing, on every generated observation:
+  - finditer() positions equal a brute-force str.find() over each keyword
+    (whole-word rule applied to keywords of <= WHOLE_WORD_MAX_LEN chars)
+  - validate_privacy_safeguards / validate_quality_guardrails equal the
+    previous loops with the same whole-word rule; the number of previous
+    results that were only substring hits ('iq' in 'unique') is reported
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from validate_lp import (  # noqa: E402
+    IDENTITY_KEYWORDS,
+    PRIVACY_AUTOMATON,
+    PRIVACY_FORBIDDEN_KEYWORDS,
+    QUALITY_AUTOMATON,
+    QUALITY_FORBIDDEN_ACTIONS,
+    WHOLE_WORD_MAX_LEN,
+    validate_privacy_safeguards,
+    validate_quality_guardrails,
+)
+
+FILLER = (
+    'prefers typescript strict mode for new modules enabled in three consecutive '
+    'cmds default tsconfig json run the linter before commit review code unique '
+    'frequent requests equal economy sequence liquid antique mystery'
+).split()
+PLANTED = PRIVACY_FORBIDDEN_KEYWORDS + QUALITY_FORBIDDEN_ACTIONS + IDENTITY_KEYWORDS
+
+
+def make_observation(rng):
+    """[what]/[evidence]/[scope]/[action] text; ~1 in 5 contains a keyword."""
+    def words(n):
+        out = [rng.choice(FILLER) for _ in range(n)]
+        if rng.random() < 0.07:
+            out.insert(rng.randrange(len(out) + 1), rng.choice(PLANTED))
+        return ' '.join(out)
+    return (f'[what] User {words(10)} [evidence] {words(12)} '
+            f'[scope] {words(6)} [action] {words(10)}')
+
+
+# --- previous implementation (one substring search per keyword) ---
+
+def legacy_privacy(observation, whole_word=False):
+    violations = []
+    observation_lower = observation.lower()
+    for keyword in PRIVACY_FORBIDDEN_KEYWORDS:
+        if contains(observation_lower, keyword.lower(), whole_word):
+            violations.append(f"Privacy violation: contains forbidden keyword '{keyword}'")
+    scope_match = re.search(r'\[scope\]\s*([^\[]+)', observation)
+    if scope_match:
+        scope_content = scope_match.group(1).strip().lower()
+        for keyword in IDENTITY_KEYWORDS:
+            if contains(scope_content, keyword, whole_word):
+                violations.append(f"Privacy violation: scope references personal identity ('{keyword}')")
+    return len(violations) == 0, violations
+
+
+def legacy_quality(observation, whole_word=False):
+    violations = []
+    action_match = re.search(r'\[action\]\s*(.+)', observation)
+    if not action_match:
+        return True, []
+    action_content = action_match.group(1).strip().lower()
+    for pattern in QUALITY_FORBIDDEN_ACTIONS:
+        if contains(action_content, pattern.lower(), whole_word):
+            violations.append(f"Quality violation: action contains forbidden pattern '{pattern}'")
+    return len(violations) == 0, violations
+
+
+def contains(text, keyword, whole_word):
+    if whole_word and len(keyword) <= WHOLE_WORD_MAX_LEN:
+        return re.search(rf'(?<!\w){re.escape(keyword)}(?!\w)', text) is not None
+    return keyword in text
+
+
+def brute_force_positions(keywords, text):
+    hits = []
+    for keyword in keywords:
+        start = text.find(keyword)
+        while start != -1:
+            end = start + len(keyword)
+            if len(keyword) > WHOLE_WORD_MAX_LEN or (
+                    not re.match(r'\w', text[start - 1:start] or ' ')
+                    and not re.match(r'\w', text[end:end + 1] or ' ')):
+                hits.append((start, end, keyword))
+            start = text.find(keyword, start + 1)
+    return sorted(hits)
+
+
+def check(observations):
+    substring_only = 0
+    for obs in observations:
+        lower = obs.lower()
+        assert list(PRIVACY_AUTOMATON.finditer(lower)) == \
+            brute_force_positions(PRIVACY_AUTOMATON.keywords, lower), obs
+        assert list(QUALITY_AUTOMATON.finditer(lower)) == \
+            brute_force_positions(QUALITY_AUTOMATON.keywords, lower), obs
+        assert validate_privacy_safeguards(obs) == legacy_privacy(obs, whole_word=True), obs
+        assert validate_quality_guardrails(obs) == legacy_quality(obs, whole_word=True), obs
+        if legacy_privacy(obs) != legacy_privacy(obs, whole_word=True):
+            substring_only += 1
+    return substring_only
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--observations', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    observations = [make_observation(rng) for _ in range(args.observations)]
+
+    substring_only = check(observations)
+    flagged = sum(1 for o in observations
+                  if not (validate_privacy_safeguards(o)[0] and validate_quality_guardrails(o)[0]))
+    print(f'equivalence: OK ({flagged} of {len(observations)} observations flagged; '
+          f'{substring_only} previously flagged only for short keywords inside words)')
+
+    def run_legacy():
+        for o in observations:
+            legacy_privacy(o)
+            legacy_quality(o)
+
+    def run_automaton():
+        for o in observations:
+            validate_privacy_safeguards(o)
+            validate_quality_guardrails(o)
+
+    n = len(observations)
+    t_legacy = min(timeit.repeat(run_legacy, number=1, repeat=args.repeat))
+    t_auto = min(timeit.repeat(run_automaton, number=1, repeat=args.repeat))
+    print(f'privacy + quality scans, {n} observations (best of {args.repeat}):')
+    print(f'  keyword loop   {t_legacy:7.3f}s  {n / t_legacy:10,.0f} obs/s')
+    print(f'  automaton      {t_auto:7.3f}s  {n / t_auto:10,.0f} obs/s  ({t_legacy / t_auto:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_lp_serve.py
+Per-candidate latency of LP candidate checks: one `validate_lp.py
+--candidate` process per call vs the long-lived server modes.
+
+Usage: python3 benchmarks/bench_lp_serve.py [--repeat N] [--candidates N] [--seed N]
+
+Flows (same candidates, ~1 in 4 invalid):
+  process per call  - python3 scripts/validate_lp.py --candidate NAME OBS
+  --serve           - one co-process; one request line, wait for the verdict
+  --serve batch     - one {"candidates": [...]} request for all of them
+  --socket          - one Unix socket connection; request/verdict round trips
+
+Before timing, every flow is checked to return the same verdict (valid and
+error list) for every candidate; process-per-call verdicts are read from
+the exit code and the "  - " error lines on stderr.
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(BENCH_DIR, '..', 'scripts', 'validate_lp.py')
+sys.path.insert(0, BENCH_DIR)
+
+from bench_lp_keywords import make_observation  # noqa: E402
+
+NAMES = ['lp:defaults:typescript', 'lp:avoid:global_state', 'lp:judgment:speed_over_polish',
+         'defaults:missing_prefix']
+
+
+def make_candidates(rng, count):
+    return [(f'{rng.choice(NAMES)}_{i}', make_observation(rng)) for i in range(count)]
+
+
+def process_per_call(candidates):
+    verdicts = []
+    for name, observation in candidates:
+        proc = subprocess.run([sys.executable, SCRIPT, '--candidate', name, observation],
+                              capture_output=True, text=True)
+        errors = [line[4:] for line in proc.stderr.splitlines() if line.startswith('  - ')]
+        verdicts.append((proc.returncode == 0, errors))
+    return verdicts
+
+
+class CoProcess:
+    def __init__(self):
+        self.proc = subprocess.Popen([sys.executable, SCRIPT, '--serve'], stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE, text=True, bufsize=1)
+
+    def request(self, payload):
+        self.proc.stdin.write(json.dumps(payload) + '\n')
+        self.proc.stdin.flush()
+        return json.loads(self.proc.stdout.readline())
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+class SocketServer:
+    def __init__(self, path):
+        self.path = path
+        self.proc = subprocess.Popen([sys.executable, SCRIPT, '--socket', path])
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.sock.connect(path)
+                break
+            except OSError:
+                self.sock.close()
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.01)
+        self.reader = self.sock.makefile('r', encoding='utf-8')
+
+    def request(self, payload):
+        self.sock.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+        return json.loads(self.reader.readline())
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+        self.proc.terminate()
+        self.proc.wait()
+
+
+def one_by_one(server, candidates):
+    verdicts = []
+    for name, observation in candidates:
+        response = server.request({'name': name, 'observation': observation})
+        verdicts.append((response['valid'], response['errors']))
+    return verdicts
+
+
+def batch(server, candidates):
+    response = server.request({'candidates': [{'name': n, 'observation': o} for n, o in candidates]})
+    return [(r['valid'], r['errors']) for r in response['results']]
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--candidates', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    candidates = make_candidates(random.Random(args.seed), args.candidates)
+    socket_path = os.path.join(tempfile.mkdtemp(prefix='bench_lp_serve_'), 'validate_lp.sock')
+
+    t_start = time.perf_counter()
+    co = CoProcess()
+    co.request({'name': 'lp:defaults:warmup', 'observation': ''})
+    t_co_start = time.perf_counter() - t_start
+    sock = SocketServer(socket_path)
+    try:
+        expected = process_per_call(candidates)
+        assert one_by_one(co, candidates) == expected, '--serve verdicts differ'
+        assert batch(co, candidates) == expected, '--serve batch verdicts differ'
+        assert one_by_one(sock, candidates) == expected, '--socket verdicts differ'
+        invalid = sum(1 for valid, _ in expected if not valid)
+        print(f'equivalence: OK ({len(expected)} candidates, {invalid} invalid)')
+
+        n = len(candidates)
+        flows = [
+            ('process per call', lambda: process_per_call(candidates)),
+            ('--serve', lambda: one_by_one(co, candidates)),
+            ('--serve batch', lambda: batch(co, candidates)),
+            ('--socket', lambda: one_by_one(sock, candidates)),
+        ]
+        print(f'per-candidate latency, {n} candidates (best of {args.repeat}):')
+        baseline = None
+        for label, fn in flows:
+            per_call = best_of(args.repeat, fn) / n
+            baseline = baseline or per_call
+            print(f'  {label:<18} {per_call * 1000:8.3f} ms  ({baseline / per_call:6.1f}x)')
+        print(f'  (co-process start-up, paid once: {t_co_start * 1000:.1f} ms)')
+    finally:
+        co.close()
+        sock.close()
+        os.rmdir(os.path.dirname(socket_path))
+
+
+if __name__ == '__main__':
+    main()
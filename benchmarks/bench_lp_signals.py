@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_lp_signals.py
+Signal-log candidate scan in scripts/lp_signals.py: one streaming pass into
+SignalAccumulator vs loading the export and grouping every observation per
+topic, and the size of the log before and after --rollup.
+
+Usage: python3 benchmarks/bench_lp_signals.py [--repeat N] [--topics N] [--updates N] [--seed N]
+
+Generates a signal log in which each of --topics topics was updated up
+to --updates times without the older observations being deleted (the
+growth --rollup removes), plus unrelated LP entities.
+
+Before timing, both flows are checked to produce the same candidates
+(priority, counter, topic) with and without decay, and the rolled-up log
+is checked to produce them again. Peak memory is measured with tracemalloc.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from lp_signals import (  # noqa: E402
+    CANDIDATE_THRESHOLD, HIGH_PRIORITY_THRESHOLD, SIGNAL_LOG_NAME, SignalAccumulator,
+    parse_fields,
+)
+from validate_lp import ALLOWED_CLUSTERS, iter_json_entities  # noqa: E402
+
+CLUSTERS = sorted(ALLOWED_CLUSTERS)
+SIGNALS = [('course_correction', 1.0), ('afterthought', 0.7), ('rejection', 1.0), ('repeated_spec', 0.7)]
+TODAY = date(2026, 3, 1)
+
+
+def make_export(rng, topics, updates):
+    observations = []
+    for t in range(topics):
+        topic = f'{rng.choice(CLUSTERS)}:topic_{t}'
+        count = rng.randint(1, updates)
+        day = TODAY - timedelta(days=2 * count + rng.randint(0, 60))
+        counter, history, first = 0.0, [], None
+        for u in range(count):
+            kind, weight = rng.choice(SIGNALS)
+            counter = max(0.0, counter + (weight if rng.random() < 0.97 else -1.0) * 0.1)
+            first = first or day
+            history.append(f'{kind}({day.isoformat()})')
+            observations.append(
+                f'[topic] {topic} [counter] {counter:.1f} [last_updated] {day.isoformat()} '
+                f'[signals] {", ".join(history)} [sessions] {u + 1} [first_signal] {first.isoformat()}')
+            day += timedelta(days=rng.randint(1, 3))
+    rng.shuffle(observations)  # stale states interleaved with the latest ones
+    entities = [{'name': f'lp:defaults:pref_{i}', 'entityType': 'learned_preference',
+                 'observations': ['[what] x [evidence] y [scope] z [action] w']} for i in range(500)]
+    entities.append({'name': SIGNAL_LOG_NAME, 'entityType': 'lp_internal', 'observations': observations})
+    return entities
+
+
+def accumulate(path, half_life):
+    accumulator = SignalAccumulator(TODAY, half_life)
+    for entity in iter_json_entities(path):
+        accumulator.add_entity(entity)
+    return [(p, round(c, 6), s.topic) for p, c, s in accumulator.candidates()]
+
+
+def naive(path, half_life):
+    """Load everything, group all observations per topic, keep the latest."""
+    with open(path) as f:
+        entities = json.load(f)
+    by_topic = {}
+    for entity in entities:
+        if entity['name'] != SIGNAL_LOG_NAME:
+            continue
+        for observation in entity['observations']:
+            fields = parse_fields(observation)
+            by_topic.setdefault(fields['topic'], []).append(fields)
+    ranked = []
+    for topic, states in by_topic.items():
+        latest = max(states, key=lambda f: f['last_updated'])
+        counter = float(latest['counter'])
+        if half_life > 0:
+            age = (TODAY - date.fromisoformat(latest['last_updated'])).days
+            counter *= 0.5 ** (max(age, 0) / half_life)
+        if counter >= CANDIDATE_THRESHOLD:
+            priority = 'HIGH' if counter >= HIGH_PRIORITY_THRESHOLD else 'MEDIUM'
+            ranked.append((priority, round(counter, 6), topic))
+    ranked.sort(key=lambda c: (c[0] != 'HIGH', -c[1], c[2]))
+    return ranked
+
+
+def peak_mib(fn, path):
+    tracemalloc.start()
+    fn(path, 90.0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--topics', type=int, default=300)
+    parser.add_argument('--updates', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='bench_lp_signals_')
+    try:
+        export = os.path.join(directory, 'lp_export.json')
+        rolled = os.path.join(directory, 'signal_log.json')
+        with open(export, 'w') as f:
+            json.dump(make_export(random.Random(args.seed), args.topics, args.updates), f)
+
+        for half_life in (0.0, 90.0):
+            expected = naive(export, half_life)
+            assert accumulate(export, half_life) == expected, f'candidates differ (half-life {half_life})'
+        accumulator = SignalAccumulator(TODAY, 0.0)
+        for entity in iter_json_entities(export):
+            accumulator.add_entity(entity)
+        with open(rolled, 'w') as f:
+            json.dump({'name': SIGNAL_LOG_NAME, 'entityType': 'lp_internal',
+                       'observations': accumulator.rollup()}, f)
+        undecayed = naive(export, 0.0)
+        assert accumulate(rolled, 0.0) == undecayed, 'rolled-up log changes the candidates'
+        print(f'equivalence: OK ({len(expected)} candidates with 90-day half-life, '
+              f'{len(undecayed)} without)')
+
+        n_obs = accumulator.observations
+        t_naive = min(timeit.repeat(lambda: naive(export, 90.0), number=1, repeat=args.repeat))
+        t_acc = min(timeit.repeat(lambda: accumulate(export, 90.0), number=1, repeat=args.repeat))
+        before, after = os.path.getsize(export), os.path.getsize(rolled)
+        print(f'{n_obs} signal-log observations, {args.topics} topics (best of {args.repeat}):')
+        m_naive, m_acc = peak_mib(naive, export), peak_mib(accumulate, export)
+        print(f'  load + group per topic   {t_naive:7.3f}s  peak {m_naive:6.1f} MiB')
+        print(f'  SignalAccumulator        {t_acc:7.3f}s  peak {m_acc:6.1f} MiB  '
+              f'({t_naive / t_acc:.1f}x time, {m_naive / m_acc:.1f}x memory)')
+        print(f'  --rollup: {n_obs} -> {len(accumulator.rollup())} observations, '
+              f'export {before / 1024:,.0f} KiB -> signal log {after / 1024:,.0f} KiB')
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_lp_similarity.py
+Near-duplicate LP search in scripts/lp_similarity.py: MinHash/LSH index vs
+exact Jaccard over every pair of observations.
+
+Usage: python3 benchmarks/bench_lp_similarity.py [--repeat N] [--entities N] [--seed N]
+
+Generates entities across the six clusters; about 1 in 10 is a reworded
+copy of an earlier one (some moved to another cluster).
+
+Before timing:
+  - every LSH pair is an all-pairs pair with the same similarity (LSH only
+    prunes comparisons, it never invents a match)
+  - recall against all pairs is reported, and must be 100% for pairs at
+    least 0.1 above the threshold
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from lp_similarity import DEFAULT_THRESHOLD, SimilarityIndex, jaccard  # noqa: E402
+from validate_lp import ALLOWED_CLUSTERS  # noqa: E402
+
+CLUSTERS = sorted(ALLOWED_CLUSTERS)
+VOCABULARY = (
+    'typescript strict mode modules tsconfig linter commit review tests coverage '
+    'summary bullets report short verbose docs readme changelog migration schema '
+    'retry timeout cache index batch stream parallel worker queue deploy staging '
+    'rollback feature flag naming camelcase snake_case imports formatting prettier '
+    'eslint mypy pytest fixture mock integration e2e latency memory logging metrics'
+).split()
+
+
+def sentence(rng, n):
+    return ' '.join(rng.choice(VOCABULARY) for _ in range(n))
+
+
+def reword(rng, text):
+    words = text.split()
+    for _ in range(rng.randint(1, 2)):
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    return ' '.join(words)
+
+
+def make_entities(rng, count):
+    entities = []
+    for i in range(count):
+        if entities and rng.random() < 0.1:
+            original = rng.choice(entities)
+            what, action = original[2]
+            cluster = original[1] if rng.random() < 0.7 else rng.choice(CLUSTERS)
+            parts = (reword(rng, what), reword(rng, action))
+        else:
+            cluster = rng.choice(CLUSTERS)
+            parts = (sentence(rng, 12), sentence(rng, 10))
+        name = f'lp:{cluster}:topic_{i}'
+        observation = (f'[what] {parts[0]} [evidence] seen in {rng.randint(2, 9)} cmds '
+                       f'[scope] {sentence(rng, 3)} [action] {parts[1]}')
+        entities.append((name, cluster, parts, observation))
+    return [{'name': name, 'entityType': 'learned_preference', 'observations': [obs]}
+            for name, _, _, obs in entities]
+
+
+def build(entities):
+    index = SimilarityIndex()
+    for entity in entities:
+        index.add_entity(entity)
+    return index
+
+
+def all_pairs(index):
+    """Exact Jaccard over every pair of observations of different entities."""
+    obs = index.observations
+    found = {}
+    for i, a in enumerate(obs):
+        for b in obs[i + 1:]:
+            if a.name == b.name:
+                continue
+            similarity = jaccard(a.shingles, b.shingles)
+            if similarity >= index.threshold:
+                key = tuple(sorted((a.name, b.name)))
+                found[key] = max(similarity, found.get(key, 0.0))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--entities', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    entities = make_entities(random.Random(args.seed), args.entities)
+
+    index = build(entities)
+    lsh = {(a.name, b.name): similarity for similarity, a, b in index.pairs()}
+    exact = all_pairs(index)
+    for key, similarity in lsh.items():
+        assert exact.get(key) == similarity, key
+    strong = [key for key, similarity in exact.items() if similarity >= DEFAULT_THRESHOLD + 0.1]
+    missed_strong = [key for key in strong if key not in lsh]
+    assert not missed_strong, missed_strong[:5]
+    recall = len(lsh) / len(exact) if exact else 1.0
+    n_obs = len(index.observations)
+    print(f'equivalence: OK ({len(lsh)} of {len(exact)} pairs >= {DEFAULT_THRESHOLD} found, '
+          f'recall {recall:.1%}; {len(strong)} of {len(strong)} >= {DEFAULT_THRESHOLD + 0.1:.1f}; '
+          f'{index.pairs_checked} of {n_obs * (n_obs - 1) // 2} pairs compared)')
+
+    t_build = min(timeit.repeat(lambda: build(entities), number=1, repeat=args.repeat))
+    t_pairs = min(timeit.repeat(index.pairs, number=1, repeat=args.repeat))
+    t_exact = min(timeit.repeat(lambda: all_pairs(index), number=1, repeat=args.repeat))
+    t_query = min(timeit.repeat(
+        lambda: index.query('lp:defaults:new', entities[0]['observations'][0]),
+        number=100, repeat=args.repeat)) / 100
+    print(f'{n_obs} observations (best of {args.repeat}):')
+    print(f'  all pairs (exact Jaccard)   {t_exact:7.3f}s')
+    print(f'  LSH index build (MinHash)   {t_build:7.3f}s')
+    print(f'  LSH pairs                   {t_pairs:7.3f}s  '
+          f'(build + pairs {t_exact / (t_build + t_pairs):.1f}x faster)')
+    print(f'  --candidate query           {t_query * 1000:7.3f}ms')
+
+
+if __name__ == '__main__':
+    main()
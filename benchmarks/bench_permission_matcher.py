@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_permission_matcher.py
+Compare the precompiled permission matcher (set + subcommand trie) against
+linear scans of the merged always_ask / subcommand_ask lists.
+
+Usage: python3 benchmarks/bench_permission_matcher.py [--repeat N] [--seed N] [--cases N]
+
+Before timing, the matcher is checked against the list semantics:
+  - fixed cases from docs/parent_guide.md (floor, longest match, paths)
+  - randomized configs/command lines (--cases per run)
+  - security floor and frozen interpreters survive the merge
+
+Scenarios:
+  project   - the documented project config (~10 patterns)
+  large     - 40 commands x 25 subcommand patterns (1000 patterns)
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from merge_config import (  # noqa: E402
+    SECURITY_FLOOR_ALWAYS_ASK,
+    SECURITY_FLOOR_SUBCOMMAND_ASK,
+    compile_permission_matcher,
+    merge_permission_configs,
+)
+from permission_matcher import PermissionMatcher  # noqa: E402
+
+PROJECT_CONFIG = {
+    'interpreters': {'python3': {'dangerous_flags': ['-c']}, 'bash': {'dangerous_flags': ['-c']}},
+    'always_ask': ['curl', 'wget', 'sudo', 'npm', 'node', 'ssh', 'scp'],
+    'subcommand_ask': [
+        'git:push', 'git:clean', 'git:reset:--hard', 'git:checkout:.', 'git:restore:.',
+        'gh:pr:merge', 'gh:repo:delete', 'gh:repo:archive', 'gh:release:delete',
+    ],
+}
+
+
+def list_check(config, argv):
+    """Reference: the list semantics consumers implement today (linear scans)."""
+    if not argv:
+        return None
+    name = argv[0].rsplit('/', 1)[-1]
+    for word in config.get('always_ask', []):
+        if word == name:
+            return 'always_ask', name
+    tokens = [name] + list(argv[1:])
+    best = None
+    for pattern in config.get('subcommand_ask', []):
+        parts = pattern.split(':')
+        if tokens[:len(parts)] == parts and (best is None or len(parts) > len(best.split(':'))):
+            best = pattern
+    if best is not None:
+        return 'subcommand_ask', best
+    return None
+
+
+def matcher_for(config):
+    return PermissionMatcher(compile_permission_matcher(config))
+
+
+def check_fixed_cases():
+    merged = merge_permission_configs(PROJECT_CONFIG, {})
+    matcher = matcher_for(merged)
+    cases = {
+        ('git', 'push', 'origin', 'main'): ('subcommand_ask', 'git:push'),
+        ('git', 'reset', '--hard', 'HEAD~1'): ('subcommand_ask', 'git:reset:--hard'),
+        ('git', 'reset', '--soft'): None,
+        ('git', 'status'): None,
+        ('/usr/bin/git', 'push'): ('subcommand_ask', 'git:push'),
+        ('gh', 'pr', 'view', '1'): None,
+        ('gh', 'pr', 'merge', '1'): ('subcommand_ask', 'gh:pr:merge'),
+        ('sudo', 'git', 'push'): ('always_ask', 'sudo'),
+        ('rm', '-rf', 'x'): ('always_ask', 'rm'),
+        ('ls', '-la'): None,
+        (): None,
+    }
+    for argv, expected in cases.items():
+        got = matcher.check(list(argv))
+        assert got == expected, f'{argv}: expected {expected}, got {got}'
+        assert list_check(merged, list(argv)) == expected, argv
+
+
+def check_floor_and_frozen():
+    local = {
+        'always_ask': None,
+        'subcommand_ask': ['docker:rm'],
+        'interpreters': {'python3': {'dangerous_flags': []}, 'evil': {}},
+    }
+    base = {'interpreters': PROJECT_CONFIG['interpreters'], 'always_ask': [], 'subcommand_ask': []}
+    with contextlib.redirect_stderr(io.StringIO()):  # expected E028 warning
+        merged = merge_permission_configs(base, local)
+    for config in (merged, dict(base, _merged_from='base')):
+        matcher = matcher_for(config)
+        for word in SECURITY_FLOOR_ALWAYS_ASK:
+            assert matcher.check([word]) == ('always_ask', word), word
+        for pattern in SECURITY_FLOOR_SUBCOMMAND_ASK:
+            assert matcher.check(pattern.split(':')) == ('subcommand_ask', pattern), pattern
+        assert matcher.dangerous_flags('python3') == frozenset(['-c'])
+        assert 'evil' not in matcher.interpreters
+
+
+def random_config(rng, vocab):
+    commands = rng.sample(vocab, 6)
+    always_ask = rng.sample(vocab, rng.randint(0, 4))
+    patterns = set()
+    for _ in range(rng.randint(0, 25)):
+        depth = rng.randint(1, 4)
+        patterns.add(':'.join([rng.choice(commands)] + [rng.choice(vocab) for _ in range(depth - 1)]))
+    return {'always_ask': always_ask, 'subcommand_ask': sorted(patterns)}
+
+
+def random_argv(rng, config, vocab):
+    if config['subcommand_ask'] and rng.random() < 0.6:
+        argv = rng.choice(config['subcommand_ask']).split(':')
+        argv = argv[:rng.randint(1, len(argv))]
+    else:
+        argv = [rng.choice(vocab)]
+    argv += [rng.choice(vocab) for _ in range(rng.randint(0, 3))]
+    if rng.random() < 0.1:
+        argv[0] = '/usr/bin/' + argv[0]
+    return argv
+
+
+def check_random_cases(seed, cases):
+    rng = random.Random(seed)
+    vocab = ['git', 'gh', 'docker', 'rm', 'push', 'reset', '--hard', 'pr', 'merge',
+             'run', '.', '-f', 'x', 'a', 'b', 'main']
+    checked = 0
+    while checked < cases:
+        config = random_config(rng, vocab)
+        merged = merge_permission_configs({}, config)
+        matcher = matcher_for(merged)
+        for _ in range(50):
+            argv = random_argv(rng, merged, vocab)
+            expected = list_check(merged, argv)
+            got = matcher.check(argv)
+            assert got == expected, f'{merged} {argv}: expected {expected}, got {got}'
+            checked += 1
+    return checked
+
+
+def scenario_large():
+    commands = [f'tool{i}' for i in range(40)]
+    subs = [f'sub{j}' for j in range(25)]
+    config = {
+        'always_ask': [f'net{i}' for i in range(100)],
+        'subcommand_ask': [f'{c}:{s}:--force' for c in commands for s in subs],
+    }
+    rng = random.Random(1)
+    argvs = [[rng.choice(commands), rng.choice(subs), rng.choice(['--force', '-v']), 'arg']
+             for _ in range(1000)]
+    return merge_permission_configs(config, {}), argvs
+
+
+def scenario_project():
+    rng = random.Random(2)
+    samples = [
+        ['git', 'status'], ['git', 'push', 'origin'], ['git', 'log', '--oneline'],
+        ['gh', 'pr', 'view', '3'], ['gh', 'pr', 'merge', '3'], ['ls', '-la'],
+        ['python3', 'scripts/x.py'], ['curl', 'https://example.com'],
+    ]
+    return merge_permission_configs(PROJECT_CONFIG, {}), [rng.choice(samples) for _ in range(1000)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cases', type=int, default=20000)
+    args = parser.parse_args()
+
+    check_fixed_cases()
+    check_floor_and_frozen()
+    checked = check_random_cases(args.seed, args.cases)
+    print(f'equivalence: OK ({checked} random command lines, seed {args.seed})')
+    print()
+
+    print(f"{'scenario':<10} {'lists (lookups/s)':>18} {'matcher (lookups/s)':>20} {'speedup':>8}")
+    for name, build in (('project', scenario_project), ('large', scenario_large)):
+        config, argvs = build()
+        matcher = matcher_for(config)
+        for argv in argvs:
+            assert matcher.check(argv) == list_check(config, argv)
+
+        def run_lists():
+            for argv in argvs:
+                list_check(config, argv)
+
+        def run_matcher():
+            for argv in argvs:
+                matcher.check(argv)
+
+        t_lists = min(timeit.repeat(run_lists, number=1, repeat=args.repeat))
+        t_matcher = min(timeit.repeat(run_matcher, number=1, repeat=args.repeat))
+        print(f'{name:<10} {len(argvs) / t_lists:>18,.0f} {len(argvs) / t_matcher:>20,.0f} '
+              f'{t_lists / t_matcher:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_yaml_io.py
+Parse-time comparison for the shared YAML layer (scripts/yaml_io.py):
+pure-Python yaml.safe_load vs the libyaml C loader vs the mtime/size
+parse cache, on config.yaml and synthetic large execution_log.yaml files.
+
+Usage: python3 benchmarks/bench_yaml_io.py [--tasks N [N ...]] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'scripts'))
+
+import yaml  # noqa: E402
+import yaml_io  # noqa: E402
+
+
+def write_exec_log(path, n_tasks):
+    roles = ['worker_coder', 'worker_researcher', 'worker_writer', 'aggregator']
+    lines = [
+        'cmd_id: cmd_999',
+        'started: "2026-02-07 10:00:00"',
+        'finished: "2026-02-07 12:00:00"',
+        'status: success',
+        'tasks:',
+    ]
+    for i in range(n_tasks):
+        lines.extend([
+            f'  - id: {i + 1}',
+            f'    role: {roles[i % len(roles)]}',
+            f'    task: task_{i + 1}',
+            '    model: sonnet',
+            '    started: "2026-02-07 10:02:00"',
+            '    finished: "2026-02-07 10:05:00"',
+            f'    duration_sec: {60 + i % 300}',
+            '    status: success',
+            '    error: null',
+            f'    retries: {i % 3}',
+            '    metadata_issues: []',
+        ])
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def time_ms(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def bench(label, path, repeat):
+    with open(path, 'rb') as f:
+        content = f.read()
+    pure = time_ms(lambda: yaml.load(content, Loader=yaml.SafeLoader), repeat)
+    c_loader = time_ms(lambda: yaml_io.loads(content), repeat)
+    yaml_io.clear_cache()
+    yaml_io.load(path)
+    cached = time_ms(lambda: yaml_io.load(path), repeat)
+    print(f'{label:<28} {pure:>10.2f} {c_loader:>10.2f} {cached:>10.4f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--tasks', type=int, nargs='+', default=[500, 5000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'libyaml available: {yaml_io.has_libyaml()}')
+    print(f"{'file':<28} {'pure (ms)':>10} {'C (ms)':>10} {'cached (ms)':>10}")
+    bench('config.yaml', os.path.join(PROJECT_ROOT, 'config.yaml'), args.repeat)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.tasks:
+            path = os.path.join(tmp, f'execution_log_{n}.yaml')
+            write_exec_log(path, n)
+            bench(f'execution_log ({n} tasks)', path, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
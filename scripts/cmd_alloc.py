@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+scripts/cmd_alloc.py
+Allocate the next cmd number in constant time.
+
+The last allocated number is kept in work/.cmd_counter and updated under an
+exclusive flock on work/.cmd_counter.lock, so concurrent launches serialize
+on the lock instead of colliding on mkdir and sleeping.
+
+Crash safety:
+  - the cmd directory is created before the counter is advanced, and the
+    counter is replaced atomically (temp file + fsync + rename)
+  - a crash between the two leaves a directory the counter has not seen;
+    the next allocation finds it on mkdir and moves past it, so a number is
+    never handed out twice
+  - a missing or unreadable counter is rebuilt by one scan of work/ (plus
+    the archive manifest, see cmd_archive.py)
+
+Usage: python3 scripts/cmd_alloc.py [work_root]
+Output: prints "cmd_NNN" (the created directory name)
+Exit code: 0 = allocated, 1 = failure (E060 / E061)
+"""
+
+import sys
+import os
+import re
+import fcntl
+import tempfile
+from typing import Optional, Tuple
+
+import cmd_archive
+
+COUNTER_FILE = '.cmd_counter'
+LOCK_FILE = '.cmd_counter.lock'
+
+CMD_DIR_RE = re.compile(r'^cmd_(\d+)$')
+
+
+def cmd_dir_name(number: int) -> str:
+    """cmd directory name for a number (cmd_007, cmd_1234)."""
+    return f'cmd_{number:03d}'
+
+
+def scan_last_number(work_root: str) -> int:
+    """
+    Highest cmd number in work_root, live or archived (0 if none).
+    O(live entries); archived cmds come from the archive manifest.
+    """
+    last = cmd_archive.archived_last_number(work_root)
+    with os.scandir(work_root) as entries:
+        for entry in entries:
+            match = CMD_DIR_RE.match(entry.name)
+            if match and entry.is_dir():
+                last = max(last, int(match.group(1)))
+    return last
+
+
+def _read_counter(path: str):
+    """Last allocated number from the counter file, or None if missing/corrupt."""
+    try:
+        with open(path, 'r') as f:
+            value = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return int(value) if value.isdigit() else None
+
+
+def _write_counter(work_root: str, number: int):
+    """Atomically replace the counter file (temp file + fsync + rename)."""
+    fd, tmp_path = tempfile.mkstemp(prefix=COUNTER_FILE + '.', dir=work_root)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(f'{number}\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(work_root, COUNTER_FILE))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    dir_fd = os.open(work_root, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def allocate(work_root: str = 'work') -> Tuple[int, str]:
+    """
+    Create the next cmd directory under work_root.
+    Returns (number, path). Raises OSError if the directory cannot be created.
+    """
+    os.makedirs(work_root, exist_ok=True)
+    with open(os.path.join(work_root, LOCK_FILE), 'a') as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+
+        last = _read_counter(os.path.join(work_root, COUNTER_FILE))
+        if last is None:
+            last = scan_last_number(work_root)
+
+        number = last + 1
+        while True:
+            path = os.path.join(work_root, cmd_dir_name(number))
+            try:
+                os.mkdir(path)
+                break
+            except FileExistsError:
+                number += 1  # created outside the allocator or before a crash
+
+        _write_counter(work_root, number)
+        # lock released on close
+    return number, path
+
+
+def allocate_or_report(work_root: str = 'work') -> Optional[Tuple[int, str]]:
+    """allocate(), printing E060/E061 to stderr and returning None on failure."""
+    if os.path.exists(work_root) and not os.path.isdir(work_root):
+        print(f'[E060] work directory not found → Work directory should be created automatically, check file system permissions (Context: {work_root})', file=sys.stderr)
+        return None
+    try:
+        return allocate(work_root)
+    except OSError as e:
+        print(f'[E061] cmd directory creation failed after retries → Check file system permissions on work/ directory (Details: {e})', file=sys.stderr)
+        return None
+
+
+def main(argv=None):
+    """Main entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+    work_root = argv[0] if argv else 'work'
+    allocated = allocate_or_report(work_root)
+    if allocated is None:
+        sys.exit(1)
+    print(cmd_dir_name(allocated[0]))
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+scripts/cmd_archive.py
+Archive old completed cmds out of work/ and resolve files across live and
+archived cmds.
+
+Layout:
+  work/archive/YYYY-MM.zip     one deflate-compressed zip per month of the
+                               cmd's last activity; members cmd_NNN/<path>
+  work/archive/manifest.json   {"cmds": {"cmd_042": {"archive": "2026-03.zip",
+                               ...}}, "last_number": 42}
+
+A cmd is archived when it is completed (execution_log.yaml status success or
+failed, or a report.md exists) and nothing in it changed for
+--older-than-days (default 30). The newest cmd is never archived.
+
+Zip archives keep a central directory, so one file (report_summary.md,
+execution_log.yaml, ...) is read without extracting the rest. resolve()
+extracts single files on demand into work/archive/.extract/cmd_NNN/ and
+returns a real path, so callers keep using ordinary file APIs.
+
+Usage:
+  python3 scripts/cmd_archive.py archive [--older-than-days N] [--dry-run]
+  python3 scripts/cmd_archive.py resolve <path>     # work/cmd_042/plan.md or cmd_042/plan.md
+  python3 scripts/cmd_archive.py latest <relpath>   # newest cmd's file, e.g. plan.md
+  python3 scripts/cmd_archive.py list
+Global option: --work-root DIR (default: <project>/work)
+Exit code: 0 = success, 1 = failure / not found
+"""
+
+import sys
+import os
+import re
+import json
+import time
+import fcntl
+import shutil
+import zipfile
+import argparse
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ARCHIVE_DIR = 'archive'
+MANIFEST_FILE = 'manifest.json'
+EXTRACT_DIR = '.extract'
+LOCK_FILE = '.lock'
+MANIFEST_FORMAT = 1
+
+DEFAULT_OLDER_THAN_DAYS = 30
+COMPLETED_STATUSES = ('success', 'failed')
+
+CMD_DIR_RE = re.compile(r'^cmd_(\d+)$')
+_EXEC_STATUS_RE = re.compile(r'^status:\s*["\']?(\w+)', re.MULTILINE)
+
+# Manifests read in this process: path -> ((mtime_ns, size), manifest)
+_manifests: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def default_work_root() -> str:
+    """<project root>/work, derived from this script's location."""
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'work')
+
+
+def cmd_number(name: str) -> Optional[int]:
+    """42 for 'cmd_042', None for anything else."""
+    match = CMD_DIR_RE.match(name)
+    return int(match.group(1)) if match else None
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+def load_manifest(work_root: str) -> Dict[str, Any]:
+    """Archive manifest (empty manifest if work/ has no archive yet)."""
+    path = os.path.join(work_root, ARCHIVE_DIR, MANIFEST_FILE)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {'format': MANIFEST_FORMAT, 'cmds': {}, 'last_number': 0}
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _manifests.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+    _manifests[path] = (signature, manifest)
+    return manifest
+
+
+def archived_last_number(work_root: str) -> int:
+    """Highest cmd number ever archived (0 if none). Used by cmd_alloc.py."""
+    try:
+        return int(load_manifest(work_root).get('last_number', 0))
+    except (OSError, ValueError):
+        return 0
+
+
+def _write_atomic(path: str, data: bytes):
+    """Replace path with data (temp file + fsync + rename)."""
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp.', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Archiving
+# ---------------------------------------------------------------------------
+
+def is_completed(cmd_dir: str) -> bool:
+    """execution_log.yaml status is success/failed, or report.md exists."""
+    try:
+        with open(os.path.join(cmd_dir, 'execution_log.yaml'), 'r') as f:
+            match = _EXEC_STATUS_RE.search(f.read())
+        if match:
+            return match.group(1) in COMPLETED_STATUSES
+    except OSError:
+        pass
+    return os.path.isfile(os.path.join(cmd_dir, 'report.md'))
+
+
+def _iter_files(cmd_dir: str) -> Iterator[Tuple[str, str]]:
+    """(absolute path, path relative to cmd_dir) of every regular file."""
+    for dirpath, _, filenames in os.walk(cmd_dir):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if os.path.isfile(path) and not os.path.islink(path):
+                yield path, os.path.relpath(path, cmd_dir)
+
+
+def last_activity(cmd_dir: str) -> float:
+    """Newest mtime of the cmd directory or any file in it."""
+    newest = os.stat(cmd_dir).st_mtime
+    for path, _ in _iter_files(cmd_dir):
+        newest = max(newest, os.stat(path).st_mtime)
+    return newest
+
+
+def find_candidates(work_root: str, older_than_days: float) -> List[Tuple[str, float]]:
+    """Live cmds eligible for archiving: [(name, last activity)], oldest first."""
+    names = sorted(
+        (entry.name for entry in os.scandir(work_root)
+         if entry.is_dir() and cmd_number(entry.name) is not None),
+        key=cmd_number,
+    )
+    cutoff = time.time() - older_than_days * 86400
+    candidates = []
+    for name in names[:-1]:  # never the newest cmd
+        cmd_dir = os.path.join(work_root, name)
+        if not is_completed(cmd_dir):
+            continue
+        activity = last_activity(cmd_dir)
+        if activity < cutoff:
+            candidates.append((name, activity))
+    return candidates
+
+
+def _month_of(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m')
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _write_month_archive(archive_path: str, cmds: List[Tuple[str, str]]) -> Dict[str, Tuple[int, int]]:
+    """
+    Add cmds [(name, cmd_dir)] to a month archive via a temp copy that
+    replaces the original only when complete. Members of a cmd already in
+    the archive (left by an interrupted run) are replaced.
+    Returns {name: (files, bytes)}.
+    """
+    names = {name for name, _ in cmds}
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp.', suffix='.zip', dir=os.path.dirname(archive_path))
+    os.close(fd)
+    stats = {}
+    try:
+        stale = False
+        if os.path.exists(archive_path):
+            with zipfile.ZipFile(archive_path) as old:
+                stale = any(n.split('/', 1)[0] in names for n in old.namelist())
+            if not stale:
+                shutil.copyfile(archive_path, tmp_path)
+
+        with zipfile.ZipFile(tmp_path, 'a' if os.path.getsize(tmp_path) else 'w',
+                             compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+            if stale:
+                # Rebuild without the stale members
+                with zipfile.ZipFile(archive_path) as old:
+                    for info in old.infolist():
+                        if info.filename.split('/', 1)[0] not in names:
+                            with old.open(info) as src, zf.open(info, 'w') as dst:
+                                shutil.copyfileobj(src, dst)
+            for name, cmd_dir in cmds:
+                files = size = 0
+                for path, rel in sorted(_iter_files(cmd_dir), key=lambda item: item[1]):
+                    zf.write(path, f'{name}/{rel.replace(os.sep, "/")}')
+                    files += 1
+                    size += os.path.getsize(path)
+                stats[name] = (files, size)
+
+        with open(tmp_path, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, archive_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return stats
+
+
+def archive_cmds(work_root: str, older_than_days: float = DEFAULT_OLDER_THAN_DAYS,
+                 dry_run: bool = False) -> List[str]:
+    """
+    Move eligible cmds into month archives. Order per month: archive
+    replaced, then manifest updated, then live directories removed, so an
+    interruption at any point leaves every cmd readable.
+    Returns archived cmd names.
+    """
+    candidates = find_candidates(work_root, older_than_days)
+    if dry_run or not candidates:
+        return [name for name, _ in candidates]
+
+    archive_root = os.path.join(work_root, ARCHIVE_DIR)
+    os.makedirs(archive_root, exist_ok=True)
+    with open(os.path.join(archive_root, LOCK_FILE), 'a') as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+
+        by_month: Dict[str, List[Tuple[str, float]]] = {}
+        for name, activity in candidates:
+            by_month.setdefault(_month_of(activity), []).append((name, activity))
+
+        archived = []
+        for month, entries in sorted(by_month.items()):
+            archive_name = f'{month}.zip'
+            stats = _write_month_archive(
+                os.path.join(archive_root, archive_name),
+                [(name, os.path.join(work_root, name)) for name, _ in entries],
+            )
+
+            manifest = dict(load_manifest(work_root))
+            manifest['cmds'] = dict(manifest.get('cmds', {}))
+            now = _iso(time.time())
+            for name, activity in entries:
+                files, size = stats[name]
+                manifest['cmds'][name] = {
+                    'archive': archive_name,
+                    'last_activity': _iso(activity),
+                    'archived_at': now,
+                    'files': files,
+                    'bytes': size,
+                }
+            manifest['format'] = MANIFEST_FORMAT
+            manifest['last_number'] = max(
+                [int(manifest.get('last_number', 0))] + [cmd_number(n) for n, _ in entries]
+            )
+            manifest_path = os.path.join(archive_root, MANIFEST_FILE)
+            _write_atomic(manifest_path, json.dumps(manifest, indent=1, sort_keys=True).encode('utf-8'))
+            _manifests.pop(manifest_path, None)
+
+            for name, _ in entries:
+                shutil.rmtree(os.path.join(work_root, name))
+                shutil.rmtree(os.path.join(archive_root, EXTRACT_DIR, name), ignore_errors=True)
+                archived.append(name)
+    return archived
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+def split_cmd_path(path: str, work_root: Optional[str] = None) -> Optional[Tuple[str, str, str]]:
+    """
+    'work/cmd_042/results/r.md' -> ('work', 'cmd_042', 'results/r.md').
+    Paths under work/archive/.extract/ map back to their work root; paths
+    starting at the cmd ('cmd_042/plan.md') use work_root (default:
+    <project>/work). None if the path has no cmd_NNN component.
+    """
+    parts = os.path.normpath(path).split(os.sep)
+    for i in range(len(parts) - 1, -1, -1):
+        if cmd_number(parts[i]) is None:
+            continue
+        if i == 0:
+            root = work_root or default_work_root()
+        elif parts[max(i - 2, 0):i] == [ARCHIVE_DIR, EXTRACT_DIR]:
+            root = os.sep.join(parts[:i - 2]) or '.'
+        else:
+            root = os.sep.join(parts[:i]) or os.sep
+        return root, parts[i], '/'.join(parts[i + 1:])
+    return None
+
+
+def resolve(work_root: str, cmd: str, relpath: str) -> Optional[str]:
+    """
+    Real path of cmd/relpath: the live file if cmd is still in work/, else
+    the single member extracted from its archive. None if not found.
+    """
+    live = os.path.join(work_root, cmd, relpath)
+    if os.path.exists(live):
+        return live
+
+    entry = load_manifest(work_root).get('cmds', {}).get(cmd)
+    if entry is None:
+        return None
+    archive_path = os.path.join(work_root, ARCHIVE_DIR, entry['archive'])
+    target = os.path.join(work_root, ARCHIVE_DIR, EXTRACT_DIR, cmd, relpath)
+    try:
+        archive_mtime = os.stat(archive_path).st_mtime
+    except FileNotFoundError:
+        return None
+    if os.path.exists(target) and os.stat(target).st_mtime >= archive_mtime:
+        return target
+
+    member = f'{cmd}/{relpath}' if relpath else cmd
+    with zipfile.ZipFile(archive_path) as zf:
+        try:
+            info = zf.getinfo(member)
+        except KeyError:
+            return None
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.tmp.', dir=os.path.dirname(target))
+        with os.fdopen(fd, 'wb') as dst, zf.open(info) as src:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp_path, target)
+    return target
+
+
+def resolve_path(path: str, work_root: Optional[str] = None) -> Optional[str]:
+    """resolve() for a path such as work/cmd_042/execution_log.yaml."""
+    if os.path.exists(path):
+        return path
+    split = split_cmd_path(path, work_root)
+    if split is None:
+        return None
+    return resolve(*split)
+
+
+def list_cmds(work_root: str) -> List[Tuple[str, str]]:
+    """[(cmd name, 'live' | archive file)] for every cmd, by number."""
+    cmds = {name: entry['archive'] for name, entry in load_manifest(work_root).get('cmds', {}).items()}
+    if os.path.isdir(work_root):
+        for entry in os.scandir(work_root):
+            if entry.is_dir() and cmd_number(entry.name) is not None:
+                cmds[entry.name] = 'live'
+    return sorted(cmds.items(), key=lambda item: cmd_number(item[0]))
+
+
+def latest(work_root: str, relpath: str) -> Optional[str]:
+    """
+    Path of relpath in the cmd that changed it most recently (live cmds by
+    file mtime, like ls -t); falls back to the newest archived cmd having it.
+    """
+    best = None
+    if os.path.isdir(work_root):
+        for entry in os.scandir(work_root):
+            if not entry.is_dir() or cmd_number(entry.name) is None:
+                continue
+            try:
+                mtime = os.stat(os.path.join(entry.path, relpath)).st_mtime
+            except OSError:
+                continue
+            if best is None or mtime > best[0]:
+                best = (mtime, os.path.join(entry.path, relpath))
+    if best is not None:
+        return best[1]
+
+    archived = sorted(load_manifest(work_root).get('cmds', {}), key=cmd_number, reverse=True)
+    for cmd in archived:
+        path = resolve(work_root, cmd, relpath)
+        if path is not None:
+            return path
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv=None):
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        prog='cmd_archive.py',
+        description='Archive old completed cmds and resolve files in archived cmds.',
+    )
+    parser.add_argument('--work-root', default=None, help='work directory (default: <project>/work)')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_archive = sub.add_parser('archive', help='archive completed cmds older than the threshold')
+    p_archive.add_argument('--older-than-days', type=float, default=DEFAULT_OLDER_THAN_DAYS)
+    p_archive.add_argument('--dry-run', action='store_true', help='list eligible cmds only')
+    p_resolve = sub.add_parser('resolve', help='print a real path for a live or archived cmd file')
+    p_resolve.add_argument('path')
+    p_latest = sub.add_parser('latest', help="print the newest cmd's copy of a file")
+    p_latest.add_argument('relpath')
+    sub.add_parser('list', help='list live and archived cmds')
+
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return 0 if e.code == 0 else 1
+
+    work_root = args.work_root or default_work_root()
+
+    if args.command == 'archive':
+        if not os.path.isdir(work_root):
+            print(f'[E060] work directory not found → Work directory should be created automatically, check file system permissions (Context: {work_root})', file=sys.stderr)
+            return 1
+        names = archive_cmds(work_root, args.older_than_days, args.dry_run)
+        verb = 'eligible' if args.dry_run else 'archived'
+        for name in names:
+            print(name)
+        print(f'{len(names)} cmd(s) {verb}', file=sys.stderr)
+        return 0
+
+    if args.command == 'resolve':
+        path = resolve_path(args.path, work_root)
+    elif args.command == 'latest':
+        path = latest(work_root, args.relpath)
+    else:
+        for name, location in list_cmds(work_root):
+            print(f'{name}\t{location}')
+        return 0
+
+    if path is None:
+        print(f'not found: {getattr(args, "path", None) or args.relpath}', file=sys.stderr)
+        return 1
+    print(path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
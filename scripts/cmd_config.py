@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+scripts/cmd_config.py
+Typed, memoized view of a cmd's effective (merged) config.
+
+Reads work/cmd_NNN/config.json (the canonical snapshot written by
+merge_config.py) with the json module only. cmds without a JSON snapshot
+fall back to parsing work/cmd_NNN/config.yaml.
+
+Usage:
+  from cmd_config import load_cmd_config
+  cfg = load_cmd_config('work/cmd_042')
+  cfg.max_retries                                      # -> 2
+  cfg.get('retrospect.memory.max_candidates_per_cmd')  # -> 5
+
+  python3 scripts/cmd_config.py <work_dir> [dotted.key]
+Prints the effective config (or one value) as JSON.
+Exit code: 0 = found, 1 = no config snapshot / key not found
+"""
+
+import sys
+import os
+import json
+from typing import Any, Dict, Optional, Tuple
+
+# Fallbacks for settings missing from a snapshot (mirror config.yaml)
+DEFAULTS = {
+    'default_model': 'sonnet',
+    'max_parallel': 10,
+    'max_retries': 2,
+    'worker_max_turns': 30,
+    'max_cmd_duration_sec': 1800,
+    'plan_validation': False,
+}
+
+SNAPSHOT_JSON = 'config.json'
+SNAPSHOT_YAML = 'config.yaml'
+
+_MISSING = object()
+
+# Loaded configs: realpath -> ((mtime_ns, size), CmdConfig)
+_loaded: Dict[str, Tuple[Tuple[int, int], 'CmdConfig']] = {}
+
+
+class CmdConfig:
+    """Read-only view over an effective config dict with typed accessors."""
+
+    __slots__ = ('data', 'source')
+
+    def __init__(self, data: Dict[str, Any], source: Optional[str] = None):
+        self.data = data
+        self.source = source
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """Dot-notation lookup ('retrospect.memory.max_candidates_per_cmd')."""
+        current: Any = self.data
+        for part in path.split('.'):
+            if not isinstance(current, dict) or part not in current:
+                return default
+            current = current[part]
+        return current
+
+    def get_int(self, path: str, default: Optional[int] = None) -> Optional[int]:
+        """Integer value at path; default if missing, null or not an int."""
+        value = self.get(path)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        return default
+
+    def get_float(self, path: str, default: Optional[float] = None) -> Optional[float]:
+        """Numeric value at path as float; default if missing or not a number."""
+        value = self.get(path)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return default
+
+    def get_bool(self, path: str, default: Optional[bool] = None) -> Optional[bool]:
+        """Boolean value at path; default if missing or not a bool."""
+        value = self.get(path)
+        return value if isinstance(value, bool) else default
+
+    def get_str(self, path: str, default: Optional[str] = None) -> Optional[str]:
+        """String value at path; default if missing or not a string."""
+        value = self.get(path)
+        return value if isinstance(value, str) else default
+
+    @property
+    def merged_from(self) -> Optional[str]:
+        """'_merged_from' canary: 'local', 'base', or None if absent."""
+        return self.get_str('_merged_from')
+
+    @property
+    def default_model(self) -> str:
+        return self.get_str('default_model', DEFAULTS['default_model'])
+
+    @property
+    def max_parallel(self) -> int:
+        return self.get_int('max_parallel', DEFAULTS['max_parallel'])
+
+    @property
+    def max_retries(self) -> int:
+        return self.get_int('max_retries', DEFAULTS['max_retries'])
+
+    @property
+    def worker_max_turns(self) -> int:
+        return self.get_int('worker_max_turns', DEFAULTS['worker_max_turns'])
+
+    @property
+    def max_cmd_duration_sec(self) -> Optional[int]:
+        """Duration limit in seconds; None when explicitly disabled (null)."""
+        value = self.get('max_cmd_duration_sec', _MISSING)
+        if value is _MISSING:
+            return DEFAULTS['max_cmd_duration_sec']
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        return None
+
+    @property
+    def plan_validation(self) -> bool:
+        return self.get_bool('plan_validation', DEFAULTS['plan_validation'])
+
+
+def load_config_file(path: str) -> CmdConfig:
+    """
+    Load a config snapshot (.json via json, anything else as YAML).
+    Memoized per file while its mtime and size are unchanged; the returned
+    object is shared, do not mutate its data.
+    Raises OSError, ValueError (bad JSON) or yaml_io.YAMLError.
+    """
+    st = os.stat(path)
+    key = os.path.realpath(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _loaded.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    if path.endswith('.json'):
+        with open(path, 'r') as f:
+            data = json.load(f)
+    else:
+        import yaml_io
+        data = yaml_io.load(path)
+    if not isinstance(data, dict):
+        data = {}
+
+    config = CmdConfig(data, path)
+    _loaded[key] = (signature, config)
+    return config
+
+
+def find_snapshot(work_dir: str) -> Optional[str]:
+    """
+    Path of a cmd's config snapshot (config.json preferred), or None.
+    Snapshots of archived cmds are extracted via cmd_archive.resolve_path().
+    """
+    for name in (SNAPSHOT_JSON, SNAPSHOT_YAML):
+        path = os.path.join(work_dir, name)
+        if os.path.isfile(path):
+            return path
+    import cmd_archive
+    for name in (SNAPSHOT_JSON, SNAPSHOT_YAML):
+        path = cmd_archive.resolve_path(os.path.join(work_dir, name))
+        if path is not None:
+            return path
+    return None
+
+
+def load_cmd_config(work_dir: str) -> Optional[CmdConfig]:
+    """Effective config of the cmd in work_dir, or None if it has no snapshot."""
+    path = find_snapshot(work_dir)
+    if path is None:
+        return None
+    return load_config_file(path)
+
+
+def main():
+    """Main entry point."""
+    if len(sys.argv) < 2:
+        print('Usage: python3 scripts/cmd_config.py <work_dir> [dotted.key]', file=sys.stderr)
+        sys.exit(1)
+
+    config = load_cmd_config(sys.argv[1])
+    if config is None:
+        print(f'ERROR: no config snapshot (config.json / config.yaml) in {sys.argv[1]}', file=sys.stderr)
+        sys.exit(1)
+
+    if len(sys.argv) > 2:
+        value = config.get(sys.argv[2], _MISSING)
+        if value is _MISSING:
+            print(f'key not found: {sys.argv[2]}', file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(value, ensure_ascii=False))
+    else:
+        print(json.dumps(config.data, ensure_ascii=False, indent=2))
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
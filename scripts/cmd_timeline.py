@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+scripts/cmd_timeline.py
+Timeline of one cmd: achieved parallelism, wave barriers, critical path
+and retry loss.
+
+Joins the started/finished timestamps of execution_log.yaml with the
+Tasks table ("Depends On" column) of plan.md. Worker entries map to plan
+tasks through their `task: task_N` field. Waves are the dependency levels
+of the Tasks table (parent_guide.md: the Depends On column, not
+"## Execution Order", is authoritative; a disagreement is reported).
+
+Reports:
+  phases        - span, busy time, average and peak parallelism of
+                  decompose / execute / aggregate / retrospect
+  concurrency   - running entries over time (step curve) and seconds
+                  spent at each level, against max_parallel
+  waves         - per wave: span, idle gap before it, straggler wait
+                  (slot time spent waiting for the wave's slowest task)
+                  and barrier delay (time tasks waited after their own
+                  dependencies had finished)
+  critical path - longest Depends On chain by task duration, against the
+                  execute-phase span
+  retries       - earlier entries of the same task (measured) plus
+                  retries x final attempt duration (estimated, as the log
+                  keeps only the last attempt's timestamps)
+
+Usage:
+  python3 scripts/cmd_timeline.py work/cmd_042
+  python3 scripts/cmd_timeline.py work/cmd_042 --format json
+  python3 scripts/cmd_timeline.py --log path/execution_log.yaml --plan path/plan.md
+
+Exit code: 0 = success, 1 = missing or unreadable input
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import yaml_io
+import cmd_archive
+from cmd_config import load_cmd_config, load_config_file
+
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.yaml")
+
+PHASES = ('decompose', 'execute', 'aggregate', 'retrospect', 'other')
+_ROLE_PHASES = {'decomposer': 'decompose', 'aggregator': 'aggregate', 'retrospector': 'retrospect'}
+_TASK_REF_RE = re.compile(r'(\d+)\s*$')
+_WAVE_RE = re.compile(r'^-\s*Wave\s+(\d+)[^:]*:(.*)$')
+_INT_RE = re.compile(r'\d+')
+DEPENDS_ON_COLUMN = 5  # '| # | Task | Persona | Model | Depends On |' (visualize_plan.sh: cut -f6)
+
+
+class PlanTask:
+    __slots__ = ('number', 'name', 'depends_on')
+
+    def __init__(self, number: int, name: str, depends_on: List[int]):
+        self.number = number
+        self.name = name
+        self.depends_on = depends_on
+
+
+def parse_plan(text: str) -> Tuple[Dict[int, PlanTask], Dict[int, List[int]]]:
+    """({task number: PlanTask} from "## Tasks", {wave: [tasks]} from "## Execution Order")."""
+    tasks: Dict[int, PlanTask] = {}
+    waves: Dict[int, List[int]] = {}
+    section = None
+    depends_column = DEPENDS_ON_COLUMN
+    for line in text.splitlines():
+        if line.startswith('## '):
+            section = line[3:].strip()
+            continue
+        if section == 'Tasks' and line.startswith('|'):
+            cells = [cell.strip() for cell in line.split('|')]
+            if 'Depends On' in cells:
+                depends_column = cells.index('Depends On')
+                continue
+            if len(cells) < 3 or not cells[1].isdigit():
+                continue  # separator row
+            depends = cells[depends_column] if depends_column < len(cells) else ''
+            tasks[int(cells[1])] = PlanTask(int(cells[1]), cells[2],
+                                            [int(d) for d in _INT_RE.findall(depends)])
+        elif section == 'Execution Order':
+            match = _WAVE_RE.match(line.strip())
+            if match:
+                waves[int(match.group(1))] = [int(t) for t in _INT_RE.findall(match.group(2))]
+    return tasks, waves
+
+
+def dependency_waves(tasks: Dict[int, PlanTask]) -> Tuple[Dict[int, int], List[int]]:
+    """({task: wave number}, tasks on a dependency cycle or with unknown dependencies)."""
+    wave: Dict[int, int] = {}
+    pending = sorted(tasks)
+    while pending:
+        progressed = []
+        for number in pending:
+            deps = tasks[number].depends_on
+            if all(d in wave for d in deps):
+                wave[number] = 1 + max((wave[d] for d in deps), default=0)
+                progressed.append(number)
+        if not progressed:
+            break
+        pending = [n for n in pending if n not in wave]
+    return wave, pending
+
+
+class Run:
+    """One execution-log entry placed on the timeline (seconds from cmd start)."""
+
+    __slots__ = ('entry', 'role', 'phase', 'task', 'status', 'start', 'end', 'open', 'retries')
+
+    def __init__(self, entry, role: str, task: Optional[int], status: str,
+                 start: float, end: float, open_: bool, retries: int):
+        self.entry = entry
+        self.role = role
+        self.phase = _ROLE_PHASES.get(role) or ('execute' if role.startswith('worker') or task
+                                               else 'other')
+        self.task = task
+        self.status = status
+        self.start = start
+        self.end = end
+        self.open = open_
+        self.retries = retries
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def _timestamp(value) -> Optional[datetime]:
+    """Naive datetime of a timestamp; aware ones are converted to UTC first."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def build_runs(log: Dict) -> Tuple[List[Run], Optional[datetime], List[str]]:
+    """(runs sorted by start, cmd start, warnings)."""
+    warnings: List[str] = []
+    entries = []
+    for task in log.get('tasks') or []:
+        if not isinstance(task, dict):
+            continue
+        started = _timestamp(task.get('started'))
+        if started is None:
+            warnings.append(f'entry {task.get("id")}: no started timestamp, skipped')
+            continue
+        finished = _timestamp(task.get('finished'))
+        if finished is None and isinstance(task.get('duration_sec'), (int, float)):
+            finished = started + timedelta(seconds=task['duration_sec'])
+        entries.append((task, started, finished))
+    if not entries:
+        return [], None, warnings
+
+    origin = _timestamp(log.get('started'))
+    first = min(started for _, started, _ in entries)
+    if origin is None or origin > first:
+        origin = first
+    latest = max(max(s, f or s) for _, s, f in entries)
+    log_end = _timestamp(log.get('finished'))
+    horizon = max(latest, log_end) if log_end else latest
+
+    runs = []
+    for task, started, finished in entries:
+        ref = task.get('task')
+        match = _TASK_REF_RE.search(str(ref)) if ref is not None else None
+        retries = task.get('retries')
+        runs.append(Run(
+            task.get('id'), str(task.get('role') or ''), int(match.group(1)) if match else None,
+            str(task.get('status') or ''), (started - origin).total_seconds(),
+            ((finished or horizon) - origin).total_seconds(), finished is None,
+            retries if isinstance(retries, int) and not isinstance(retries, bool) else 0,
+        ))
+        if finished is None:
+            warnings.append(f'entry {task.get("id")}: not finished, counted up to the last timestamp')
+    runs.sort(key=lambda r: (r.start, r.end))
+    return runs, origin, warnings
+
+
+def concurrency_curve(runs: List[Run]) -> List[Tuple[float, int]]:
+    """[(time, running entries from that time on)], one point per change."""
+    events: List[Tuple[float, int]] = []
+    for run in runs:
+        if run.end > run.start:
+            events.append((run.start, 1))
+            events.append((run.end, -1))
+    events.sort(key=lambda e: (e[0], e[1]))  # ends before starts at the same instant
+    curve: List[Tuple[float, int]] = []
+    level = 0
+    for time, delta in events:
+        level += delta
+        if curve and curve[-1][0] == time:
+            curve.pop()  # several events at one instant: keep the level after the last
+        if not curve or curve[-1][1] != level:
+            curve.append((time, level))
+    return curve
+
+
+def _phase_stats(runs: List[Run]) -> Dict[str, Dict[str, float]]:
+    stats = {}
+    for phase in PHASES:
+        members = [r for r in runs if r.phase == phase]
+        if not members:
+            continue
+        start = min(r.start for r in members)
+        end = max(r.end for r in members)
+        busy = sum(r.duration for r in members)
+        span = end - start
+        stats[phase] = {
+            'entries': len(members),
+            'start_sec': start,
+            'end_sec': end,
+            'span_sec': span,
+            'busy_sec': busy,
+            'avg_parallelism': round(busy / span, 2) if span > 0 else None,
+            'peak_parallelism': max((n for _, n in concurrency_curve(members)), default=0),
+        }
+    return stats
+
+
+def analyze(log: Dict, plan_text: Optional[str], max_parallel: Optional[int]) -> Dict:
+    runs, origin, warnings = build_runs(log)
+    tasks, listed_waves = parse_plan(plan_text) if plan_text else ({}, {})
+
+    curve = concurrency_curve(runs)
+    seconds_at: Dict[int, float] = {}
+    for (time, level), following in zip(curve, curve[1:] + [(curve[-1][0] if curve else 0, 0)]):
+        seconds_at[level] = seconds_at.get(level, 0.0) + following[0] - time
+    wall = (min(r.start for r in runs), max(r.end for r in runs)) if runs else (0.0, 0.0)
+
+    # Last entry of each plan task is its attempt of record; earlier ones are retry loss
+    attempts: Dict[int, List[Run]] = {}
+    for run in runs:
+        if run.task is not None and run.phase == 'execute':
+            attempts.setdefault(run.task, []).append(run)
+    final = {task: entries[-1] for task, entries in attempts.items()}
+    unknown = sorted(set(final) - set(tasks)) if tasks else []
+    if unknown:
+        warnings.append(f'log tasks not in plan.md: {", ".join(map(str, unknown))}')
+    not_run = sorted(set(tasks) - set(final))
+    if not_run:
+        warnings.append(f'plan tasks without a log entry: {", ".join(map(str, not_run))}')
+
+    wave_of, cyclic = dependency_waves(tasks)
+    if cyclic:
+        warnings.append(f'tasks with cyclic or unknown dependencies: {", ".join(map(str, cyclic))}')
+    computed = {}
+    for task, wave in wave_of.items():
+        computed.setdefault(wave, []).append(task)
+    if listed_waves and {w: sorted(t) for w, t in listed_waves.items()} != \
+            {w: sorted(t) for w, t in computed.items()}:
+        warnings.append('## Execution Order differs from the Depends On levels (levels used)')
+
+    execute_start = min((r.start for r in final.values()), default=0.0)
+    waves = []
+    previous_end = None
+    for wave in sorted(computed):
+        members = [final[t] for t in sorted(computed[wave]) if t in final]
+        if not members:
+            continue
+        start = min(r.start for r in members)
+        end = max(r.end for r in members)
+        slowest = max(members, key=lambda r: r.end)
+        barrier_delay = 0.0
+        for run in members:
+            deps = [final[d].end for d in tasks[run.task].depends_on if d in final]
+            ready = max(deps) if deps else execute_start
+            barrier_delay += max(run.start - ready, 0.0)
+        waves.append({
+            'wave': wave,
+            'tasks': [r.task for r in members],
+            'start_sec': start,
+            'end_sec': end,
+            'span_sec': end - start,
+            'gap_before_sec': max(start - previous_end, 0.0) if previous_end is not None else None,
+            'slowest_task': slowest.task,
+            'straggler_wait_sec': sum(end - r.end for r in members),
+            'barrier_delay_sec': barrier_delay,
+        })
+        previous_end = end
+
+    # Longest Depends On chain by the duration of each task's final attempt
+    longest: Dict[int, Tuple[float, Optional[int]]] = {}
+    for task in sorted(wave_of, key=lambda t: wave_of[t]):
+        best = max(((longest[d][0], d) for d in tasks[task].depends_on if d in longest),
+                   default=(0.0, None))
+        own = final[task].duration if task in final else 0.0
+        longest[task] = (best[0] + own, best[1])
+    path: List[int] = []
+    if longest:
+        node: Optional[int] = max(longest, key=lambda t: (longest[t][0], -t))
+        while node is not None:
+            path.append(node)
+            node = longest[node][1]
+        path.reverse()
+    path_length = longest[path[-1]][0] if path else 0.0
+    execute = [r for r in runs if r.phase == 'execute']
+    execute_span = (max(r.end for r in execute) - min(r.start for r in execute)) if execute else 0.0
+
+    retries = []
+    for task, entries in sorted(attempts.items()):
+        last = entries[-1]
+        measured = sum(r.duration for r in entries[:-1])
+        estimated = last.retries * last.duration
+        if measured or estimated:
+            retries.append({
+                'task': task,
+                'entries': len(entries),
+                'retries': last.retries,
+                'final_attempt_sec': last.duration,
+                'earlier_entries_sec': measured,
+                'estimated_retry_sec': estimated,
+            })
+
+    return {
+        'started': origin.isoformat(sep=' ') if origin else None,
+        'wall_sec': wall[1] - wall[0],
+        'max_parallel': max_parallel,
+        'phases': _phase_stats(runs),
+        'concurrency': {
+            'peak': max((n for _, n in curve), default=0),
+            'curve': [[time, level] for time, level in curve],
+            'seconds_at': {str(level): seconds_at[level] for level in sorted(seconds_at)},
+        },
+        'waves': waves,
+        'critical_path': {
+            'tasks': path,
+            'length_sec': path_length,
+            'execute_span_sec': execute_span,
+            'scheduling_overhead_sec': max(execute_span - path_length, 0.0),
+        },
+        'retries': {
+            'tasks': retries,
+            'earlier_entries_sec': sum(r['earlier_entries_sec'] for r in retries),
+            'estimated_retry_sec': sum(r['estimated_retry_sec'] for r in retries),
+        },
+        'warnings': warnings,
+    }
+
+
+def _clock(seconds: float) -> str:
+    seconds = int(round(seconds))
+    return f'+{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}'
+
+
+def print_report(report: Dict, label: str) -> None:
+    print(f'=== CMD TIMELINE: {label} ===')
+    print(f'Started: {report["started"]}, wall clock {_clock(report["wall_sec"])[1:]}, '
+          f'max_parallel {report["max_parallel"] if report["max_parallel"] is not None else "-"}')
+    print('\n=== PHASES ===')
+    for phase, stats in report['phases'].items():
+        avg = stats['avg_parallelism']
+        print(f'  {phase:<10} {_clock(stats["start_sec"])} - {_clock(stats["end_sec"])}  '
+              f'span {stats["span_sec"]:>7.0f}s  busy {stats["busy_sec"]:>7.0f}s  '
+              f'avg {avg if avg is not None else "-":>5}  peak {stats["peak_parallelism"]}  '
+              f'({stats["entries"]} entries)')
+
+    concurrency = report['concurrency']
+    print(f'\n=== CONCURRENCY (peak {concurrency["peak"]}) ===')
+    for time, level in concurrency['curve']:
+        print(f"  {_clock(time)}  {level:>3} {'█' * level}".rstrip())
+    print('  seconds at each level: ' + ', '.join(
+        f'{level}: {seconds:.0f}s' for level, seconds in concurrency['seconds_at'].items()))
+
+    if report['waves']:
+        print('\n=== WAVES ===')
+        for wave in report['waves']:
+            gap = wave['gap_before_sec']
+            print(f'  Wave {wave["wave"]}: tasks {", ".join(map(str, wave["tasks"]))}  '
+                  f'span {wave["span_sec"]:.0f}s  gap before {"-" if gap is None else f"{gap:.0f}s"}  '
+                  f'straggler wait {wave["straggler_wait_sec"]:.0f}s (slowest: task {wave["slowest_task"]})  '
+                  f'barrier delay {wave["barrier_delay_sec"]:.0f}s')
+
+    critical = report['critical_path']
+    if critical['tasks']:
+        print('\n=== CRITICAL PATH ===')
+        print(f'  tasks {" -> ".join(map(str, critical["tasks"]))}: {critical["length_sec"]:.0f}s '
+              f'of {critical["execute_span_sec"]:.0f}s execute span '
+              f'(scheduling overhead {critical["scheduling_overhead_sec"]:.0f}s)')
+
+    retries = report['retries']
+    if retries['tasks']:
+        print('\n=== RETRIES ===')
+        for task in retries['tasks']:
+            print(f'  task {task["task"]}: {task["retries"]} retries, {task["entries"]} entries, '
+                  f'earlier entries {task["earlier_entries_sec"]:.0f}s, '
+                  f'estimated {task["estimated_retry_sec"]:.0f}s')
+        print(f'  total: {retries["earlier_entries_sec"]:.0f}s measured, '
+              f'{retries["estimated_retry_sec"]:.0f}s estimated')
+
+    for warning in report['warnings']:
+        print(f'WARNING: {warning}', file=sys.stderr)
+
+
+def _resolve(path: str) -> str:
+    # Archived cmds (work/archive/) resolve to an extracted copy
+    return cmd_archive.resolve_path(path) or path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Reconstruct a cmd timeline: parallelism, wave gaps, critical path, retry loss',
+    )
+    parser.add_argument(
+        'cmd_dir', nargs='?',
+        help='cmd directory (reads execution_log.yaml, plan.md and the config snapshot)',
+    )
+    parser.add_argument('--log', help='execution_log.yaml (default: <cmd_dir>/execution_log.yaml)')
+    parser.add_argument('--plan', help='plan.md (default: <cmd_dir>/plan.md)')
+    parser.add_argument(
+        '--format', choices=('text', 'json'), default='text',
+        help='text report (default) or one JSON document',
+    )
+    args = parser.parse_args(argv)
+    if not args.cmd_dir and not args.log:
+        parser.error('a cmd directory or --log is required')
+
+    log_path = _resolve(args.log or os.path.join(args.cmd_dir, 'execution_log.yaml'))
+    plan_path = args.plan or (os.path.join(args.cmd_dir, 'plan.md') if args.cmd_dir else None)
+    try:
+        log = yaml_io.load(log_path)
+    except (OSError, yaml_io.YAMLError) as e:
+        print(f'ERROR: Cannot read {log_path}: {e}', file=sys.stderr)
+        return 1
+    if not isinstance(log, dict):
+        print(f'ERROR: {log_path} is not a YAML mapping', file=sys.stderr)
+        return 1
+
+    plan_text = None
+    if plan_path:
+        plan_path = _resolve(plan_path)
+        try:
+            with open(plan_path, encoding='utf-8') as f:
+                plan_text = f.read()
+        except OSError as e:
+            if args.plan:
+                print(f'ERROR: Cannot read {plan_path}: {e}', file=sys.stderr)
+                return 1
+            # No plan.md: timeline and phases only
+
+    # The cmd's merged snapshot, else the project config
+    max_parallel = None
+    try:
+        settings = load_cmd_config(os.path.dirname(log_path) or '.')
+        if settings is None and os.path.exists(DEFAULT_CONFIG_PATH):
+            settings = load_config_file(DEFAULT_CONFIG_PATH)
+        if settings is not None:
+            max_parallel = settings.max_parallel
+    except (OSError, ValueError, yaml_io.YAMLError) as e:
+        print(f'WARNING: Cannot read the cmd config, max_parallel unknown: {e}', file=sys.stderr)
+
+    report = analyze(log, plan_text, max_parallel)
+    if args.format == 'json':
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report, args.cmd_dir or log_path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
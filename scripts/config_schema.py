@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+config_schema.py - Declarative config.yaml schema for claude-crew
+
+Single registry of every known config path (top-level settings,
+retrospect.*, lp_system.*, secretary.*, phase_instructions.*). The registry
+is compiled once into a flat path-indexed table; validate() then checks a
+config tree in one traversal, reporting invalid values and missing
+required fields.
+
+Used by validate_config.py (standalone validation, errors) and
+merge_config.py (merged cmd snapshot, warnings).
+
+Usage:
+  from config_schema import validate, format_violation
+  for v in validate(config):
+      print(format_violation(v))
+"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# ============================================================================
+# Error Code System (from scripts/error_codes.sh)
+# ============================================================================
+
+ERROR_CODES = {
+    "E001": "config.yaml not found → Run: bash scripts/setup.sh",
+    "E002": "config.yaml parse error - invalid YAML → Check YAML syntax with a YAML validator or PyYAML",
+    "E003": "config.yaml missing required field → Run: bash scripts/validate_config.sh to identify missing fields",
+    "E004": "default_model invalid - expected haiku, sonnet, or opus → Edit config.yaml and set default_model appropriately",
+    "E005": "max_parallel out of range - expected 1-20 → Edit config.yaml and set max_parallel to a value between 1 and 20",
+    "E006": "max_retries out of range - expected 0-10 → Edit config.yaml and set max_retries to a value between 0 and 10",
+    "E007": "worker_max_turns out of range - expected 5-100 → Edit config.yaml and set worker_max_turns to a value between 5 and 100",
+    "E008": "background_threshold out of range - expected 1-20 → Edit config.yaml and set background_threshold to a value between 1 and 20",
+    "E009": "retrospect.enabled invalid - expected true or false → Edit config.yaml and set retrospect.enabled to true or false",
+    "E010": "retrospect.model invalid - expected haiku, sonnet, or opus → Edit config.yaml and set retrospect.model appropriately",
+    "E011": "version field missing or invalid - expected semver → Edit config.yaml and set version to format like \"1.0.0\" or \"1.0-rc\"",
+    "E012": "retrospect.filter_threshold invalid - expected number → Edit config.yaml and set retrospect.filter_threshold to a numeric value",
+    "E013": "max_cmd_duration_sec invalid - expected positive integer → Edit config.yaml and set max_cmd_duration_sec to a positive integer or remove it",
+    "E014": "plan_validation invalid - expected true or false → Edit config.yaml and set plan_validation to true or false",
+    "E015": "lp_system setting invalid → Edit config.yaml lp_system section (see Field/expected in details)",
+    "E016": "secretary setting invalid → Edit config.yaml secretary section (see Field/expected in details)",
+    "E017": "retrospect setting invalid → Edit config.yaml retrospect section (see Field/expected in details)",
+    "E018": "phase_instructions entry invalid - expected string → Edit config.yaml and set phase_instructions entries to text or \"\"",
+}
+
+MODELS = ("haiku", "sonnet", "opus")
+
+# ============================================================================
+# Field specs
+# ============================================================================
+
+class Field:
+    """
+    Declarative spec for one config path.
+    kind: 'str' | 'int' | 'number' | 'bool' | 'list' | 'section'
+    """
+
+    __slots__ = ('kind', 'code', 'required', 'nullable', 'choices',
+                 'minimum', 'maximum', 'pattern', 'items')
+
+    def __init__(self, kind: str, code: str, required: bool = False,
+                 nullable: bool = False, choices: Optional[Tuple[Any, ...]] = None,
+                 minimum: Optional[float] = None, maximum: Optional[float] = None,
+                 pattern: Optional[str] = None, items: Optional[str] = None):
+        self.kind = kind
+        self.code = code
+        self.required = required
+        self.nullable = nullable
+        self.choices = choices
+        self.minimum = minimum
+        self.maximum = maximum
+        self.pattern = re.compile(pattern) if pattern else None
+        self.items = items
+
+    def check(self, value: Any) -> bool:
+        """True if value satisfies this spec."""
+        if value is None:
+            return self.nullable
+        if not _KIND_CHECKS[self.kind](value):
+            return False
+        if self.choices is not None and value not in self.choices:
+            return False
+        if self.minimum is not None and value < self.minimum:
+            return False
+        if self.maximum is not None and value > self.maximum:
+            return False
+        if self.pattern is not None and not self.pattern.match(value):
+            return False
+        if self.items is not None and not all(_KIND_CHECKS[self.items](v) for v in value):
+            return False
+        return True
+
+    def expected(self) -> str:
+        """Short human description ('integer 30-50', 'one of haiku, sonnet, opus')."""
+        if self.choices is not None:
+            text = 'one of ' + ', '.join(str(c) for c in self.choices)
+        elif self.kind == 'list' and self.items:
+            text = f'list of {_KIND_NAMES[self.items]}s'
+        else:
+            text = _KIND_NAMES[self.kind]
+            if self.minimum is not None and self.maximum is not None:
+                text += f' {self.minimum}-{self.maximum}'
+            elif self.minimum is not None:
+                text += f' >= {self.minimum}'
+        if self.nullable:
+            text += ' or null'
+        return text
+
+
+def _is_int(v: Any) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+_KIND_CHECKS = {
+    'str': lambda v: isinstance(v, str),
+    'int': _is_int,
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'bool': lambda v: isinstance(v, bool),
+    'list': lambda v: isinstance(v, list),
+    'section': lambda v: isinstance(v, dict),
+}
+
+_KIND_NAMES = {
+    'str': 'string', 'int': 'integer', 'number': 'number',
+    'bool': 'true or false', 'list': 'list', 'section': 'mapping',
+}
+
+# ============================================================================
+# Schema registry (every known config path)
+# ============================================================================
+# Sections must be registered before their fields. A '*' segment matches any
+# key of its section. Fields of an optional section are only required when
+# the section is present.
+
+SCHEMA: Dict[str, Field] = {
+    "version": Field('str', "E011", required=True, pattern=r'^\d+\.\d+(\.\d+)?(-[a-zA-Z0-9.]+)?$'),
+    "default_model": Field('str', "E004", required=True, choices=MODELS),
+    "max_parallel": Field('int', "E005", required=True, minimum=1, maximum=20),
+    "max_retries": Field('int', "E006", required=True, minimum=0, maximum=10),
+    "worker_max_turns": Field('int', "E007", required=True, minimum=5, maximum=100),
+    "background_threshold": Field('int', "E008", minimum=1, maximum=20),
+    "max_cmd_duration_sec": Field('int', "E013", nullable=True, minimum=1),
+    "plan_validation": Field('bool', "E014"),
+
+    "retrospect": Field('section', "E017", required=True),
+    "retrospect.enabled": Field('bool', "E009", required=True),
+    "retrospect.filter_threshold": Field('number', "E012", required=True),
+    "retrospect.model": Field('str', "E010", required=True, choices=MODELS),
+    "retrospect.full_mode": Field('section', "E017"),
+    "retrospect.full_mode.max_improvements": Field('int', "E017", minimum=0),
+    "retrospect.full_mode.max_skills": Field('int', "E017", minimum=0),
+    "retrospect.light_mode": Field('section', "E017"),
+    "retrospect.light_mode.max_skills": Field('int', "E017", minimum=0),
+    "retrospect.memory": Field('section', "E017"),
+    "retrospect.memory.max_candidates_per_cmd": Field('int', "E017", minimum=0),
+    "retrospect.memory.skill_min_score": Field('int', "E017", minimum=3, maximum=15),
+
+    "lp_system": Field('section', "E015"),
+    "lp_system.enabled": Field('bool', "E015"),
+    "lp_system.collect_signals": Field('bool', "E015"),
+    "lp_system.reset_all": Field('bool', "E015"),
+    "lp_system.debug_mode": Field('bool', "E015"),
+    "lp_system.lp_cap": Field('int', "E015", minimum=30, maximum=50),
+    "lp_system.signal_half_life_days": Field('number', "E015", nullable=True, minimum=0),
+    "lp_system.project_scope": Field('str', "E015", nullable=True),
+    "lp_system.technology_stack": Field('list', "E015", nullable=True, items='str'),
+
+    "secretary": Field('section', "E016"),
+    "secretary.enabled": Field('bool', "E016"),
+    "secretary.model": Field('str', "E016", choices=MODELS),
+    "secretary.max_turns": Field('int', "E016", minimum=1, maximum=100),
+    "secretary.fallback_on_failure": Field('bool', "E016"),
+
+    "phase_instructions": Field('section', "E018", nullable=True),
+    "phase_instructions.*": Field('str', "E018", nullable=True),
+}
+
+
+# ============================================================================
+# Compiled validator
+# ============================================================================
+
+class Violation(NamedTuple):
+    """One schema violation. missing=True: required path absent."""
+    code: str
+    path: str
+    value: Any
+    missing: bool = False
+
+
+class CompiledSchema:
+    """
+    Flat path-indexed validator table built from a registry:
+      fields   - path -> Field (exact paths)
+      wildcard - section path -> Field for its '*' children
+      required - required paths grouped by parent section ('' = top level)
+    """
+
+    def __init__(self, registry: Dict[str, Field]):
+        self.fields: Dict[str, Field] = {}
+        self.wildcard: Dict[str, Field] = {}
+        self.required: Dict[str, List[str]] = {}
+        for path, spec in registry.items():
+            parent, _, key = path.rpartition('.')
+            if parent and registry.get(parent) is None:
+                raise ValueError(f'{path}: parent section {parent!r} not registered')
+            if key == '*':
+                self.wildcard[parent] = spec
+                continue
+            self.fields[path] = spec
+            if spec.required:
+                self.required.setdefault(parent, []).append(path)
+
+    def validate(self, config: Dict[str, Any]) -> List[Violation]:
+        """Check a config tree in one traversal. Violations in document order."""
+        violations: List[Violation] = []
+        self._walk(config, '', violations)
+        return violations
+
+    def _walk(self, node: Dict[str, Any], prefix: str, violations: List[Violation]):
+        fields = self.fields
+        wildcard = self.wildcard.get(prefix)
+        for key, value in node.items():
+            path = f'{prefix}.{key}' if prefix else str(key)
+            spec = fields.get(path) or wildcard
+            if spec is None:
+                continue  # unknown keys: merge_config.py typo check
+            if not spec.check(value):
+                violations.append(Violation(spec.code, path, value))
+            elif isinstance(value, dict) and spec.kind == 'section':
+                self._walk(value, path, violations)
+
+        # Required fields of this (present) section
+        for path in self.required.get(prefix, ()):
+            key = path.rpartition('.')[2]
+            if key not in node:
+                violations.append(Violation("E003", path, None, missing=True))
+
+
+_compiled: Optional[CompiledSchema] = None
+
+
+def compiled_schema() -> CompiledSchema:
+    """The compiled SCHEMA registry (built on first use)."""
+    global _compiled
+    if _compiled is None:
+        _compiled = CompiledSchema(SCHEMA)
+    return _compiled
+
+
+def validate(config: Dict[str, Any]) -> List[Violation]:
+    """Validate a config dict against SCHEMA."""
+    return compiled_schema().validate(config)
+
+
+def format_violation(violation: Violation) -> str:
+    """'[E005] <message> (Field: max_parallel, got: 25, expected: integer 1-20)'."""
+    code = violation.code
+    if violation.missing:
+        return f"[{code}] {ERROR_CODES[code]} (Missing: {violation.path})"
+    spec = compiled_schema().fields.get(violation.path)
+    if spec is None:
+        spec = compiled_schema().wildcard[violation.path.rpartition('.')[0]]
+    return (
+        f"[{code}] {ERROR_CODES[code]} "
+        f"(Field: {violation.path}, got: {violation.value!r}, expected: {spec.expected()})"
+    )
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+scripts/crew.py
+Single entry point for the claude-crew Python tools.
+
+Subcommands run in this process and their modules are imported on first
+use, so `crew.py validate-lp` never loads PyYAML and a chain of checks
+pays interpreter startup once:
+
+  python3 scripts/crew.py merge work/cmd_042 \\
+      + validate-config work/cmd_042/config.yaml \\
+      + validate-exec-log work/cmd_042/execution_log.yaml
+
+Subcommands (arguments as for the standalone scripts):
+  merge              merge_config.py
+  validate-config    validate_config.py
+  validate-lp        validate_lp.py
+  validate-exec-log  validate_exec_log.py
+  lp-similarity      lp_similarity.py
+  lp-signals         lp_signals.py
+  lp-profile         lp_profile.py
+  exec-log-stats     exec_log_stats.py
+  cmd-timeline       cmd_timeline.py
+  new-cmd            allocate work/cmd_NNN, create tasks/ and results/,
+                     merge configs (what new_cmd.sh does); prints cmd_NNN
+
+Chains ('+' separates commands) stop at the first command that exits 1;
+--keep-going runs them all.
+
+Usage: python3 scripts/crew.py [--keep-going] <subcommand> [args...] [+ <subcommand> [args...]] ...
+Exit code: 1 if any command failed, else the highest command exit code
+(merge, lp-similarity: 2 = warnings only)
+"""
+
+import os
+import sys
+import shutil
+import importlib
+
+CHAIN_SEPARATOR = '+'
+
+# name -> (module, function); imported lazily. Functions take argv and
+# return or sys.exit() with the exit code.
+SUBCOMMANDS = {
+    'merge': ('merge_config', 'main'),
+    'validate-config': ('validate_config', 'main'),
+    'validate-lp': ('validate_lp', 'main'),
+    'validate-exec-log': ('validate_exec_log', 'main'),
+    'lp-similarity': ('lp_similarity', 'main'),
+    'lp-signals': ('lp_signals', 'main'),
+    'lp-profile': ('lp_profile', 'main'),
+    'exec-log-stats': ('exec_log_stats', 'main'),
+    'cmd-timeline': ('cmd_timeline', 'main'),
+    'new-cmd': ('crew', 'new_cmd_main'),
+}
+
+# Non-zero exit codes that mean "warnings only"; any other non-zero code is
+# reported as 1, and so is an argparse usage error whatever its code
+WARNING_EXIT_CODES = {'merge': 2, 'lp-similarity': 2}
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _error(code, message, context):
+    """Print an error in the error_codes.sh format."""
+    print(f'[{code}] {message} (Context: {context})', file=sys.stderr)
+
+
+def new_cmd_main(argv=None):
+    """new-cmd: create the next cmd directory with merged config snapshots."""
+    if argv:
+        print('Usage: python3 scripts/crew.py new-cmd', file=sys.stderr)
+        return 1
+    import cmd_alloc
+    import merge_config
+
+    work_root = os.path.join(PROJECT_ROOT, 'work')
+    allocated = cmd_alloc.allocate_or_report(work_root)  # E060/E061 printed by cmd_alloc
+    if allocated is None:
+        return 1
+    number, work_dir = allocated
+    name = cmd_alloc.cmd_dir_name(number)
+
+    for sub, error_code, message in (
+        ('tasks', 'E063', 'tasks subdirectory creation failed → Check file system permissions on work/cmd_NNN/ directory'),
+        ('results', 'E064', 'results subdirectory creation failed → Check file system permissions on work/cmd_NNN/ directory'),
+    ):
+        try:
+            os.makedirs(os.path.join(work_dir, sub), exist_ok=True)
+        except OSError:
+            _error(error_code, message, f'work/{name}/{sub}')
+            return 1
+
+    _, merge_exit = merge_config.merge_work_dir(PROJECT_ROOT, work_dir)
+    if merge_exit == 1:
+        _error('E024', 'config merge failed → Check stderr output from merge_config.py for details', name)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        return 1
+    # Exit code 2 = warnings only, proceed normally (warnings already on stderr)
+
+    print(name)
+    return 0
+
+
+def _raised_by_argparse(exc):
+    """True if exc was raised inside argparse (usage error: exit 2)."""
+    argparse = sys.modules.get('argparse')  # not imported: it can't have raised
+    tb = exc.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    return (argparse is not None and tb is not None
+            and tb.tb_frame.f_code.co_filename == argparse.__file__)
+
+
+def run_command(name, args):
+    """Run one subcommand in-process. Returns its exit code."""
+    module_name, function_name = SUBCOMMANDS[name]
+    if module_name == 'crew':
+        module = sys.modules[__name__]
+    else:
+        module = importlib.import_module(module_name)
+    main = getattr(module, function_name)
+
+    prog = sys.argv[0]
+    sys.argv[0] = f'{os.path.basename(prog)} {name}'  # argparse usage lines
+    try:
+        code = main(args)
+    except SystemExit as e:
+        code = 1 if e.code and _raised_by_argparse(e) else e.code
+    finally:
+        sys.argv[0] = prog
+        sys.stdout.flush()
+
+    if code is None:
+        return 0
+    if not isinstance(code, int):
+        print(code, file=sys.stderr)  # sys.exit('message')
+        return 1
+    if code in (0, WARNING_EXIT_CODES.get(name)):
+        return code
+    return 1
+
+
+def split_chain(argv):
+    """['a', 'x', '+', 'b'] -> [['a', 'x'], ['b']]"""
+    commands = [[]]
+    for arg in argv:
+        if arg == CHAIN_SEPARATOR:
+            commands.append([])
+        else:
+            commands[-1].append(arg)
+    return commands
+
+
+def usage():
+    names = ', '.join(SUBCOMMANDS)
+    print('Usage: python3 scripts/crew.py [--keep-going] <subcommand> [args...] '
+          f'[+ <subcommand> [args...]] ...\nSubcommands: {names}', file=sys.stderr)
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    keep_going = False
+    while argv and argv[0].startswith('-'):
+        option = argv.pop(0)
+        if option == '--keep-going':
+            keep_going = True
+        elif option in ('-h', '--help'):
+            print(__doc__.strip())
+            return 0
+        else:
+            usage()
+            return 1
+
+    commands = split_chain(argv)
+    for command in commands:
+        if not command or command[0] not in SUBCOMMANDS:
+            if command:
+                print(f'Unknown subcommand: {command[0]}', file=sys.stderr)
+            usage()
+            return 1
+
+    codes = []
+    for name, *args in commands:
+        code = run_command(name, args)
+        codes.append(code)
+        if code == 1 and not keep_going:
+            break
+
+    # 1 if any command failed, else the highest code (2 = warnings)
+    return 1 if 1 in codes else max(codes)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -23,6 +23,11 @@ declare -A ERROR_MESSAGES=(
   ["E011"]="version field missing or invalid - expected semver → Edit config.yaml and set version to format like \"1.0.0\" or \"1.0-rc\""
   ["E012"]="retrospect.filter_threshold invalid - expected number → Edit config.yaml and set retrospect.filter_threshold to a numeric value"
   ["E013"]="max_cmd_duration_sec invalid - expected positive integer → Edit config.yaml and set max_cmd_duration_sec to a positive integer or remove it"
+  ["E014"]="plan_validation invalid - expected true or false → Edit config.yaml and set plan_validation to true or false"
+  ["E015"]="lp_system setting invalid → Edit config.yaml lp_system section (see Field/expected in details)"
+  ["E016"]="secretary setting invalid → Edit config.yaml secretary section (see Field/expected in details)"
+  ["E017"]="retrospect setting invalid → Edit config.yaml retrospect section (see Field/expected in details)"
+  ["E018"]="phase_instructions entry invalid - expected string → Edit config.yaml and set phase_instructions entries to text or \"\""
 
   # Config merge errors (E020-E039)
   ["E020"]="local/config.yaml parse error - invalid YAML → Check YAML syntax in local/config.yaml"
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+scripts/exec_log_stats.py
+Duration, retry and failure statistics across execution logs.
+
+Streams every execution_log.yaml matched by the targets (work root, cmd
+directories or globs, as validate_exec_log.py --batch) into columnar
+arrays (TaskColumns: one array per field, roles/models/statuses as small
+integer codes), then reports per role, per model and per role+model:
+  tasks         - task entries
+  p50/p95/p99   - duration_sec percentiles (nearest rank) over tasks with
+                  a numeric duration; max
+  retry_rate    - share of tasks with retries > 0 (mean_retries: average)
+  failure_rate  - share of finished tasks (not running/pending/retrying)
+                  with status failure/failed/timeout
+
+Logs in the layout written by the parent session (parent_guide.md
+"実行ログ") are read with a line scanner that only looks at the five
+fields; anything else falls back to a full YAML parse (yaml_io).
+
+Usage:
+  python3 scripts/exec_log_stats.py work/
+  python3 scripts/exec_log_stats.py work/ --format json
+  python3 scripts/exec_log_stats.py 'work/cmd_1*'
+
+Exit code: 0 = success, 1 = no execution log matched
+"""
+
+import re
+import sys
+import json
+import math
+import argparse
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import yaml_io
+from validate_exec_log import iter_exec_log_paths
+
+PERCENTILES = (50, 95, 99)
+FAILED_STATUSES = {'failure', 'failed', 'timeout'}
+UNFINISHED_STATUSES = {'running', 'pending', 'retrying'}
+UNKNOWN = '(none)'
+
+_TASK_FIELDS = ('role', 'model', 'duration_sec', 'retries', 'status')
+_FIELD_INDEX = {field: i for i, field in enumerate(_TASK_FIELDS)}
+_NO_FIELDS = [None] * len(_TASK_FIELDS)
+_NULLS = {'', 'null', 'Null', 'NULL', '~'}
+# Plain scalars YAML reads as booleans (left to the full parse)
+_BOOLEAN_WORDS = {'y', 'n', 'yes', 'no', 'on', 'off', 'true', 'false'}
+# Characters that start YAML constructs the scanner does not handle
+_COMPLEX_START = set('[{|>&*!%@`')
+# Plain scalars starting with these are numbers to YAML 1.1 (0x10, 017, 1:30,
+# .inf, 1e3 as a string...); only plain decimals read the same as float()
+_NUMBER_START = set('0123456789+-.')
+_DECIMAL_RE = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?$')
+_KEY_RE = re.compile(r'([A-Za-z_][\w-]*):(?:\s+(.*))?$')
+
+
+class _Codes:
+    """str <-> small int code table."""
+
+    __slots__ = ('names', 'index')
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def code(self, name: str) -> int:
+        code = self.index.get(name)
+        if code is None:
+            code = self.index[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+class TaskColumns:
+    """
+    Task fields of many logs, one array per field (row i = task i):
+      role, model, status - codes into the roles/models/statuses tables
+      duration            - duration_sec as float, NaN when missing
+      retries             - retries (0 when missing)
+    """
+
+    def __init__(self):
+        self.roles = _Codes()
+        self.models = _Codes()
+        self.statuses = _Codes()
+        self.role = array('H')
+        self.model = array('H')
+        self.status = array('H')
+        self.duration = array('d')
+        self.retries = array('H')
+        self.logs = 0
+        self.fallbacks = 0
+        self.unreadable: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.role)
+
+    def append(self, role: object, model: object, duration: object,
+               retries: object, status: object) -> None:
+        self.role.append(self.roles.code(str(role) if role is not None else UNKNOWN))
+        self.model.append(self.models.code(str(model) if model is not None else UNKNOWN))
+        self.status.append(self.statuses.code(str(status) if status is not None else UNKNOWN))
+        self.duration.append(_as_float(duration))
+        self.retries.append(_as_retries(retries))
+
+    def truncate(self, length: int) -> None:
+        for column in (self.role, self.model, self.status, self.duration, self.retries):
+            del column[length:]
+
+    def add_file(self, path: str) -> None:
+        """Append the tasks of one execution log (unreadable logs are recorded)."""
+        try:
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            self.unreadable.append(path)
+            return
+        self.logs += 1
+        start = len(self)
+        if _scan_tasks(text, self):
+            return
+        self.truncate(start)
+        self.fallbacks += 1
+        try:
+            document = yaml_io.loads(text)
+        except (yaml_io.YAMLError, ImportError):
+            self.unreadable.append(path)
+            return
+        tasks = document.get('tasks') if isinstance(document, dict) else None
+        for task in tasks if isinstance(tasks, list) else []:
+            if isinstance(task, dict):
+                self.append(*(task.get(field) for field in _TASK_FIELDS))
+
+
+def _as_float(value: object) -> float:
+    if isinstance(value, bool):
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return math.nan
+    return math.nan
+
+
+def _as_retries(value: object) -> int:
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return min(value, 0xFFFF)
+    return 0
+
+
+def _scalar(raw: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """(ok, value) for a plain or simply quoted scalar; ok False otherwise."""
+    if raw is None or raw.startswith('#'):
+        return True, None
+    if ' #' in raw:
+        raw = raw.split(' #', 1)[0]
+    raw = raw.rstrip()
+    if raw in _NULLS:
+        return True, None
+    first = raw[0]
+    if first in _COMPLEX_START:
+        return False, None
+    if first in '"\'':
+        if len(raw) < 2 or raw[-1] != first or '\\' in raw or raw.count(first) != 2:
+            return False, None
+        return True, raw[1:-1]
+    if raw.lower() in _BOOLEAN_WORDS:
+        return False, None
+    if first in _NUMBER_START and not _DECIMAL_RE.match(raw):
+        return False, None
+    return True, raw
+
+
+def _scan_tasks(text: str, columns: TaskColumns) -> bool:
+    """
+    Append the tasks of a block-style execution log without building a
+    document. Returns False (possibly after appending) on anything outside
+    that layout; the caller truncates and falls back to yaml_io.
+    """
+    if '\t' in text:
+        return False
+    in_tasks = False
+    item_indent = -1
+    in_item = False
+    values: List[Optional[str]] = list(_NO_FIELDS)  # reused for every task
+    for line in text.splitlines():
+        stripped = line.lstrip(' ')
+        if not stripped or stripped.startswith('#'):
+            continue
+        indent = len(line) - len(stripped)
+        if indent == 0:
+            if in_item:
+                columns.append(*values)
+                in_item = False
+            if stripped.startswith(('---', '...')):
+                return False
+            match = _KEY_RE.match(stripped)
+            if match is None:
+                return False
+            in_tasks = match.group(1) == 'tasks'
+            if in_tasks and match.group(2) and not match.group(2).startswith('#'):
+                return False  # flow sequence or scalar: not the block layout
+            continue
+        if not in_tasks:
+            continue
+        if stripped.startswith('- ') or stripped == '-':
+            if item_indent < 0:
+                item_indent = indent
+            if indent != item_indent:
+                if indent > item_indent + 2:
+                    continue  # nested sequence item (metadata_issues)
+                return False
+            if in_item:
+                columns.append(*values)
+            values[:] = _NO_FIELDS
+            in_item = True
+            stripped = stripped[2:].lstrip(' ')
+            if not stripped:
+                continue
+            indent += 2
+        if not in_item:
+            return False
+        if indent > item_indent + 2:
+            continue  # nested value
+        if indent != item_indent + 2:
+            return False
+        match = _KEY_RE.match(stripped)
+        if match is None:
+            return False
+        index = _FIELD_INDEX.get(match.group(1))
+        if index is not None:
+            ok, value = _scalar(match.group(2))
+            if not ok:
+                return False
+            values[index] = value
+    if in_item:
+        columns.append(*values)
+    return True
+
+
+def percentile(ordered: List[float], p: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list (None if empty)."""
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class _Group:
+    __slots__ = ('tasks', 'durations', 'retried', 'retries', 'finished', 'failed')
+
+    def __init__(self):
+        self.tasks = 0
+        self.durations = array('d')
+        self.retried = 0
+        self.retries = 0
+        self.finished = 0
+        self.failed = 0
+
+    def summary(self) -> Dict[str, object]:
+        ordered = sorted(self.durations)
+        result: Dict[str, object] = {'tasks': self.tasks, 'timed': len(ordered)}
+        for p in PERCENTILES:
+            result[f'p{p}'] = percentile(ordered, p)
+        result['max'] = ordered[-1] if ordered else None
+        result['retry_rate'] = self.retried / self.tasks if self.tasks else None
+        result['mean_retries'] = self.retries / self.tasks if self.tasks else None
+        result['finished'] = self.finished
+        result['failure_rate'] = self.failed / self.finished if self.finished else None
+        return result
+
+
+def group_stats(columns: TaskColumns) -> Dict[str, Dict[str, Dict[str, object]]]:
+    """{'overall': {'all': ...}, 'role': {name: ...}, 'model': ..., 'role_model': ...}"""
+    statuses = columns.statuses.names
+    failed_codes = {i for i, name in enumerate(statuses) if name in FAILED_STATUSES}
+    unfinished_codes = {i for i, name in enumerate(statuses) if name in UNFINISHED_STATUSES}
+    overall = _Group()
+    by_role: Dict[int, _Group] = {}
+    by_model: Dict[int, _Group] = {}
+    by_pair: Dict[Tuple[int, int], _Group] = {}
+    for role, model, status, duration, retries in zip(
+            columns.role, columns.model, columns.status, columns.duration, columns.retries):
+        group_role = by_role.get(role)
+        if group_role is None:
+            group_role = by_role[role] = _Group()
+        group_model = by_model.get(model)
+        if group_model is None:
+            group_model = by_model[model] = _Group()
+        group_pair = by_pair.get((role, model))
+        if group_pair is None:
+            group_pair = by_pair[(role, model)] = _Group()
+        finished = status not in unfinished_codes
+        failed = status in failed_codes
+        for group in (overall, group_role, group_model, group_pair):
+            group.tasks += 1
+            if duration == duration:  # not NaN
+                group.durations.append(duration)
+            if retries:
+                group.retried += 1
+                group.retries += retries
+            if finished:
+                group.finished += 1
+                if failed:
+                    group.failed += 1
+
+    roles, models = columns.roles.names, columns.models.names
+    return {
+        'overall': {'all': overall.summary()},
+        'role': {roles[k]: g.summary() for k, g in sorted(by_role.items(), key=lambda i: roles[i[0]])},
+        'model': {models[k]: g.summary() for k, g in sorted(by_model.items(), key=lambda i: models[i[0]])},
+        'role_model': {f'{roles[r]}/{models[m]}': g.summary() for (r, m), g in
+                       sorted(by_pair.items(), key=lambda i: (roles[i[0][0]], models[i[0][1]]))},
+    }
+
+
+def collect(targets: List[str]) -> TaskColumns:
+    columns = TaskColumns()
+    for path in iter_exec_log_paths(targets):
+        columns.add_file(path)
+    return columns
+
+
+def _cell(value: Optional[float], percent: bool = False) -> str:
+    if value is None:
+        return '-'
+    if percent:
+        return f'{value * 100:.1f}%'
+    return f'{value:g}'
+
+
+def print_table(title: str, rows: Dict[str, Dict[str, object]]) -> None:
+    width = max([len(title)] + [len(name) for name in rows])
+    header = (f'{title:<{width}}  {"tasks":>6}  ' + '  '.join(f'{"p" + str(p):>7}' for p in PERCENTILES)
+              + f'  {"max":>7}  {"retry":>6}  {"fail":>6}')
+    print(header)
+    print('-' * len(header))
+    for name, row in rows.items():
+        print(f'{name:<{width}}  {row["tasks"]:>6}  '
+              + '  '.join(f'{_cell(row[f"p{p}"]):>7}' for p in PERCENTILES)
+              + f'  {_cell(row["max"]):>7}  {_cell(row["retry_rate"], True):>6}'
+              + f'  {_cell(row["failure_rate"], True):>6}')
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Per-role and per-model duration percentiles, retry and failure rates '
+                    'across execution logs',
+    )
+    parser.add_argument(
+        'targets', nargs='+', metavar='DIR_OR_GLOB',
+        help='work root (cmd_*/execution_log.yaml), cmd directory, log file or glob',
+    )
+    parser.add_argument(
+        '--format', choices=('text', 'json'), default='text',
+        help='text tables (default) or one JSON document',
+    )
+    args = parser.parse_args(argv)
+
+    columns = collect(args.targets)
+    if columns.logs == 0:
+        print(f"No execution logs matched: {' '.join(args.targets)}", file=sys.stderr)
+        return 1
+    stats = group_stats(columns)
+
+    if args.format == 'json':
+        print(json.dumps({
+            'logs': columns.logs,
+            'tasks': len(columns),
+            'unreadable': columns.unreadable,
+            **stats,
+        }, ensure_ascii=False, indent=2))
+        return 0
+
+    print(f'=== EXECUTION LOG STATS ({columns.logs} logs, {len(columns)} tasks; '
+          f'durations in seconds) ===\n')
+    print_table('role', stats['role'])
+    print_table('model', stats['model'])
+    print_table('role/model', stats['role_model'])
+    print_table('overall', stats['overall'])
+    for path in columns.unreadable:
+        print(f'WARNING: Cannot read {path}', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+scripts/lp_profile.py
+LP profile analyzer: one JSON document for the pruning review at lp_cap and
+the milestone Aggregate Profile Review (parent_guide.md "LP System
+Operations").
+
+Streams an LP export once (validate_lp.iter_json_entities) and keeps only
+counters and a K-entry heap, whatever the export size:
+  clusters           - per cluster: entity and observation counts and
+                       histograms (observations per entity, observation
+                       length, days since [meta] Last reinforced, scope)
+  scope              - [scope] of each LP classified against
+                       lp_system.project_scope / technology_stack:
+                       universal, project, technology (per stack entry),
+                       other, missing
+  pruning_candidates - the K weakest LPs, weakest first, with reasons
+
+Weakness score: days since Last reinforced / STALE_DAYS (1.0 when never
+recorded), +0.5 when no observation has the [what] [evidence] [scope]
+[action] structure; ties go to the LP with fewer observations.
+
+Usage:
+  python3 scripts/lp_profile.py --file lp_export.json
+  python3 scripts/lp_profile.py --file lp_export.json --top 5 --technology TypeScript
+
+Exit code: 0 = success, 1 = input or config error
+"""
+
+import os
+import re
+import sys
+import json
+import heapq
+import argparse
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from validate_lp import (
+    ALLOWED_CLUSTERS, MAX_OBSERVATION_LENGTH, iter_json_entities, parse_observation,
+    validate_naming_convention,
+)
+
+STALE_DAYS = 60
+MALFORMED_PENALTY = 0.5
+DEFAULT_TOP = 10
+DEFAULT_LP_CAP = 40
+REVIEW_MILESTONES = (10, 20, 30)
+
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.yaml")
+
+_REINFORCED_RE = re.compile(r"last reinforced:?\s*(\d{4}-\d{2}-\d{2})", re.IGNORECASE)
+_UNIVERSAL_SCOPES = ("universal", "general", "全般", "汎用")
+_SCOPE_CATEGORIES = ("universal", "project", "technology", "other", "missing")
+
+# Histogram buckets: (upper bounds, labels); a value v falls in the first
+# bucket whose bound exceeds it
+_PER_ENTITY_BUCKETS = ((1, 2, 3, 4), ("0", "1", "2", "3", "4+"))
+_LENGTH_BUCKETS = ((100, 200, 300, 400, MAX_OBSERVATION_LENGTH + 1),
+                   ("0-99", "100-199", "200-299", "300-399",
+                    f"400-{MAX_OBSERVATION_LENGTH}", "over_limit"))
+_AGE_BUCKETS = ((30, STALE_DAYS, 90), ("0-29", f"30-{STALE_DAYS - 1}", f"{STALE_DAYS}-89", "90+"))
+
+
+def _bucket(buckets: Tuple[Tuple[int, ...], Tuple[str, ...]], value: int) -> str:
+    bounds, labels = buckets
+    return labels[bisect_right(bounds, value)]
+
+
+def _histogram(buckets: Tuple[Tuple[int, ...], Tuple[str, ...]], *extra: str) -> Dict[str, int]:
+    return dict.fromkeys(buckets[1] + extra, 0)
+
+
+class ScopeClassifier:
+    """Classifies a lower-cased [scope] text against the project context."""
+
+    def __init__(self, project_scope: str = "", technology_stack: Optional[List[str]] = None):
+        self.project_tokens = [t for t in re.split(r"[\s_\-/]+", project_scope.lower()) if t]
+        self.technologies = [(t, t.lower()) for t in technology_stack or [] if t]
+
+    def classify(self, scope_text: Optional[str]) -> Tuple[str, List[str]]:
+        """(category, matched technologies)"""
+        if not scope_text:
+            return "missing", []
+        if scope_text.startswith(_UNIVERSAL_SCOPES):
+            return "universal", []
+        if self.project_tokens and all(t in scope_text for t in self.project_tokens):
+            return "project", []
+        matched = [name for name, lower in self.technologies if lower in scope_text]
+        if matched:
+            return "technology", matched
+        return "other", []
+
+
+class _Weakness:
+    """Heap entry; a < b when a is the stronger (less prunable) LP."""
+
+    __slots__ = ('score', 'observations', 'name', 'record')
+
+    def __init__(self, score: float, observations: int, name: str, record: Dict):
+        self.score = score
+        self.observations = observations
+        self.name = name
+        self.record = record
+
+    def __lt__(self, other: '_Weakness') -> bool:
+        if self.score != other.score:
+            return self.score < other.score
+        if self.observations != other.observations:
+            return self.observations > other.observations
+        return self.name > other.name
+
+
+class LPProfile:
+    """Streaming accumulator for the profile document."""
+
+    def __init__(self, today: date, classifier: ScopeClassifier, top: int = DEFAULT_TOP):
+        self.today = today
+        self.classifier = classifier
+        self.top = top
+        self.clusters = {cluster: self._empty_cluster() for cluster in sorted(ALLOWED_CLUSTERS)}
+        self.scope: Dict[str, object] = dict.fromkeys(_SCOPE_CATEGORIES, 0)
+        self.scope["technology"] = {name: 0 for name, _ in classifier.technologies}
+        self.lp_count = 0
+        self.observations = 0
+        self.skipped = {"internal": 0, "invalid": 0}
+        self._weakest: List[_Weakness] = []
+
+    @staticmethod
+    def _empty_cluster() -> Dict[str, object]:
+        return {
+            "entities": 0,
+            "observations": 0,
+            "observations_per_entity": _histogram(_PER_ENTITY_BUCKETS),
+            "observation_length": _histogram(_LENGTH_BUCKETS),
+            "last_reinforced_days": _histogram(_AGE_BUCKETS, "unknown"),
+            "scope": dict.fromkeys(_SCOPE_CATEGORIES, 0),
+        }
+
+    def add_entity(self, entity: object) -> None:
+        name = entity.get("name") if isinstance(entity, dict) else None
+        if not isinstance(name, str) or not validate_naming_convention(name)[0]:
+            self.skipped["invalid"] += 1
+            return
+        cluster = name.split(":")[1]
+        if cluster == "_internal":
+            self.skipped["internal"] += 1
+            return
+        observations = entity.get("observations")
+        if not isinstance(observations, list):
+            observations = []
+
+        stats = self.clusters[cluster]
+        reinforced: Optional[date] = None
+        scope_text: Optional[str] = None
+        well_formed = False
+        count = 0
+        for observation in observations:
+            if not isinstance(observation, str):
+                continue
+            count += 1
+            stats["observation_length"][_bucket(_LENGTH_BUCKETS, len(observation))] += 1
+            for match in _REINFORCED_RE.finditer(observation):
+                try:
+                    day = date.fromisoformat(match.group(1))
+                except ValueError:
+                    continue
+                if reinforced is None or day > reinforced:
+                    reinforced = day
+            parsed = parse_observation(observation)
+            well_formed = well_formed or parsed.sections is not None
+            if scope_text is None:
+                scope_text = parsed.scope_text
+
+        self.lp_count += 1
+        self.observations += count
+        stats["entities"] += 1
+        stats["observations"] += count
+        stats["observations_per_entity"][_bucket(_PER_ENTITY_BUCKETS, count)] += 1
+
+        age = (self.today - reinforced).days if reinforced is not None else None
+        stats["last_reinforced_days"][
+            _bucket(_AGE_BUCKETS, max(age, 0)) if age is not None else "unknown"] += 1
+
+        category, technologies = self.classifier.classify(scope_text)
+        stats["scope"][category] += 1
+        if category == "technology":
+            for technology in technologies:
+                self.scope["technology"][technology] += 1
+        else:
+            self.scope[category] += 1
+
+        self._rank(name, count, reinforced, age, well_formed)
+
+    def _rank(self, name: str, count: int, reinforced: Optional[date],
+              age: Optional[int], well_formed: bool) -> None:
+        if self.top <= 0:
+            return
+        score = max(age, 0) / STALE_DAYS if age is not None else 1.0
+        if not well_formed:
+            score += MALFORMED_PENALTY
+        score = round(score, 3)
+        heap = self._weakest
+        if len(heap) >= self.top:
+            # Cheap reject before building the record: not weaker than the strongest kept
+            if not heap[0] < _Weakness(score, count, name, {}):
+                return
+
+        reasons = []
+        if age is None:
+            reasons.append("never reinforced ([meta] Last reinforced missing)")
+        elif age >= STALE_DAYS:
+            reasons.append(f"stale: last reinforced {age} days ago")
+        if not well_formed:
+            reasons.append("no [what] [evidence] [scope] [action] observation")
+        if count <= 1:
+            reasons.append("single observation" if count else "no observations")
+        record = {
+            "name": name,
+            "score": score,
+            "last_reinforced": reinforced.isoformat() if reinforced else None,
+            "age_days": age,
+            "observations": count,
+            "reasons": reasons,
+        }
+        entry = _Weakness(score, count, name, record)
+        if len(heap) < self.top:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heapreplace(heap, entry)
+
+    def pruning_candidates(self) -> List[Dict]:
+        """Weakest first."""
+        return [entry.record for entry in sorted(self._weakest, reverse=True)]
+
+    def document(self, lp_cap: int, project_scope: str, technology_stack: List[str]) -> Dict:
+        return {
+            "today": self.today.isoformat(),
+            "lp_count": self.lp_count,
+            "lp_cap": lp_cap,
+            "at_cap": self.lp_count >= lp_cap,
+            "milestone": self.lp_count if self.lp_count in REVIEW_MILESTONES else None,
+            "observations": self.observations,
+            "project_scope": project_scope,
+            "technology_stack": technology_stack,
+            "clusters": self.clusters,
+            "scope": self.scope,
+            "pruning_candidates": self.pruning_candidates(),
+            "skipped": self.skipped,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Profile an LP export: cluster histograms, scope breakdown, pruning candidates",
+    )
+    parser.add_argument(
+        "--file",
+        required=True,
+        help="LP export (JSON array, single object or JSON Lines)"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        metavar="K",
+        help=f"Number of pruning candidates (default: {DEFAULT_TOP})"
+    )
+    parser.add_argument(
+        "--config",
+        default=DEFAULT_CONFIG_PATH,
+        help="config.yaml or cmd snapshot for lp_cap, project_scope and technology_stack "
+             "(default: project config.yaml)"
+    )
+    parser.add_argument(
+        "--project-scope",
+        help="Override lp_system.project_scope"
+    )
+    parser.add_argument(
+        "--technology",
+        action="append",
+        help="Override lp_system.technology_stack (repeatable)"
+    )
+    parser.add_argument(
+        "--today",
+        type=date.fromisoformat,
+        metavar="YYYY-MM-DD",
+        help="Date staleness is measured against (default: today)"
+    )
+    args = parser.parse_args(argv)
+    if args.top < 0:
+        parser.error("--top must be >= 0")
+
+    lp_cap, project_scope, technology_stack = DEFAULT_LP_CAP, "", []
+    if os.path.exists(args.config):
+        from cmd_config import load_config_file
+        try:
+            config = load_config_file(args.config)
+        except Exception as e:  # OSError, ValueError, yaml_io.YAMLError
+            print(f"ERROR: Cannot read {args.config}: {e}", file=sys.stderr)
+            return 1
+        lp_cap = config.get_int("lp_system.lp_cap", DEFAULT_LP_CAP)
+        project_scope = config.get_str("lp_system.project_scope") or ""
+        stack = config.get("lp_system.technology_stack")
+        technology_stack = [t for t in stack if isinstance(t, str)] if isinstance(stack, list) else []
+    if args.project_scope is not None:
+        project_scope = args.project_scope
+    if args.technology is not None:
+        technology_stack = args.technology
+
+    profile = LPProfile(args.today or date.today(),
+                        ScopeClassifier(project_scope, technology_stack), args.top)
+    try:
+        for entity in iter_json_entities(args.file):
+            profile.add_entity(entity)
+    except FileNotFoundError:
+        print(f"ERROR: File not found: {args.file}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"ERROR: Invalid JSON in file: {e}", file=sys.stderr)
+        return 1
+
+    print(json.dumps(profile.document(lp_cap, project_scope, technology_stack),
+                     ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
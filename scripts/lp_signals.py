@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+scripts/lp_signals.py
+Signal-log accumulator for the LP N>=3 rule.
+
+Reads lp:_internal:signal_log observations in one streaming pass (format
+from templates/retrospector.md):
+
+  [topic] {cluster}:{topic} [counter] {X.X} [last_updated] {date}
+  [signals] {history} [sessions] {N} [first_signal] {date}
+
+Each observation is the state of its topic as of [last_updated]; when a
+topic appears more than once (an old observation was not deleted), the
+most recently updated one wins. Counters decay with a configurable
+half-life (lp_system.signal_half_life_days; 0 = no decay). Topics at
+counter >= 3.0 are LP candidates, HIGH priority at >= 4.0 (parent_guide.md
+"LP System Operations"), listed HIGH first, then by counter.
+
+--rollup prints the compacted signal log instead: one observation per
+topic with the decayed counter and the last SIGNAL_HISTORY_MAX [signals]
+entries; topics decayed below ROLLUP_MIN_COUNTER are dropped, and below
+the candidate threshold only the top ROLLUP_MAX_TOPICS are kept.
+Observations that don't parse are carried over unchanged (and reported on
+stderr), so a rollup never loses data it could not read.
+
+Usage:
+  python3 scripts/lp_signals.py --file lp_export.json
+  python3 scripts/lp_signals.py --file lp_export.json --half-life 30 --format json
+  python3 scripts/lp_signals.py --file lp_export.json --rollup > signal_log.json
+
+--file takes what validate_lp.py --file takes (JSON array, object or JSON
+Lines); only lp:_internal:signal_log entities are read.
+Exit code: 0 = success, 1 = input or config error
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import argparse
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from validate_lp import ALLOWED_CLUSTERS, iter_json_entities
+
+SIGNAL_LOG_NAME = "lp:_internal:signal_log"
+CANDIDATE_THRESHOLD = 3.0
+HIGH_PRIORITY_THRESHOLD = 4.0
+ROLLUP_MAX_TOPICS = 100
+ROLLUP_MIN_COUNTER = 0.1
+SIGNAL_HISTORY_MAX = 5
+
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.yaml")
+
+_FIELD_TAGS = ("topic", "counter", "last_updated", "signals", "sessions", "first_signal")
+_FIELD_RE = re.compile(r"\[(" + "|".join(_FIELD_TAGS) + r")\]")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_HISTORY_SPLIT = re.compile(r"\s*[,;]\s*")
+_EARLIER_RE = re.compile(r"^\(\+(\d+) earlier\)$")
+
+
+def parse_fields(observation: str) -> Dict[str, str]:
+    """'[topic] a:b [counter] 1.7 ...' -> {'topic': 'a:b', 'counter': '1.7', ...}"""
+    fields: Dict[str, str] = {}
+    parts = _FIELD_RE.split(observation)  # [prefix, tag, value, tag, value, ...]
+    for i in range(1, len(parts), 2):
+        fields.setdefault(parts[i], parts[i + 1].strip())
+    return fields
+
+
+def _parse_date(text: Optional[str]) -> Optional[date]:
+    match = _DATE_RE.search(text or "")
+    if not match:
+        return None
+    try:
+        return date.fromisoformat(match.group(0))
+    except ValueError:
+        return None
+
+
+class TopicState:
+    """Latest known state of one signal-log topic."""
+
+    __slots__ = ('topic', 'counter', 'last_updated', 'first_signal', 'sessions', 'signals')
+
+    def __init__(self, topic: str, counter: float, last_updated: Optional[date],
+                 first_signal: Optional[date], sessions: int, signals: str):
+        self.topic = topic
+        self.counter = counter
+        self.last_updated = last_updated
+        self.first_signal = first_signal
+        self.sessions = sessions
+        self.signals = signals
+
+    @property
+    def name(self) -> str:
+        return f"lp:{self.topic}"
+
+    @property
+    def cluster(self) -> str:
+        return self.topic.split(":", 1)[0]
+
+
+class SignalAccumulator:
+    """
+    Folds signal-log observations into one TopicState per topic. Memory is
+    one record per distinct topic, whatever the number of observations.
+    """
+
+    def __init__(self, today: date, half_life_days: float = 0.0):
+        self.today = today
+        self.half_life_days = half_life_days
+        self.topics: Dict[str, TopicState] = {}
+        self.observations = 0
+        self.malformed: List[object] = []  # as read, for the rollup
+
+    def add(self, observation: str) -> bool:
+        """Ingest one observation. Returns False (and records it) if malformed."""
+        self.observations += 1
+        fields = parse_fields(observation)
+        topic = fields.get("topic", "")
+        if topic.startswith("lp:"):
+            topic = topic[3:]
+        cluster, _, name = topic.partition(":")
+        try:
+            counter = float(fields.get("counter", ""))
+        except ValueError:
+            counter = math.nan
+        if cluster not in ALLOWED_CLUSTERS or not name or not math.isfinite(counter):
+            self.malformed.append(observation)
+            return False
+
+        last_updated = _parse_date(fields.get("last_updated"))
+        first_signal = _parse_date(fields.get("first_signal"))
+        sessions_text = fields.get("sessions", "")
+        sessions = int(sessions_text) if sessions_text.isdigit() else 0
+
+        current = self.topics.get(topic)
+        if current is not None:
+            if first_signal is None or (current.first_signal is not None
+                                        and current.first_signal < first_signal):
+                first_signal = current.first_signal
+            if (current.last_updated or date.min) > (last_updated or date.min):
+                current.first_signal = first_signal
+                return True  # an older state of a topic already seen
+        self.topics[topic] = TopicState(topic, max(counter, 0.0), last_updated,
+                                        first_signal, sessions, fields.get("signals", ""))
+        return True
+
+    def add_entity(self, entity: object) -> None:
+        """Ingest every observation of a signal-log entity (other entities ignored)."""
+        if not isinstance(entity, dict) or entity.get("name") != SIGNAL_LOG_NAME:
+            return
+        observations = entity.get("observations")
+        if isinstance(observations, list):
+            for observation in observations:
+                if isinstance(observation, str):
+                    self.add(observation)
+                else:
+                    self.observations += 1
+                    self.malformed.append(observation)
+
+    def decayed(self, state: TopicState) -> float:
+        """Counter of state as of today."""
+        if self.half_life_days <= 0 or state.last_updated is None:
+            return state.counter
+        age = (self.today - state.last_updated).days
+        if age <= 0:
+            return state.counter
+        return state.counter * 0.5 ** (age / self.half_life_days)
+
+    def counters(self) -> Iterator[Tuple[float, TopicState]]:
+        for state in self.topics.values():
+            yield self.decayed(state), state
+
+    def candidates(self) -> List[Tuple[str, float, TopicState]]:
+        """(priority, counter, state) at counter >= 3.0: HIGH first, then by counter."""
+        ranked = []
+        for counter, state in self.counters():
+            if counter >= CANDIDATE_THRESHOLD:
+                priority = "HIGH" if counter >= HIGH_PRIORITY_THRESHOLD else "MEDIUM"
+                ranked.append((priority, counter, state))
+        ranked.sort(key=lambda c: (c[0] != "HIGH", -c[1], c[2].topic))
+        return ranked
+
+    def rollup(self) -> List[object]:
+        """
+        Compacted signal-log observations, highest counter first. Candidates
+        are always kept; other topics fill up to ROLLUP_MAX_TOPICS. Malformed
+        observations follow, unchanged.
+        """
+        ranked = sorted(((counter, state) for counter, state in self.counters()
+                         if counter >= ROLLUP_MIN_COUNTER),
+                        key=lambda c: (-c[0], c[1].topic))
+        candidates = sum(1 for counter, _ in ranked if counter >= CANDIDATE_THRESHOLD)
+        kept = ranked[:max(candidates, ROLLUP_MAX_TOPICS)]
+        return [self._observation(counter, state) for counter, state in kept] + self.malformed
+
+    def _observation(self, counter: float, state: TopicState) -> str:
+        # Rounded down, so repeated rollups never push a topic over a threshold
+        counter = math.floor(counter * 100 + 1e-9) / 100
+        last_updated = state.last_updated
+        if counter != state.counter and self.half_life_days > 0:
+            last_updated = self.today  # decayed counter is as of today
+        parts = [f"[topic] {state.topic}", f"[counter] {counter:g}"]
+        if last_updated is not None:
+            parts.append(f"[last_updated] {last_updated.isoformat()}")
+        parts.append(f"[signals] {_bounded_history(state.signals)}")
+        parts.append(f"[sessions] {state.sessions}")
+        if state.first_signal is not None:
+            parts.append(f"[first_signal] {state.first_signal.isoformat()}")
+        return " ".join(parts)
+
+
+def _bounded_history(history: str) -> str:
+    """Last SIGNAL_HISTORY_MAX entries of a [signals] list, with a count of the rest."""
+    entries = [e for e in _HISTORY_SPLIT.split(history) if e]
+    earlier = 0
+    if entries:
+        match = _EARLIER_RE.match(entries[0])
+        if match:
+            earlier = int(match.group(1))
+            entries = entries[1:]
+    if len(entries) <= SIGNAL_HISTORY_MAX:
+        return history if not earlier else ", ".join([f"(+{earlier} earlier)"] + entries)
+    earlier += len(entries) - SIGNAL_HISTORY_MAX
+    return ", ".join([f"(+{earlier} earlier)"] + entries[-SIGNAL_HISTORY_MAX:])
+
+
+def configured_half_life(config_path: str) -> float:
+    """lp_system.signal_half_life_days from a config file (0 if unset or missing)."""
+    if not os.path.exists(config_path):
+        return 0.0
+    from cmd_config import load_config_file
+    value = load_config_file(config_path).get_float("lp_system.signal_half_life_days")
+    return value if value is not None and value > 0 else 0.0
+
+
+def warn_malformed(accumulator: SignalAccumulator, action: str) -> None:
+    for observation in accumulator.malformed:
+        text = observation if isinstance(observation, str) else json.dumps(observation)
+        print(f"WARNING: Malformed signal-log observation {action}: {text}", file=sys.stderr)
+
+
+def report(accumulator: SignalAccumulator, report_format: str) -> None:
+    candidates = accumulator.candidates()
+    high = sum(1 for c in candidates if c[0] == "HIGH")
+    summary = {
+        "observations": accumulator.observations,
+        "topics": len(accumulator.topics),
+        "candidates": len(candidates),
+        "high": high,
+        "medium": len(candidates) - high,
+        "malformed": len(accumulator.malformed),
+        "half_life_days": accumulator.half_life_days,
+    }
+
+    if report_format == "json":
+        for priority, counter, state in candidates:
+            print(json.dumps({
+                "name": state.name,
+                "priority": priority,
+                "counter": round(counter, 2),
+                "sessions": state.sessions,
+                "last_updated": state.last_updated.isoformat() if state.last_updated else None,
+                "signals": state.signals,
+            }, ensure_ascii=False))
+        print(json.dumps({"summary": summary}))
+        return
+
+    decay = (f"half-life {accumulator.half_life_days:g} days" if accumulator.half_life_days
+             else "no decay")
+    print(f"=== LP CANDIDATES (counter >= {CANDIDATE_THRESHOLD}, {decay}) ===")
+    if not candidates:
+        print("  (none)")
+    for priority, counter, state in candidates:
+        last = state.last_updated.isoformat() if state.last_updated else "?"
+        print(f"  {priority:<6} {counter:5.2f}  {state.name}  "
+              f"(sessions {state.sessions}, last updated {last})")
+    warn_malformed(accumulator, "skipped")
+    print(f"\n=== SUMMARY ===")
+    print(f"Topics: {summary['topics']}, Candidates: {summary['candidates']} "
+          f"(HIGH: {summary['high']}, MEDIUM: {summary['medium']}), "
+          f"Malformed: {summary['malformed']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Accumulate LP signal-log counters and list LP candidates",
+    )
+    parser.add_argument(
+        "--file",
+        required=True,
+        help="LP export containing lp:_internal:signal_log (JSON array, single object or JSON Lines)"
+    )
+    parser.add_argument(
+        "--half-life",
+        type=float,
+        metavar="DAYS",
+        help="Counter half-life in days, 0 = no decay "
+             "(default: lp_system.signal_half_life_days from --config)"
+    )
+    parser.add_argument(
+        "--config",
+        default=DEFAULT_CONFIG_PATH,
+        help="config.yaml or cmd snapshot to read the half-life from (default: project config.yaml)"
+    )
+    parser.add_argument(
+        "--today",
+        type=date.fromisoformat,
+        metavar="YYYY-MM-DD",
+        help="Date counters are decayed to (default: today)"
+    )
+    parser.add_argument(
+        "--rollup",
+        action="store_true",
+        help="Print the compacted signal-log entity (JSON) instead of the candidate list"
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Candidate report format: text (default) or JSON lines with a summary line"
+    )
+    args = parser.parse_args(argv)
+
+    half_life = args.half_life
+    if half_life is None:
+        try:
+            half_life = configured_half_life(args.config)
+        except Exception as e:  # OSError, ValueError, yaml_io.YAMLError
+            print(f"ERROR: Cannot read {args.config}: {e}", file=sys.stderr)
+            return 1
+    if not math.isfinite(half_life) or half_life < 0:
+        parser.error("--half-life must be a finite number >= 0")
+
+    accumulator = SignalAccumulator(args.today or date.today(), half_life)
+    try:
+        for entity in iter_json_entities(args.file):
+            accumulator.add_entity(entity)
+    except FileNotFoundError:
+        print(f"ERROR: File not found: {args.file}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"ERROR: Invalid JSON in file: {e}", file=sys.stderr)
+        return 1
+
+    if args.rollup:
+        warn_malformed(accumulator, "kept unchanged")
+        print(json.dumps({
+            "name": SIGNAL_LOG_NAME,
+            "entityType": "lp_internal",
+            "observations": accumulator.rollup(),
+        }, ensure_ascii=False, indent=2))
+        return 0
+
+    report(accumulator, args.format)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+scripts/lp_similarity.py
+Near-duplicate detection for LP (Learned Preference) entities.
+
+Each observation's [what] and [action] sections (validate_lp.py's
+ParsedObservation) are shingled into 5-byte substrings and MinHashed
+(one hash per shingle, 64 bins); LSH banding buckets the signatures so
+only observations sharing a band are compared (exact Jaccard on the
+shingle sets), which keeps the scan roughly linear in the number of
+observations instead of all pairs.
+lp:_internal:* entities are skipped.
+
+Usage:
+  python3 scripts/lp_similarity.py --file lp_export.json
+      Near-duplicate pairs, grouped within a cluster (lp:defaults:* vs
+      lp:defaults:*) and across clusters
+  python3 scripts/lp_similarity.py --file lp_export.json \\
+      --candidate "lp:defaults:strict_ts" "[what] ... [evidence] ... [scope] ... [action] ..."
+      Existing LPs the candidate duplicates (an existing entity with the
+      candidate's name is an update, not a duplicate)
+
+--file takes what validate_lp.py --file takes (JSON array, object or JSON Lines).
+Exit code: pairs mode 0 = none found, 2 = near-duplicates found (warnings);
+candidate mode 0 = no duplicate, 1 = duplicates an existing LP; 1 on input or usage errors
+"""
+
+import sys
+import json
+import re
+import argparse
+from hashlib import blake2b
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from validate_lp import ParsedObservation, iter_json_entities
+
+SHINGLE_BYTES = 5
+NUM_BINS = 64   # MinHash signature length (one-permutation hashing)
+LSH_BANDS = 16  # 4 bins per band: pairs near Jaccard (1/16)^(1/4) = 0.5 become candidates
+DEFAULT_THRESHOLD = 0.6
+
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_BIN_MASK = NUM_BINS - 1
+_DENSIFY_OFFSET = 1 << (64 - _BIN_BITS)  # above any bin value
+_ROWS_PER_BAND = NUM_BINS // LSH_BANDS
+_NON_WORD = re.compile(r'\W+')
+
+
+def similarity_text(observation) -> str:
+    """[what] + [action] of an observation (the whole text if its tags are malformed)."""
+    parsed = observation if isinstance(observation, ParsedObservation) else ParsedObservation(observation)
+    if parsed.sections is None:
+        return parsed.text
+    return f"{parsed.sections[0]} {parsed.sections[3]}"
+
+
+def shingles(text: str) -> Set[int]:
+    """64-bit hashes of every SHINGLE_BYTES-byte substring of the normalized text."""
+    data = ' '.join(_NON_WORD.split(text.lower())).strip().encode('utf-8')
+    if len(data) > SHINGLE_BYTES:
+        pieces = {data[i:i + SHINGLE_BYTES] for i in range(len(data) - SHINGLE_BYTES + 1)}
+    else:
+        pieces = {data} if data else set()
+    return {int.from_bytes(blake2b(piece, digest_size=8).digest(), 'little') for piece in pieces}
+
+
+def minhash(shingle_set: Set[int]) -> Tuple[int, ...]:
+    """
+    MinHash signature (NUM_BINS values) of a non-empty shingle set, with one
+    hash per shingle: the low bits pick a bin, each bin keeps its minimum.
+    Empty bins borrow the nearest filled bin to their right (circular),
+    offset by the distance, so equal signatures still mean equal minima.
+    """
+    bins: List[Optional[int]] = [None] * NUM_BINS
+    for h in shingle_set:
+        j = h & _BIN_MASK
+        value = h >> _BIN_BITS
+        current = bins[j]
+        if current is None or value < current:
+            bins[j] = value
+    if None not in bins:
+        return tuple(bins)
+
+    signature = list(bins)
+    nearest, distance = 0, 0
+    for j in range(2 * NUM_BINS - 1, -1, -1):
+        value = bins[j & _BIN_MASK]
+        if value is not None:
+            nearest, distance = value, 0
+            continue
+        distance += 1
+        if j < NUM_BINS:
+            signature[j] = nearest + distance * _DENSIFY_OFFSET
+    return tuple(signature)
+
+
+def _bands(signature: Tuple[int, ...]) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+    for band in range(LSH_BANDS):
+        start = band * _ROWS_PER_BAND
+        yield band, signature[start:start + _ROWS_PER_BAND]
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def cluster_of(name: str) -> str:
+    """'lp:defaults:typescript' -> 'defaults'"""
+    parts = name.split(":")
+    return parts[1] if len(parts) >= 3 else ""
+
+
+class IndexedObservation:
+    """One indexed observation: entity name, cluster, 1-based position, text, shingles."""
+
+    __slots__ = ('name', 'cluster', 'number', 'text', 'shingles')
+
+    def __init__(self, name: str, number: int, text: str, shingle_set: Set[int]):
+        self.name = name
+        self.cluster = cluster_of(name)
+        self.number = number
+        self.text = text
+        self.shingles = shingle_set
+
+
+# (similarity, a, b) with a.name < b.name
+SimilarPair = Tuple[float, IndexedObservation, IndexedObservation]
+
+
+class SimilarityIndex:
+    """MinHash/LSH index over LP observations ([what] + [action])."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.observations: List[IndexedObservation] = []
+        self.entities: Set[str] = set()
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self.pairs_checked = 0
+
+    def add_entity(self, entity: Dict) -> None:
+        """Index the observations of an LP entity (lp:_internal:* and malformed ones skipped)."""
+        name = entity.get("name")
+        observations = entity.get("observations")
+        if not isinstance(name, str) or name.startswith("lp:_internal:") \
+                or not isinstance(observations, list):
+            return
+        self.entities.add(name)
+        for number, observation in enumerate(observations, 1):
+            if isinstance(observation, str):
+                self.add(name, number, observation)
+
+    def add(self, name: str, number: int, observation: str) -> None:
+        shingle_set = shingles(similarity_text(observation))
+        if not shingle_set:
+            return
+        ref = len(self.observations)
+        self.observations.append(IndexedObservation(name, number, observation, shingle_set))
+        for key in _bands(minhash(shingle_set)):
+            self.buckets.setdefault(key, []).append(ref)
+
+    def pairs(self) -> List[SimilarPair]:
+        """
+        Most similar observation pair per pair of entities at or above the
+        threshold, most similar first.
+        """
+        seen: Set[Tuple[int, int]] = set()
+        best: Dict[Tuple[str, str], SimilarPair] = {}
+        observations = self.observations
+        for refs in self.buckets.values():
+            for i, ref_a in enumerate(refs):
+                a = observations[ref_a]
+                for ref_b in refs[i + 1:]:
+                    b = observations[ref_b]
+                    if a.name == b.name or (ref_a, ref_b) in seen:
+                        continue
+                    seen.add((ref_a, ref_b))
+                    similarity = jaccard(a.shingles, b.shingles)
+                    if similarity < self.threshold:
+                        continue
+                    first, second = (a, b) if a.name < b.name else (b, a)
+                    key = (first.name, second.name)
+                    if key not in best or similarity > best[key][0]:
+                        best[key] = (similarity, first, second)
+        self.pairs_checked = len(seen)
+        return sorted(best.values(), key=lambda p: (-p[0], p[1].name, p[2].name))
+
+    def query(self, name: str, observation: str) -> List[Tuple[float, IndexedObservation]]:
+        """
+        Indexed observations of other entities that the observation
+        near-duplicates (best match per entity), most similar first.
+        """
+        shingle_set = shingles(similarity_text(observation))
+        if not shingle_set:
+            return []
+        refs: Set[int] = set()
+        for key in _bands(minhash(shingle_set)):
+            refs.update(self.buckets.get(key, ()))
+        self.pairs_checked = len(refs)
+        best: Dict[str, Tuple[float, IndexedObservation]] = {}
+        for ref in refs:
+            other = self.observations[ref]
+            if other.name == name:
+                continue
+            similarity = jaccard(shingle_set, other.shingles)
+            if similarity >= self.threshold and (
+                    other.name not in best or similarity > best[other.name][0]):
+                best[other.name] = (similarity, other)
+        return sorted(best.values(), key=lambda m: (-m[0], m[1].name))
+
+
+def build_index(filepath: str, threshold: float) -> SimilarityIndex:
+    """Index every LP entity of an export. Raises OSError, ValueError."""
+    index = SimilarityIndex(threshold)
+    for entity in iter_json_entities(filepath):
+        if isinstance(entity, dict):
+            index.add_entity(entity)
+    return index
+
+
+def _label(observation: IndexedObservation) -> str:
+    return f"{observation.name} #{observation.number}"
+
+
+def _pair_json(similarity: float, a: IndexedObservation, b: IndexedObservation) -> Dict:
+    return {
+        "similarity": round(similarity, 3),
+        "scope": "within" if a.cluster == b.cluster else "across",
+        "a": {"name": a.name, "observation": a.number},
+        "b": {"name": b.name, "observation": b.number},
+    }
+
+
+def report_pairs(index: SimilarityIndex, report_format: str) -> int:
+    pairs = index.pairs()
+    within = [p for p in pairs if p[1].cluster == p[2].cluster]
+    across = [p for p in pairs if p[1].cluster != p[2].cluster]
+    summary = {
+        "entities": len(index.entities),
+        "observations": len(index.observations),
+        "pairs_checked": index.pairs_checked,
+        "within": len(within),
+        "across": len(across),
+    }
+
+    if report_format == "json":
+        for pair in within + across:
+            print(json.dumps(_pair_json(*pair), ensure_ascii=False))
+        print(json.dumps({"summary": summary}))
+    else:
+        print(f"=== NEAR-DUPLICATE LPs (Jaccard >= {index.threshold:.2f}, [what] + [action]) ===")
+        for title, group in (("Within cluster", within), ("Across clusters", across)):
+            print(f"\n{title}:")
+            if not group:
+                print("  (none)")
+            for similarity, a, b in group:
+                clusters = "" if a.cluster == b.cluster else f"  ({a.cluster} / {b.cluster})"
+                print(f"  {similarity:.2f}  {_label(a)}  ~  {_label(b)}{clusters}")
+        print(f"\n=== SUMMARY ===")
+        print(f"Entities: {summary['entities']}, Observations: {summary['observations']}, "
+              f"Pairs checked: {summary['pairs_checked']}, "
+              f"Within cluster: {summary['within']}, Across clusters: {summary['across']}")
+
+    return 2 if pairs else 0
+
+
+def report_candidate(index: SimilarityIndex, name: str, observation: str, report_format: str) -> int:
+    matches = index.query(name, observation)
+
+    if report_format == "json":
+        print(json.dumps({
+            "name": name,
+            "duplicate": bool(matches),
+            "matches": [{
+                "similarity": round(similarity, 3),
+                "scope": "within" if other.cluster == cluster_of(name) else "across",
+                "name": other.name,
+                "observation": other.number,
+            } for similarity, other in matches],
+        }, ensure_ascii=False))
+    elif matches:
+        print(f"✗ DUPLICATE: {name}", file=sys.stderr)
+        for similarity, other in matches:
+            print(f"  - {similarity:.2f} {_label(other)}: {other.text}", file=sys.stderr)
+    else:
+        print(f"✓ UNIQUE: {name}")
+
+    return 1 if matches else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Find near-duplicate LP entities (MinHash/LSH over [what] + [action])",
+    )
+    parser.add_argument(
+        "--file",
+        required=True,
+        help="LP export (JSON array, single object or JSON Lines)"
+    )
+    parser.add_argument(
+        "--candidate",
+        nargs=2,
+        metavar=("NAME", "OBSERVATION"),
+        help="Check one LP candidate against the export instead of listing pairs"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Minimum Jaccard similarity of the shingle sets (default: {DEFAULT_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Report format: text (default) or JSON lines"
+    )
+    try:
+        args = parser.parse_args(argv)
+        if not 0.0 < args.threshold <= 1.0:
+            parser.error("--threshold must be in (0, 1]")
+    except SystemExit as e:
+        # 2 means near-duplicates found; argparse exits 2 on usage errors
+        return 0 if e.code == 0 else 1
+
+    try:
+        index = build_index(args.file, args.threshold)
+    except FileNotFoundError:
+        print(f"ERROR: File not found: {args.file}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"ERROR: Invalid JSON in file: {e}", file=sys.stderr)
+        return 1
+
+    if args.candidate:
+        name, observation = args.candidate
+        return report_candidate(index, name, observation, args.format)
+    return report_pairs(index, args.format)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
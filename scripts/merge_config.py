@@ -4,26 +4,41 @@ scripts/merge_config.py
 Merge config.yaml with local/config.yaml overrides.
 Output merged result to work/cmd_NNN/ directory.
 
-Usage: python3 scripts/merge_config.py <work_dir>
+Usage: python3 scripts/merge_config.py <work_dir> [<work_dir> ...]
+       python3 scripts/merge_config.py --stdin [--summary-json] < dirs.txt
 Example: python3 scripts/merge_config.py work/cmd_042
 
-Exit codes:
+Exit codes (per work dir; batch runs exit 1 if any dir failed, else the max):
   0 = success
   1 = fatal error (base config missing, parse error)
   2 = success with validation warnings (warnings printed to stderr)
+
+Batch mode parses base/local configs once and fans the snapshot out to
+every work dir; --summary-json prints per-dir exit codes as JSON.
+
+Merged snapshots are content-addressed: outputs are cached under
+work/.config_cache/ keyed by a hash of the input files plus this script,
+and reused (hardlinked, or copied across filesystems) when nothing changed.
 """
 
 import sys
 import os
+import io
 import copy
 import stat
+import json
+import shutil
+import argparse
+import hashlib
+import tempfile
+import contextlib
+
+import yaml_io
+import config_schema
+import permission_matcher
 
-# --- YAML handling (conditional import) ---
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+# --- YAML handling (PyYAML is optional and imported lazily by yaml_io) ---
+HAS_YAML = yaml_io.available()
 
 
 # ---------------------------------------------------------------------------
@@ -38,13 +53,19 @@ def deep_merge(base, overlay):
     - Scalars: overlay wins
     - None value in overlay: clears the key (sets to None)
     Returns new dict (does not mutate base).
+
+    Copy-on-write: only dicts on a path the overlay touches are copied;
+    every other subtree (and every overlay value) is shared with the
+    inputs. Treat the result as read-only below the top level, or
+    copy.deepcopy() it before mutating nested values.
     """
-    result = copy.deepcopy(base)
+    result = dict(base)
     for key, value in overlay.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
+        current = result.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            result[key] = deep_merge(current, value)
         else:
-            result[key] = copy.deepcopy(value)
+            result[key] = value
     return result
 
 
@@ -86,10 +107,24 @@ def expand_dot_notation(data):
 # Validation
 # ---------------------------------------------------------------------------
 
-def levenshtein(s1, s2):
-    """Compute Levenshtein distance between two strings."""
+# Maximum edit distance for "Did you mean" suggestions
+TYPO_MAX_DISTANCE = 2
+
+# Cap on suggestions pointing at other nesting levels (common names such as
+# 'model' or 'enabled' exist in several sections)
+MAX_MISPLACED_SUGGESTIONS = 5
+
+
+def levenshtein(s1, s2, max_dist=None):
+    """
+    Compute Levenshtein distance between two strings.
+    With max_dist, stop as soon as the distance is known to exceed it
+    and return max_dist + 1.
+    """
     if len(s1) < len(s2):
-        return levenshtein(s2, s1)
+        return levenshtein(s2, s1, max_dist)
+    if max_dist is not None and len(s1) - len(s2) > max_dist:
+        return max_dist + 1
     if len(s2) == 0:
         return len(s1)
     prev_row = range(len(s2) + 1)
@@ -100,78 +135,130 @@ def levenshtein(s1, s2):
             deletions = curr_row[j] + 1
             substitutions = prev_row[j] + (c1 != c2)
             curr_row.append(min(insertions, deletions, substitutions))
+        if max_dist is not None and min(curr_row) > max_dist:
+            return max_dist + 1
         prev_row = curr_row
+    if max_dist is not None and prev_row[-1] > max_dist:
+        return max_dist + 1
     return prev_row[-1]
 
 
-def validate_keys_recursive(base, overlay, path=''):
+def _deletes(word, max_dist):
+    """All strings obtainable from word by deleting up to max_dist characters."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_dist):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+class KeySuggestionIndex:
+    """
+    Typo suggestion index over every key path of a base config.
+
+    Deletion-neighbourhood (SymSpell-style) table: two keys within edit
+    distance d share a string reachable from each by at most d deletions,
+    so a lookup only runs the bounded levenshtein() on keys whose deletion
+    variants collide with the query's, instead of on every known key.
+    Keys are indexed by name with all the paths they occur at, which lets
+    suggestions point at keys placed at the wrong nesting level.
+    """
+
+    def __init__(self, base, root_path='', max_dist=TYPO_MAX_DISTANCE):
+        self.max_dist = max_dist
+        self.parents = {}    # key name -> [parent path, ...] ('' = top level)
+        self.variants = {}   # deletion variant -> {key name, ...}
+        self._add(base, root_path)
+
+    def _add(self, node, path):
+        for key, value in node.items():
+            name = str(key)
+            parents = self.parents.setdefault(name, [])
+            if not parents:
+                for variant in _deletes(name, self.max_dist):
+                    self.variants.setdefault(variant, set()).add(name)
+            parents.append(path)
+            if isinstance(value, dict):
+                self._add(value, f'{path}.{name}' if path else name)
+
+    def similar_names(self, name):
+        """Known key names within max_dist of name, closest first."""
+        candidates = set()
+        for variant in _deletes(name, self.max_dist):
+            candidates.update(self.variants.get(variant, ()))
+        scored = []
+        for known in candidates:
+            dist = levenshtein(name, known, self.max_dist)
+            if dist <= self.max_dist:
+                scored.append((dist, known))
+        scored.sort()
+        return [known for _, known in scored]
+
+    def suggest(self, name, path):
+        """
+        Suggestions for unknown key `name` found under `path`.
+        Similar sibling keys come first as bare names (as before); similar
+        keys at other nesting levels follow as full dotted paths.
+        """
+        siblings = []
+        misplaced = []
+        for known in self.similar_names(name):
+            for parent in self.parents[known]:
+                if parent == path:
+                    if known != name:
+                        siblings.append(known)
+                else:
+                    misplaced.append(f'{parent}.{known}' if parent else known)
+        return siblings + misplaced[:MAX_MISPLACED_SUGGESTIONS]
+
+
+def validate_keys_recursive(base, overlay, path='', index=None):
     """
     Recursively check that all keys in overlay exist in base.
+    index: KeySuggestionIndex for base; built on the first unknown key
+    when omitted, so clean overlays never pay for it.
     Returns list of warning strings.
     """
     warnings = []
-    base_keys = set(base.keys()) if isinstance(base, dict) else set()
-
     if not isinstance(overlay, dict):
         return warnings
-
-    for key in overlay:
-        full_path = f'{path}.{key}' if path else key
-        if key not in base_keys:
-            candidates = []
-            for known in base_keys:
-                dist = levenshtein(str(key), str(known))
-                if dist <= 2:
-                    candidates.append(known)
-            if candidates:
-                suggestions = ', '.join(candidates)
-                warnings.append(
-                    f"Unknown key '{full_path}'. Did you mean: {suggestions}?"
-                )
-            else:
-                warnings.append(f"Unknown key '{full_path}' (not in base config)")
-        elif isinstance(base.get(key), dict) and isinstance(overlay[key], dict):
-            warnings.extend(
-                validate_keys_recursive(base[key], overlay[key], full_path)
-            )
-
+    if not isinstance(base, dict):
+        base = {}
+
+    lazy_index = [index]
+
+    def suggestion_index():
+        if lazy_index[0] is None:
+            lazy_index[0] = KeySuggestionIndex(base, root_path=path)
+        return lazy_index[0]
+
+    def walk(base_node, overlay_node, node_path):
+        for key in overlay_node:
+            full_path = f'{node_path}.{key}' if node_path else key
+            if key not in base_node:
+                candidates = suggestion_index().suggest(str(key), node_path)
+                if candidates:
+                    suggestions = ', '.join(candidates)
+                    warnings.append(
+                        f"Unknown key '{full_path}'. Did you mean: {suggestions}?"
+                    )
+                else:
+                    warnings.append(f"Unknown key '{full_path}' (not in base config)")
+            elif isinstance(base_node[key], dict) and isinstance(overlay_node[key], dict):
+                walk(base_node[key], overlay_node[key], full_path)
+
+    walk(base, overlay, path)
     return warnings
 
 
 def validate_bounds(merged):
     """
-    Check value bounds for known numeric/enum fields.
-    Returns list of warning strings.
+    Check the merged config against the shared schema (config_schema.py):
+    value bounds, enums and types for every known path, plus required
+    fields. Returns list of warning strings.
     """
-    warnings = []
-
-    model = merged.get('default_model')
-    if model and model not in ('haiku', 'sonnet', 'opus'):
-        warnings.append(
-            f"default_model '{model}' not in (haiku, sonnet, opus)"
-        )
-
-    mp = merged.get('max_parallel')
-    if mp is not None and (not isinstance(mp, int) or mp < 1 or mp > 20):
-        warnings.append(f"max_parallel {mp} out of range (1-20)")
-
-    wmt = merged.get('worker_max_turns')
-    if wmt is not None and (not isinstance(wmt, int) or wmt < 5 or wmt > 100):
-        warnings.append(f"worker_max_turns {wmt} out of range (5-100)")
-
-    mr = merged.get('max_retries')
-    if mr is not None and (not isinstance(mr, int) or mr < 0 or mr > 10):
-        warnings.append(f"max_retries {mr} out of range (0-10)")
-
-    retro = merged.get('retrospect', {})
-    if isinstance(retro, dict):
-        rm = retro.get('model')
-        if rm and rm not in ('haiku', 'sonnet', 'opus'):
-            warnings.append(
-                f"retrospect.model '{rm}' not in (haiku, sonnet, opus)"
-            )
-
-    return warnings
+    return [config_schema.format_violation(v) for v in config_schema.validate(merged)]
 
 
 # ---------------------------------------------------------------------------
@@ -180,19 +267,34 @@ def validate_bounds(merged):
 
 def merge_yaml_configs(project_root, work_dir):
     """
-    Merge config.yaml + local/config.yaml -> work_dir/config.yaml.
+    Merge config.yaml + local/config.yaml -> work_dir/config.yaml, plus a
+    canonical JSON snapshot work_dir/config.json (see scripts/cmd_config.py).
     Injects _merged_from canary field into output.
+    Reuses a cached snapshot when inputs are unchanged.
     Returns (success: bool, exit_code: int).
     """
     base_path = os.path.join(project_root, 'config.yaml')
     local_path = os.path.join(project_root, 'local', 'config.yaml')
-    out_path = os.path.join(work_dir, 'config.yaml')
 
     # Base config must exist
     if not os.path.exists(base_path):
         print('[E001] config.yaml not found → Run: bash scripts/setup.sh', file=sys.stderr)
         return False, 1
 
+    return _cached_snapshot(
+        project_root, work_dir, 'config',
+        [base_path, local_path], ['config.yaml', 'config.json'],
+        lambda out_dir: _merge_yaml_configs(base_path, local_path, out_dir),
+    )
+
+
+def _merge_yaml_configs(base_path, local_path, out_dir):
+    """
+    Uncached body of merge_yaml_configs(); writes out_dir/config.yaml and,
+    when PyYAML can parse the result, out_dir/config.json.
+    """
+    out_path = os.path.join(out_dir, 'config.yaml')
+
     # No local override: copy base verbatim with canary
     if not os.path.exists(local_path):
         with open(base_path, 'r') as f:
@@ -202,6 +304,16 @@ def merge_yaml_configs(project_root, work_dir):
             f.write('# _merged_from: base\n')
             f.write(content)
         _make_readonly(out_path)
+
+        # JSON snapshot needs a parse; without PyYAML (or with a base that
+        # does not parse) readers fall back to config.yaml
+        if HAS_YAML:
+            try:
+                base = yaml_io.load(base_path)
+            except yaml_io.YAMLError:
+                base = None
+            if isinstance(base, dict):
+                _write_json_snapshot(dict(base, _merged_from='base'), out_dir)
         return True, 0
 
     # PyYAML not available but local exists: copy base with warning
@@ -221,16 +333,14 @@ def merge_yaml_configs(project_root, work_dir):
 
     # Load both files
     try:
-        with open(base_path, 'r') as f:
-            base = yaml.safe_load(f) or {}
-    except yaml.YAMLError as e:
+        base = yaml_io.load(base_path) or {}
+    except yaml_io.YAMLError as e:
         print(f'[E002] config.yaml parse error - invalid YAML → Check YAML syntax with a YAML validator or PyYAML (Details: {e})', file=sys.stderr)
         return False, 1
 
     try:
-        with open(local_path, 'r') as f:
-            local = yaml.safe_load(f) or {}
-    except yaml.YAMLError as e:
+        local = yaml_io.load(local_path) or {}
+    except yaml_io.YAMLError as e:
         print(f'[E020] local/config.yaml parse error - invalid YAML → Check YAML syntax in local/config.yaml (Details: {e})', file=sys.stderr)
         return False, 1
 
@@ -267,19 +377,33 @@ def merge_yaml_configs(project_root, work_dir):
     with open(out_path, 'w') as f:
         f.write('# Merged config: config.yaml + local/config.yaml\n')
         f.write('# Generated at cmd start. Do not edit.\n')
-        yaml.dump(
-            merged, f,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-        )
+        yaml_io.dump(merged, f)
 
     _make_readonly(out_path)
+    _write_json_snapshot(merged, out_dir)
 
     exit_code = 2 if has_warnings else 0
     return True, exit_code
 
 
+def _write_json_snapshot(config, out_dir):
+    """
+    Write out_dir/config.json: compact, canonical (sorted keys) JSON of the
+    effective config, so readers need only the json module.
+    Non-JSON scalars (e.g. YAML dates) are stored as strings.
+    """
+    out_path = os.path.join(out_dir, 'config.json')
+    with open(out_path, 'w') as f:
+        json.dump(
+            config, f,
+            sort_keys=True,
+            separators=(',', ':'),
+            ensure_ascii=False,
+            default=str,
+        )
+    _make_readonly(out_path)
+
+
 # ---------------------------------------------------------------------------
 # Permission-config.yaml merge (reference copy to work dir)
 # ---------------------------------------------------------------------------
@@ -362,10 +486,41 @@ def merge_permission_configs(base, local):
     return result
 
 
+def compile_permission_matcher(config):
+    """
+    Compile a permission config into the permission-matcher.json document.
+    The security floor is added again here so the matcher enforces it even
+    for snapshots written without a local merge (base copy, E027).
+    """
+    always_set = _safe_set_from(config.get('always_ask', [])) | SECURITY_FLOOR_ALWAYS_ASK
+    sub_set = _safe_set_from(config.get('subcommand_ask', [])) | SECURITY_FLOOR_SUBCOMMAND_ASK
+    interpreters = config.get('interpreters')
+    return permission_matcher.compile_matcher(
+        always_set, sub_set,
+        interpreters if isinstance(interpreters, dict) else {},
+        config.get('_merged_from'),
+    )
+
+
+def _write_permission_snapshot(config, out_dir):
+    """Write out_dir/permission-config.yaml and its compiled matcher."""
+    out_path = os.path.join(out_dir, 'permission-config.yaml')
+    with open(out_path, 'w') as f:
+        yaml_io.dump(config, f)
+    _make_readonly(out_path)
+
+    matcher_path = os.path.join(out_dir, permission_matcher.MATCHER_FILE)
+    with open(matcher_path, 'w') as f:
+        json.dump(compile_permission_matcher(config), f, sort_keys=True, separators=(',', ':'))
+    _make_readonly(matcher_path)
+
+
 def merge_permission_configs_yaml(project_root, work_dir):
     """
     Merge .claude/permission-config.yaml + local/hooks/permission-config.yaml
-    -> work_dir/permission-config.yaml (reference snapshot).
+    -> work_dir/permission-config.yaml (reference snapshot) and
+    work_dir/permission-matcher.json (compiled lookup, see permission_matcher.py).
+    Reuses a cached snapshot when inputs are unchanged.
 
     Note: The permission-guard plugin reads config at runtime.
     This snapshot is for reproducibility/debugging only.
@@ -376,7 +531,6 @@ def merge_permission_configs_yaml(project_root, work_dir):
     local_path = os.path.join(
         project_root, 'local', 'hooks', 'permission-config.yaml'
     )
-    out_path = os.path.join(work_dir, 'permission-config.yaml')
 
     # Base not found: not fatal (hook has hardcoded defaults)
     if not os.path.exists(base_path):
@@ -394,28 +548,39 @@ def merge_permission_configs_yaml(project_root, work_dir):
         )
         return True, 0
 
+    return _cached_snapshot(
+        project_root, work_dir, 'permission',
+        [base_path, local_path], ['permission-config.yaml', permission_matcher.MATCHER_FILE],
+        lambda out_dir: _merge_permission_configs_yaml(
+            base_path, local_path, out_dir
+        ),
+    )
+
+
+def _merge_permission_configs_yaml(base_path, local_path, out_dir):
+    """Uncached body of merge_permission_configs_yaml()."""
+
     # No local override: copy base with canary
     if not os.path.exists(local_path):
-        with open(base_path, 'r') as f:
-            base = yaml.safe_load(f) or {}
+        try:
+            base = dict(yaml_io.load(base_path) or {})
+        except yaml_io.YAMLError as e:
+            print(f'[E025] permission-config.yaml parse error → Check YAML syntax in .claude/permission-config.yaml (Details: {e})', file=sys.stderr)
+            return False, 1
         base['_merged_from'] = 'base'
-        with open(out_path, 'w') as f:
-            yaml.dump(base, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-        _make_readonly(out_path)
+        _write_permission_snapshot(base, out_dir)
         return True, 0
 
     # Load and merge
     try:
-        with open(base_path, 'r') as f:
-            base = yaml.safe_load(f) or {}
-    except yaml.YAMLError as e:
+        base = yaml_io.load(base_path) or {}
+    except yaml_io.YAMLError as e:
         print(f'[E025] permission-config.yaml parse error → Check YAML syntax in .claude/permission-config.yaml (Details: {e})', file=sys.stderr)
         return False, 1
 
     try:
-        with open(local_path, 'r') as f:
-            local = yaml.safe_load(f) or {}
-    except yaml.YAMLError as e:
+        local = yaml_io.load(local_path) or {}
+    except yaml_io.YAMLError as e:
         print(f'[E026] local permission-config.yaml parse error → Check YAML syntax in local/hooks/permission-config.yaml (Details: {e})', file=sys.stderr)
         return False, 1
 
@@ -424,19 +589,263 @@ def merge_permission_configs_yaml(project_root, work_dir):
             f'[E027] permission-config.yaml must be YAML mapping → Edit permission-config.yaml to use key-value format',
             file=sys.stderr,
         )
-        base['_merged_from'] = 'base'
-        with open(out_path, 'w') as f:
-            yaml.dump(base, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-        _make_readonly(out_path)
+        _write_permission_snapshot(dict(base, _merged_from='base'), out_dir)
         return True, 0
 
     merged = merge_permission_configs(base, local)
+    _write_permission_snapshot(merged, out_dir)
+    return True, 0
 
-    with open(out_path, 'w') as f:
-        yaml.dump(merged, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
-    _make_readonly(out_path)
-    return True, 0
+# ---------------------------------------------------------------------------
+# Snapshot cache (content-addressed)
+# ---------------------------------------------------------------------------
+
+CACHE_DIR_NAME = '.config_cache'
+
+# Cache entries kept after an insert (least recently used are pruned).
+# cmds that hardlinked a pruned entry keep their copy.
+CACHE_MAX_ENTRIES = 32
+
+# Source files whose content is part of every cache key: a change to the
+# merge code invalidates all previously cached snapshots.
+_FINGERPRINT_SOURCES = [
+    os.path.abspath(__file__),
+    os.path.abspath(yaml_io.__file__),
+    os.path.abspath(config_schema.__file__),
+    os.path.abspath(permission_matcher.__file__),
+]
+_code_fingerprint_value = None
+
+# In-process memos for batch runs. Input keys are reused while the input
+# files' stat signatures are unchanged; served snapshots let every work dir
+# after the first skip hashing, digest verification and warning replay.
+_input_keys = {}         # (kind, input paths) -> (stat signature, key)
+_served_snapshots = {}   # key -> (source dir, meta)
+
+
+def _code_fingerprint():
+    """Hash of the merge code (computed once per process)."""
+    global _code_fingerprint_value
+    if _code_fingerprint_value is None:
+        h = hashlib.sha256()
+        for path in _FINGERPRINT_SOURCES:
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        _code_fingerprint_value = h.hexdigest()
+    return _code_fingerprint_value
+
+
+def _snapshot_key(kind, input_paths):
+    """
+    Content hash of a snapshot's inputs.
+    Covers kind, merge code, PyYAML availability and the bytes of each
+    input file (a missing file hashes differently from an empty one).
+    """
+    h = hashlib.sha256()
+    h.update(f'{kind}\0{_code_fingerprint()}\0yaml={int(HAS_YAML)}'.encode())
+    for path in input_paths:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            h.update(b'\0missing')
+            continue
+        h.update(b'\0%d\0' % len(data))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _stat_signature(paths):
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+        signature.append((st.st_ino, st.st_size, st.st_mtime_ns))
+    return tuple(signature)
+
+
+def _input_key(kind, input_paths):
+    """_snapshot_key(), memoized on the inputs' stat signature."""
+    memo_id = (kind, tuple(input_paths))
+    signature = _stat_signature(input_paths)
+    cached = _input_keys.get(memo_id)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    key = _snapshot_key(kind, input_paths)
+    _input_keys[memo_id] = (signature, key)
+    return key
+
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _read_cache_entry(entry_dir):
+    """
+    Return meta dict for a complete, untampered cache entry, else None.
+    Outputs are hardlinked into cmd dirs, so verify their digests before
+    handing them out again.
+    """
+    try:
+        with open(os.path.join(entry_dir, 'meta.json'), 'r') as f:
+            meta = json.load(f)
+        for name, digest in meta['digests'].items():
+            if _file_digest(os.path.join(entry_dir, name)) != digest:
+                return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return meta
+
+
+def _publish_outputs(source, work_dir, outputs, produced):
+    """
+    Link the produced outputs from source into work_dir and remove stale
+    copies of outputs this snapshot does not have (e.g. an old config.json).
+    """
+    for name in outputs:
+        dst = os.path.join(work_dir, name)
+        if name in produced:
+            _link_or_copy(os.path.join(source, name), dst)
+        elif os.path.lexists(dst):
+            os.unlink(dst)
+
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst (replacing dst); copy if linking is impossible."""
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+        _make_readonly(dst)
+
+
+class _Tee(io.TextIOBase):
+    """Write-through text stream that also records what was written."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = io.StringIO()
+
+    def write(self, s):
+        self.buffer.write(s)
+        return self.stream.write(s)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _prune_cache(cache_root, keep=CACHE_MAX_ENTRIES):
+    """Drop all but the `keep` most recently used cache entries."""
+    try:
+        entries = [
+            e for e in os.scandir(cache_root)
+            if e.is_dir() and not e.name.startswith('.')
+        ]
+    except OSError:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    for e in entries[keep:]:
+        shutil.rmtree(e.path, ignore_errors=True)
+
+
+def _cached_snapshot(project_root, work_dir, kind, input_paths, outputs, build):
+    """
+    Produce `outputs` in work_dir, reusing a cached read-only snapshot.
+
+    build(out_dir) writes the output files into out_dir and returns
+    (success, exit_code); `outputs` lists every file it may produce. Warnings it prints to stderr are recorded with
+    the snapshot and replayed on cache hits, so a hit is indistinguishable
+    from a fresh merge (within one batch run they are shown only once).
+    Failed builds are never cached.
+    Returns (success: bool, exit_code: int).
+    """
+    key = _input_key(kind, input_paths)
+
+    # Already served in this process: just link
+    served = _served_snapshots.get(key)
+    if served is not None:
+        source, meta = served
+        if all(os.path.exists(os.path.join(source, n)) for n in meta['digests']):
+            _publish_outputs(source, work_dir, outputs, meta['digests'])
+            return True, meta['exit_code']
+
+    cache_root = os.path.join(project_root, 'work', CACHE_DIR_NAME)
+    entry_dir = os.path.join(cache_root, key)
+
+    # Hit: no YAML parse or dump, just link the snapshot into place
+    meta = _read_cache_entry(entry_dir)
+    if meta is not None:
+        try:
+            os.utime(entry_dir)  # Mark as recently used for pruning
+        except OSError:
+            pass
+        sys.stderr.write(meta['stderr'])
+        _publish_outputs(entry_dir, work_dir, outputs, meta['digests'])
+        _served_snapshots[key] = (entry_dir, meta)
+        return True, meta['exit_code']
+
+    # Miss: build into a staging dir, then publish it as the cache entry
+    try:
+        os.makedirs(cache_root, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.staging-', dir=cache_root)
+    except OSError:
+        staging = None  # Cache unavailable: merge directly into work_dir
+
+    try:
+        out_dir = staging or work_dir
+        if staging is None:
+            # Never write through a hardlink into a shared snapshot
+            for name in outputs:
+                if os.path.lexists(os.path.join(work_dir, name)):
+                    os.unlink(os.path.join(work_dir, name))
+        tee = _Tee(sys.stderr)
+        with contextlib.redirect_stderr(tee):
+            ok, code = build(out_dir)
+        if not ok:
+            return ok, code
+
+        meta = {
+            'kind': kind,
+            'exit_code': code,
+            'stderr': tee.buffer.getvalue(),
+            'digests': {
+                name: _file_digest(os.path.join(out_dir, name))
+                for name in outputs
+                if os.path.exists(os.path.join(out_dir, name))
+            },
+        }
+        if staging is None:
+            _served_snapshots[key] = (work_dir, meta)
+            return True, code
+
+        with open(os.path.join(staging, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+
+        if os.path.isdir(entry_dir):
+            # Stale or tampered entry left behind: replace it
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        try:
+            os.rename(staging, entry_dir)
+            _prune_cache(cache_root)
+        except OSError:
+            pass  # Lost a publish race; the winner's entry is checked below
+
+        source = staging
+        if _read_cache_entry(entry_dir) is not None:
+            source = entry_dir
+            _served_snapshots[key] = (entry_dir, meta)
+        _publish_outputs(source, work_dir, outputs, meta['digests'])
+        return True, code
+    finally:
+        if staging is not None and os.path.isdir(staging):
+            shutil.rmtree(staging, ignore_errors=True)
 
 
 # ---------------------------------------------------------------------------
@@ -455,43 +864,97 @@ def _make_readonly(path):
 # Main
 # ---------------------------------------------------------------------------
 
-def main():
-    if len(sys.argv) < 2:
-        print(
-            'Usage: python3 scripts/merge_config.py <work_dir>',
-            file=sys.stderr,
-        )
-        sys.exit(1)
-
-    work_dir = sys.argv[1]
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-
+def merge_work_dir(project_root, work_dir):
+    """
+    Merge config.yaml and permission-config.yaml into one work dir.
+    Returns (work_dir: resolved path or None if not found, exit_code: int).
+    """
     # Ensure work_dir exists
     if not os.path.isdir(work_dir):
         work_dir = os.path.join(project_root, work_dir)
         if not os.path.isdir(work_dir):
             print(f'[E060] work directory not found → Work directory should be created automatically, check file system permissions (Path: {work_dir})', file=sys.stderr)
-            sys.exit(1)
+            return None, 1
 
     max_exit = 0
 
     # Merge config.yaml
     ok, code = merge_yaml_configs(project_root, work_dir)
     if not ok:
-        sys.exit(1)
+        return work_dir, 1
     max_exit = max(max_exit, code)
 
     # Merge permission-config.yaml (reference snapshot)
     ok, code = merge_permission_configs_yaml(project_root, work_dir)
     if not ok:
-        sys.exit(1)
+        return work_dir, 1
     max_exit = max(max_exit, code)
 
-    # Print merged config path to stdout (for callers to capture)
-    print(os.path.join(work_dir, 'config.yaml'))
+    return work_dir, max_exit
+
+
+def _batch_exit_code(codes):
+    """1 if any work dir failed, else the highest per-dir code (0 or 2)."""
+    if 1 in codes:
+        return 1
+    return max(codes, default=0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Merge config.yaml with local/config.yaml overrides into cmd work dirs',
+    )
+    parser.add_argument(
+        'work_dirs', nargs='*', metavar='work_dir',
+        help='cmd work directory (e.g. work/cmd_042); several for batch mode',
+    )
+    parser.add_argument(
+        '--stdin', action='store_true',
+        help='also read work directories from stdin, one per line',
+    )
+    parser.add_argument(
+        '--summary-json', action='store_true',
+        help='print a JSON summary with per-dir exit codes instead of config paths',
+    )
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        # Keep the 0/1/2 exit-code contract (argparse exits 2 on usage errors)
+        sys.exit(0 if e.code == 0 else 1)
+
+    work_dirs = list(args.work_dirs)
+    if args.stdin:
+        work_dirs.extend(line.strip() for line in sys.stdin if line.strip())
+    if not work_dirs:
+        print(
+            'Usage: python3 scripts/merge_config.py <work_dir> [<work_dir> ...]',
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
 
-    sys.exit(max_exit)
+    results = []
+    for requested in work_dirs:
+        work_dir, code = merge_work_dir(project_root, requested)
+        config_path = None
+        if work_dir is not None and code != 1:
+            config_path = os.path.join(work_dir, 'config.yaml')
+            if not args.summary_json:
+                # Print merged config path to stdout (for callers to capture)
+                print(config_path)
+        results.append({
+            'work_dir': requested,
+            'config': config_path,
+            'exit_code': code,
+        })
+
+    exit_code = _batch_exit_code([r['exit_code'] for r in results])
+    if args.summary_json:
+        print(json.dumps({'results': results, 'exit_code': exit_code}, indent=2))
+
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+scripts/permission_matcher.py
+Precompiled permission matcher for a cmd's merged permission config.
+
+merge_config.py compiles the merged always_ask / subcommand_ask lists into
+work/cmd_NNN/permission-matcher.json (security floor and frozen
+interpreters included). This module loads it and answers lookups without
+scanning the lists:
+  - always_ask command words are a set (O(1) membership)
+  - subcommand_ask patterns ('git:reset:--hard') are a token trie; the
+    longest pattern whose tokens are a prefix of argv wins
+
+Usage:
+  from permission_matcher import load_cmd_matcher
+  matcher = load_cmd_matcher('work/cmd_042')
+  matcher.check(['git', 'reset', '--hard', 'HEAD~1'])
+  # -> ('subcommand_ask', 'git:reset:--hard')
+
+  python3 scripts/permission_matcher.py <work_dir|matcher.json> <command> [args...]
+Prints the matching rule as JSON (null if none).
+Exit code: 0 = no rule matched, 1 = error, 2 = ask rule matched
+"""
+
+import sys
+import os
+import json
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+MATCHER_FILE = 'permission-matcher.json'
+FORMAT_VERSION = 1
+
+# Loaded matchers: realpath -> ((mtime_ns, size), PermissionMatcher)
+_loaded: Dict[str, Tuple[Tuple[int, int], 'PermissionMatcher']] = {}
+
+
+def command_name(word: str) -> str:
+    """Command word used for lookups: basename of argv[0] (/usr/bin/git -> git)."""
+    return word.rsplit('/', 1)[-1]
+
+
+# ---------------------------------------------------------------------------
+# Compile (used by merge_config.py)
+# ---------------------------------------------------------------------------
+
+def build_trie(patterns: Iterable[str]) -> Dict[str, Any]:
+    """
+    Build the serialized subcommand trie from colon-delimited patterns.
+    Node format: {"pattern": <pattern ending here, optional>, "next": {token: node}}
+    The root maps command words to nodes.
+    """
+    root: Dict[str, Any] = {}
+    for pattern in patterns:
+        if not isinstance(pattern, str):
+            continue
+        head, *rest = pattern.split(':')
+        node = root.setdefault(head, {'next': {}})
+        for token in rest:
+            node = node['next'].setdefault(token, {'next': {}})
+        node['pattern'] = pattern
+    return root
+
+
+def compile_matcher(always_ask: Iterable[Any], subcommand_ask: Iterable[Any],
+                    interpreters: Dict[str, Any],
+                    merged_from: Optional[str] = None) -> Dict[str, Any]:
+    """Serializable matcher document for permission-matcher.json."""
+    compiled_interpreters = {}
+    for name, spec in sorted(interpreters.items(), key=lambda item: str(item[0])):
+        flags = spec.get('dangerous_flags') if isinstance(spec, dict) else None
+        compiled_interpreters[str(name)] = sorted(
+            {f for f in flags if isinstance(f, str)} if isinstance(flags, list) else set()
+        )
+    return {
+        'format': FORMAT_VERSION,
+        '_merged_from': merged_from,
+        'always_ask': sorted({w for w in always_ask if isinstance(w, str)}),
+        'subcommand_trie': build_trie(sorted({p for p in subcommand_ask if isinstance(p, str)})),
+        'interpreters': compiled_interpreters,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+def _freeze_node(node: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Serialized trie node -> (pattern or None, {token: frozen node})."""
+    children = {token: _freeze_node(child) for token, child in node.get('next', {}).items()}
+    return node.get('pattern'), children
+
+
+class PermissionMatcher:
+    """Lookup structure loaded from a compiled permission-matcher.json document."""
+
+    __slots__ = ('always_ask', 'interpreters', 'merged_from', 'source', '_trie')
+
+    def __init__(self, data: Dict[str, Any], source: Optional[str] = None):
+        if data.get('format') != FORMAT_VERSION:
+            raise ValueError(f"unsupported permission matcher format: {data.get('format')!r}")
+        self.always_ask: FrozenSet[str] = frozenset(data.get('always_ask', []))
+        self.interpreters: Dict[str, FrozenSet[str]] = {
+            name: frozenset(flags) for name, flags in data.get('interpreters', {}).items()
+        }
+        self.merged_from: Optional[str] = data.get('_merged_from')
+        self.source = source
+        self._trie = {
+            word: _freeze_node(node) for word, node in data.get('subcommand_trie', {}).items()
+        }
+
+    def is_always_ask(self, command: str) -> bool:
+        """True if the command word (or path to it) is in always_ask."""
+        return command_name(command) in self.always_ask
+
+    def match_subcommand(self, argv: List[str]) -> Optional[str]:
+        """Longest subcommand_ask pattern matching a prefix of argv, or None."""
+        if not argv:
+            return None
+        node = self._trie.get(command_name(argv[0]))
+        if node is None:
+            return None
+        best, children = node
+        for token in argv[1:]:
+            child = children.get(token)
+            if child is None:
+                break
+            pattern, children = child
+            if pattern is not None:
+                best = pattern
+        return best
+
+    def check(self, argv: List[str]) -> Optional[Tuple[str, str]]:
+        """
+        Ask rule for a command line, checked in hook order:
+        ('always_ask', command) before ('subcommand_ask', pattern).
+        None if no rule applies.
+        """
+        if not argv:
+            return None
+        name = command_name(argv[0])
+        if name in self.always_ask:
+            return 'always_ask', name
+        pattern = self.match_subcommand(argv)
+        if pattern is not None:
+            return 'subcommand_ask', pattern
+        return None
+
+    def dangerous_flags(self, interpreter: str) -> FrozenSet[str]:
+        """Frozen dangerous_flags of an interpreter (empty if not an interpreter)."""
+        return self.interpreters.get(command_name(interpreter), frozenset())
+
+
+def load_matcher(path: str) -> PermissionMatcher:
+    """
+    Load a compiled matcher file, memoized while its mtime and size are
+    unchanged. Raises OSError or ValueError (bad JSON / unknown format).
+    """
+    st = os.stat(path)
+    key = os.path.realpath(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _loaded.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f'{path}: permission matcher must be a JSON object')
+
+    matcher = PermissionMatcher(data, path)
+    _loaded[key] = (signature, matcher)
+    return matcher
+
+
+def load_cmd_matcher(work_dir: str) -> Optional[PermissionMatcher]:
+    """Compiled matcher of the cmd in work_dir, or None if it has none."""
+    path = os.path.join(work_dir, MATCHER_FILE)
+    if not os.path.isfile(path):
+        return None
+    return load_matcher(path)
+
+
+def main():
+    """Main entry point."""
+    if len(sys.argv) < 3:
+        print('Usage: python3 scripts/permission_matcher.py <work_dir|matcher.json> <command> [args...]', file=sys.stderr)
+        sys.exit(1)
+
+    target = sys.argv[1]
+    try:
+        if os.path.isdir(target):
+            matcher = load_cmd_matcher(target)
+            if matcher is None:
+                print(f'ERROR: no {MATCHER_FILE} in {target} (run merge_config.py first)', file=sys.stderr)
+                sys.exit(1)
+        else:
+            matcher = load_matcher(target)
+    except (OSError, ValueError) as e:
+        print(f'ERROR: cannot load permission matcher: {e}', file=sys.stderr)
+        sys.exit(1)
+
+    result = matcher.check(sys.argv[2:])
+    print(json.dumps(None if result is None else {'rule': result[0], 'match': result[1]}))
+    sys.exit(0 if result is None else 2)
+
+
+if __name__ == '__main__':
+    main()
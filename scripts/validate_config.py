@@ -2,281 +2,698 @@
 """
 validate_config.py - Configuration validation for claude-crew
 
-Validates config.yaml structure and field values using the error code system.
+Validates config.yaml structure and field values against the shared schema
+registry (scripts/config_schema.py) using the error code system.
+Parses with PyYAML (via yaml_io) when installed, otherwise with the
+built-in stdlib-only YAML subset parser below (line/column errors).
 Usage: python3 scripts/validate_config.py [config_path]
-Exit code: 0 = valid, non-zero = invalid
+       python3 scripts/validate_config.py --batch <work_root|glob> ... [--jobs N]
+Exit code: 0 = valid, non-zero = invalid (batch: any config invalid)
 """
 
 import sys
 import os
 import re
-from typing import Dict, Any, List, Tuple, Optional
+import glob
+import json
+import argparse
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, Any, Iterator, List, Tuple, Optional
 
-# ============================================================================
-# Error Code System (from scripts/error_codes.sh)
-# ============================================================================
-
-ERROR_CODES = {
-    "E001": "config.yaml not found → Run: bash scripts/setup.sh",
-    "E002": "config.yaml parse error - invalid YAML → Check YAML syntax with a YAML validator or PyYAML",
-    "E003": "config.yaml missing required field → Run: bash scripts/validate_config.sh to identify missing fields",
-    "E004": "default_model invalid - expected haiku, sonnet, or opus → Edit config.yaml and set default_model appropriately",
-    "E005": "max_parallel out of range - expected 1-20 → Edit config.yaml and set max_parallel to a value between 1 and 20",
-    "E006": "max_retries out of range - expected 0-10 → Edit config.yaml and set max_retries to a value between 0 and 10",
-    "E007": "worker_max_turns out of range - expected 5-100 → Edit config.yaml and set worker_max_turns to a value between 5 and 100",
-    "E008": "background_threshold out of range - expected 1-20 → Edit config.yaml and set background_threshold to a value between 1 and 20",
-    "E009": "retrospect.enabled invalid - expected true or false → Edit config.yaml and set retrospect.enabled to true or false",
-    "E010": "retrospect.model invalid - expected haiku, sonnet, or opus → Edit config.yaml and set retrospect.model appropriately",
-    "E011": "version field missing or invalid - expected semver → Edit config.yaml and set version to format like \"1.0.0\" or \"1.0-rc\"",
-    "E012": "retrospect.filter_threshold invalid - expected number → Edit config.yaml and set retrospect.filter_threshold to a numeric value",
-    "E013": "max_cmd_duration_sec invalid - expected positive integer → Edit config.yaml and set max_cmd_duration_sec to a positive integer or remove it",
-}
+import yaml_io
+from config_schema import ERROR_CODES, format_violation, validate
 
 # ============================================================================
 # YAML Parsing (using only standard library)
 # ============================================================================
-
-class SimpleYAMLParser:
-    """Minimal YAML parser for config.yaml validation."""
-
-    @staticmethod
-    def parse_value(value_str: str) -> Any:
-        """Parse YAML value string."""
-        value_str = value_str.strip()
-
-        # Boolean
-        if value_str.lower() in ('true', 'yes'):
-            return True
-        if value_str.lower() in ('false', 'no'):
-            return False
-
-        # Null
-        if value_str.lower() in ('null', '~', ''):
-            return None
-
-        # Integer
-        try:
-            return int(value_str)
-        except ValueError:
-            pass
-
-        # Float
+# Single-pass parser for the YAML subset config.yaml uses: block mappings and
+# sequences, plain/quoted scalars, flow collections ([], {}, single-pair
+# mappings in flow sequences as in [key: value]), block scalars
+# (| and > with chomping/indentation indicators) and comments. The tokenizer
+# reads the text once, line by line, tracking line/column; block scalars and
+# multi-line flow collections consume their continuation lines directly.
+# Scalars resolve like PyYAML's SafeLoader (YAML 1.1 bools, ints, floats,
+# null, dates). Quoted and plain values may span lines (folded as in
+# PyYAML; yaml_io.dump writes long strings that way). Anchors, aliases,
+# tags and collections as keys are rejected with a positioned error.
+
+class YAMLSubsetError(ValueError):
+    """Parse error with 1-based line and column."""
+
+    def __init__(self, message: str, line: int, column: int):
+        super().__init__(f"line {line}, column {column}: {message}")
+        self.line = line
+        self.column = column
+
+
+_NULL_RE = re.compile(r'^(?:~|null|Null|NULL|)$')
+_BOOL_VALUES = {
+    'yes': True, 'Yes': True, 'YES': True, 'true': True, 'True': True, 'TRUE': True,
+    'on': True, 'On': True, 'ON': True,
+    'no': False, 'No': False, 'NO': False, 'false': False, 'False': False, 'FALSE': False,
+    'off': False, 'Off': False, 'OFF': False,
+}
+_INT_RE = re.compile(r'''^(?:[-+]?0b[0-1_]+
+    |[-+]?0[0-7_]+
+    |[-+]?(?:0|[1-9][0-9_]*)
+    |[-+]?0x[0-9a-fA-F_]+
+    |[-+]?[1-9][0-9_]*(?::[0-5]?[0-9])+)$''', re.X)
+_FLOAT_RE = re.compile(r'''^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+][0-9]+)?
+    |\.[0-9][0-9_]*(?:[eE][-+][0-9]+)?
+    |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\.[0-9_]*
+    |[-+]?\.(?:inf|Inf|INF)
+    |\.(?:nan|NaN|NAN))$''', re.X)
+_DATE_RE = re.compile(r'^([0-9]{4})-([0-9]{2})-([0-9]{2})$')
+_DOUBLE_ESCAPES = {
+    '0': '\0', 'a': '\a', 'b': '\b', 't': '\t', '\t': '\t', 'n': '\n', 'v': '\v',
+    'f': '\f', 'r': '\r', 'e': '\x1b', ' ': ' ', '"': '"', '/': '/', '\\': '\\',
+    'N': '\x85', '_': '\xa0', 'L': ' ', 'P': ' ',
+}
+_HEX_ESCAPES = {'x': 2, 'u': 4, 'U': 8}
+
+
+def _resolve_int(text: str) -> int:
+    sign = -1 if text[0] == '-' else 1
+    digits = text.lstrip('+-').replace('_', '')
+    if digits.startswith('0b'):
+        return sign * int(digits[2:], 2)
+    if digits.startswith('0x'):
+        return sign * int(digits[2:], 16)
+    if ':' in digits:
+        value = 0
+        for part in digits.split(':'):
+            value = value * 60 + int(part)
+        return sign * value
+    if digits != '0' and digits.startswith('0'):
+        return sign * int(digits, 8)
+    return sign * int(digits)
+
+
+def _resolve_float(text: str) -> float:
+    digits = text.replace('_', '')
+    lowered = digits.lower()
+    if lowered.endswith('.inf'):
+        return float('-inf') if digits[0] == '-' else float('inf')
+    if lowered == '.nan':
+        return float('nan')
+    if ':' in digits:
+        sign = -1 if digits[0] == '-' else 1
+        value = 0.0
+        for part in digits.lstrip('+-').split(':'):
+            value = value * 60 + float(part)
+        return sign * value
+    return float(digits)
+
+
+def resolve_plain_scalar(text: str) -> Any:
+    """Type of an unquoted scalar, following PyYAML's SafeLoader rules."""
+    if _NULL_RE.match(text):
+        return None
+    if text in _BOOL_VALUES:
+        return _BOOL_VALUES[text]
+    if _INT_RE.match(text):
+        return _resolve_int(text)
+    if _FLOAT_RE.match(text):
+        return _resolve_float(text)
+    match = _DATE_RE.match(text)
+    if match:
         try:
-            return float(value_str)
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
         except ValueError:
             pass
+    return text
 
-        # String (remove quotes if present)
-        if value_str.startswith('"') and value_str.endswith('"'):
-            return value_str[1:-1]
-        if value_str.startswith("'") and value_str.endswith("'"):
-            return value_str[1:-1]
-
-        return value_str
-
-    @staticmethod
-    def parse(yaml_content: str) -> Dict[str, Any]:
-        """
-        Parse simplified YAML config file.
-        Handles flat keys and nested keys (with indentation).
-        """
-        result = {}
-        current_section = None
-
-        for line in yaml_content.split('\n'):
-            # Strip comments
-            if '#' in line:
-                line = line.split('#')[0]
-
-            line = line.rstrip()
-
-            # Skip empty lines
-            if not line.strip():
-                continue
-
-            # Detect indentation level
-            indent = len(line) - len(line.lstrip())
-            content = line.lstrip()
-
-            # Skip if no colon
-            if ':' not in content:
-                continue
 
-            key, value_str = content.split(':', 1)
-            key = key.strip()
+class _Line:
+    """One physical line: 1-based number and text without the newline."""
 
-            if indent == 0:
-                # Top-level key
-                current_section = None
-                result[key] = SimpleYAMLParser.parse_value(value_str)
-            else:
-                # Nested key
-                if current_section is None:
-                    # Find parent from previous keys
-                    current_section = {}
-                    for prev_key in reversed(result.keys()):
-                        if isinstance(result[prev_key], dict):
-                            current_section = result[prev_key]
-                            break
-
-                if not isinstance(current_section, dict):
-                    current_section = {}
-                    # Store with parent
-                    result[key] = current_section
-
-                current_section[key] = SimpleYAMLParser.parse_value(value_str)
-
-        # Post-process to handle nested structures
-        final_result = {}
-        for key, value in result.items():
-            if '.' in key:
-                # Handle dotted keys (not applicable here, but for future)
-                final_result[key] = value
-            else:
-                final_result[key] = value
+    __slots__ = ('number', 'text')
 
-        return final_result
+    def __init__(self, number: int, text: str):
+        self.number = number
+        self.text = text
 
 
-def parse_yaml_dict(yaml_content: str) -> Dict[str, Any]:
+class _Entry:
     """
-    Parse YAML into nested dict structure.
-    Handles both flat and nested keys.
+    One block-structure token: a mapping key or a sequence item ('- ').
+    has_value is False when the value follows as a nested block.
     """
-    result = {}
-    stack = [result]
 
-    for line in yaml_content.split('\n'):
-        # Remove comments
-        if '#' in line:
-            line = line.split('#')[0]
+    __slots__ = ('kind', 'indent', 'line', 'key', 'has_value', 'value')
 
-        line_stripped = line.rstrip()
+    def __init__(self, kind: str, indent: int, line: int, key: Any = None,
+                 has_value: bool = False, value: Any = None):
+        self.kind = kind
+        self.indent = indent
+        self.line = line
+        self.key = key
+        self.has_value = has_value
+        self.value = value
 
-        # Skip empty lines
-        if not line_stripped.strip():
-            continue
 
-        # Calculate indentation
-        indent_level = (len(line_stripped) - len(line_stripped.lstrip())) // 2
-        content = line_stripped.lstrip()
+class YAMLSubsetParser:
+    """Parse the config.yaml YAML subset in one linear pass (see above)."""
 
-        # Skip lines without colon
-        if ':' not in content:
-            continue
+    KEY = 'key'
+    ITEM = 'item'
 
-        key, value_part = content.split(':', 1)
-        key = key.strip()
-        value_part = value_part.strip()
+    def __init__(self, content: str):
+        self.text = content
+        self.pos = 0
+        self.line_number = 0
+        self.pushed_back: Optional[_Line] = None
+        self.entries = self._tokenize()
+        self.current: Optional[_Entry] = next(self.entries, None)
 
-        # Adjust stack depth
-        while len(stack) > indent_level + 1:
-            stack.pop()
+    # -- line source -------------------------------------------------------
 
-        # Ensure we have dict at current level
-        while len(stack) < indent_level + 1:
-            new_dict = {}
-            if len(stack) > 0 and stack[-1]:
-                # Find last dict in current level
-                last_key = list(stack[-1].keys())[-1] if stack[-1] else None
-                if last_key:
-                    stack[-1][last_key] = new_dict
-            stack.append(new_dict)
+    def _next_line(self) -> Optional[_Line]:
+        if self.pushed_back is not None:
+            line, self.pushed_back = self.pushed_back, None
+            return line
+        if self.pos >= len(self.text):
+            return None
+        end = self.text.find('\n', self.pos)
+        if end < 0:
+            end = len(self.text)
+        text = self.text[self.pos:end]
+        self.pos = end + 1
+        self.line_number += 1
+        if text.endswith('\r'):
+            text = text[:-1]
+        return _Line(self.line_number, text)
+
+    # -- tokenizer ---------------------------------------------------------
+
+    def _tokenize(self) -> Iterator[_Entry]:
+        while True:
+            line = self._next_line()
+            if line is None:
+                return
+            text = line.text
+            indent = len(text) - len(text.lstrip(' '))
+            rest = text[indent:]
+            if not rest.strip() or rest.lstrip().startswith('#'):
+                continue
+            if rest[0] == '\t':
+                raise YAMLSubsetError("tab character in indentation", line.number, indent + 1)
+            if indent == 0 and (rest.rstrip() in ('---', '...') or rest.startswith('--- ')):
+                continue  # document markers
+            yield from self._line_entries(line, indent)
+
+    def _line_entries(self, line: _Line, col: int) -> Iterator[_Entry]:
+        """Entries starting at column col (0-based) of line."""
+        text = line.text
+        if text.startswith('-', col) and (col + 1 == len(text) or text[col + 1] in ' \t'):
+            value_col = col + 1
+            while value_col < len(text) and text[value_col] == ' ':
+                value_col += 1
+            if value_col >= len(text) or text[value_col] == '#':
+                yield _Entry(self.ITEM, col, line.number)
+            elif self._starts_block_entry(text, value_col):
+                yield _Entry(self.ITEM, col, line.number)
+                yield from self._line_entries(line, value_col)
+            else:
+                value = self._parse_value(line, value_col, col)
+                yield _Entry(self.ITEM, col, line.number, has_value=True, value=value)
+            return
+
+        key, value_col = self._parse_key(line, col)
+        while value_col < len(text) and text[value_col] == ' ':
+            value_col += 1
+        if value_col >= len(text) or text[value_col] == '#':
+            yield _Entry(self.KEY, col, line.number, key=key)
+        else:
+            value = self._parse_value(line, value_col, col)
+            yield _Entry(self.KEY, col, line.number, key=key, has_value=True, value=value)
 
-        # Parse value
-        current_dict = stack[-1]
-        current_dict[key] = SimpleYAMLParser.parse_value(value_part)
+    def _starts_block_entry(self, text: str, col: int) -> bool:
+        """True if text[col:] is a nested '- item' or 'key: value' entry."""
+        if text.startswith('-', col) and (col + 1 == len(text) or text[col + 1] == ' '):
+            return True
+        if text[col] in '"\'':
+            try:
+                end = self._scan_quoted(_Line(0, text), col)[2]
+            except YAMLSubsetError:
+                return False
+            return text.startswith(':', end)
+        if text[col] in '[{|>':
+            return False
+        return self._find_mapping_colon(text, col) >= 0
 
-    return result
+    @staticmethod
+    def _find_mapping_colon(text: str, col: int) -> int:
+        """Index of the ': ' (or trailing ':') ending a plain key, or -1."""
+        i = col
+        while True:
+            i = text.find(':', i)
+            if i < 0:
+                return -1
+            if i + 1 == len(text) or text[i + 1] in ' \t':
+                hash_pos = text.find(' #', col, i)
+                return -1 if hash_pos >= 0 else i
+            i += 1
+
+    def _parse_key(self, line: _Line, col: int) -> Tuple[Any, int]:
+        """Key at col; returns (key, column after ':')."""
+        text = line.text
+        if text[col] in '"\'':
+            key, _, end = self._scan_quoted(line, col)
+            if not text.startswith(':', end):
+                raise YAMLSubsetError("expected ':' after quoted key", line.number, end + 1)
+            return key, end + 1
+        if text[col] in '[{?&*!|>%@`':
+            raise YAMLSubsetError(f"unsupported YAML syntax '{text[col]}'", line.number, col + 1)
+        colon = self._find_mapping_colon(text, col)
+        if colon < 0:
+            raise YAMLSubsetError(
+                "expected 'key: value'",
+                line.number, col + 1,
+            )
+        return resolve_plain_scalar(text[col:colon].rstrip()), colon + 1
+
+    # -- values ------------------------------------------------------------
+
+    def _parse_value(self, line: _Line, col: int, parent_indent: int) -> Any:
+        text = line.text
+        first = text[col]
+        if first in '"\'':
+            value, line, end = self._scan_quoted(line, col, multiline=True)
+            self._expect_line_end(line, end)
+            return value
+        if first in '[{':
+            return self._parse_flow(line, col)
+        if first in '|>':
+            return self._parse_block_scalar(line, col, parent_indent)
+        if first in '&*!%@`':
+            raise YAMLSubsetError(f"unsupported YAML syntax '{first}'", line.number, col + 1)
+        if first == '-' and (col + 1 == len(text) or text[col + 1] in ' \t'):
+            raise YAMLSubsetError("block sequence entries are not allowed here", line.number, col + 1)
+
+        end = text.find(' #', col)
+        plain = (text[col:] if end < 0 else text[col:end]).rstrip()
+        colon = self._find_mapping_colon(plain, 0)
+        if colon >= 0:
+            raise YAMLSubsetError("mapping values are not allowed here", line.number, col + colon + 1)
+        if end < 0:
+            plain += self._plain_continuation(parent_indent)
+        return resolve_plain_scalar(plain)
+
+    def _plain_continuation(self, parent_indent: int) -> str:
+        """
+        Folded continuation lines (indented past parent_indent) of a plain
+        scalar: a line break becomes a space, each empty line a newline.
+        A comment ends the scalar.
+        """
+        folded: List[str] = []
+        breaks = 0
+        while True:
+            nxt = self._next_line()
+            if nxt is None:
+                break
+            body = nxt.text.strip(' \t')
+            if not body:
+                breaks += 1
+                continue
+            indent = len(nxt.text) - len(nxt.text.lstrip(' '))
+            if indent <= parent_indent or body.startswith('#'):
+                self.pushed_back = nxt
+                break
+            end = body.find(' #')
+            content = (body if end < 0 else body[:end]).rstrip()
+            colon = self._find_mapping_colon(content, 0)
+            if colon >= 0:
+                raise YAMLSubsetError("mapping values are not allowed here", nxt.number,
+                                      indent + colon + 1)
+            folded.append('\n' * breaks if breaks else ' ')
+            folded.append(content)
+            breaks = 0
+            if end >= 0:
+                break
+        return ''.join(folded)
+
+    def _expect_line_end(self, line: _Line, col: int):
+        rest = line.text[col:]
+        stripped = rest.lstrip()
+        if stripped and not (stripped.startswith('#') and len(stripped) < len(rest)):
+            raise YAMLSubsetError("unexpected content after value", line.number,
+                                  col + len(rest) - len(stripped) + 1)
+
+    def _scan_quoted(self, line: _Line, col: int,
+                     multiline: bool = False) -> Tuple[str, _Line, int]:
+        """
+        Quoted scalar at col; returns (value, line it ends on, index after
+        the closing quote). With multiline, continuation lines are folded
+        like PyYAML: a line break becomes a space, each empty line a
+        newline, and an escaped break (double quotes) joins without a space.
+        """
+        quote = line.text[col]
+        chars: List[str] = []
+        i = col + 1
+        while True:
+            closed, i, escaped_break = self._scan_quoted_line(line, i, quote, chars)
+            if closed:
+                return ''.join(chars), line, i
+            if not multiline:
+                raise YAMLSubsetError("unterminated quoted string", line.number, col + 1)
+            breaks = 0
+            while True:
+                nxt = self._next_line()
+                if nxt is None or (nxt.text.startswith(('---', '...')) and
+                                   nxt.text[3:4] in ('', ' ', '\t')):
+                    raise YAMLSubsetError("unterminated quoted string", line.number, col + 1)
+                stripped = nxt.text.lstrip(' \t')
+                if stripped:
+                    break
+                breaks += 1
+            if breaks:
+                chars.append('\n' * breaks)
+            elif not escaped_break:
+                chars.append(' ')
+            line, i = nxt, len(nxt.text) - len(stripped)
 
+    @staticmethod
+    def _scan_quoted_line(line: _Line, i: int, quote: str,
+                          chars: List[str]) -> Tuple[bool, int, bool]:
+        """
+        Scan one line of a quoted scalar from i into chars; returns (closed,
+        index after the closing quote, line ended in an escaped break).
+        Whitespace before an unescaped line break is dropped.
+        """
+        text = line.text
+        kept = len(chars)  # escaped whitespace is never dropped
+        while i < len(text):
+            ch = text[i]
+            if quote == "'":
+                if ch == "'":
+                    if text.startswith("'", i + 1):
+                        chars.append("'")
+                        i += 2
+                        continue
+                    return True, i + 1, False
+                chars.append(ch)
+                i += 1
+                continue
+            if ch == '"':
+                return True, i + 1, False
+            if ch == '\\':
+                if i + 1 >= len(text):
+                    break
+                esc = text[i + 1]
+                if esc in _DOUBLE_ESCAPES:
+                    chars.append(_DOUBLE_ESCAPES[esc])
+                    kept = len(chars)
+                    i += 2
+                    continue
+                if esc in _HEX_ESCAPES:
+                    width = _HEX_ESCAPES[esc]
+                    digits = text[i + 2:i + 2 + width]
+                    if len(digits) == width and all(c in '0123456789abcdefABCDEF' for c in digits):
+                        chars.append(chr(int(digits, 16)))
+                        kept = len(chars)
+                        i += 2 + width
+                        continue
+                raise YAMLSubsetError(f"invalid escape '\\{esc}'", line.number, i + 1)
+            chars.append(ch)
+            i += 1
+        if quote == '"' and i == len(text) - 1:  # stopped at a trailing backslash
+            return False, i, True
+        while len(chars) > kept and chars[-1] in ' \t':
+            chars.pop()
+        return False, i, False
+
+    def _parse_block_scalar(self, line: _Line, col: int, parent_indent: int) -> str:
+        """'|' / '>' block scalar; consumes its content lines."""
+        text = line.text
+        folded = text[col] == '>'
+        chomping = 'clip'
+        increment = None
+        i = col + 1
+        while i < len(text) and text[i] not in ' #':
+            ch = text[i]
+            if ch in '+-' and chomping == 'clip':
+                chomping = 'keep' if ch == '+' else 'strip'
+            elif ch in '123456789' and increment is None:
+                increment = int(ch)
+            else:
+                raise YAMLSubsetError("invalid block scalar indicator", line.number, i + 1)
+            i += 1
+        self._expect_line_end(line, i)
+
+        content_indent = parent_indent + increment if increment else None
+        lines: List[str] = []
+        while True:
+            nxt = self._next_line()
+            if nxt is None:
+                break
+            body = nxt.text
+            stripped = body.lstrip(' ')
+            indent = len(body) - len(stripped)
+            if not stripped:
+                lines.append('')
+                continue
+            if content_indent is None:
+                if indent <= parent_indent:
+                    self.pushed_back = nxt
+                    break
+                content_indent = indent
+            if indent < content_indent:
+                self.pushed_back = nxt
+                break
+            lines.append(body[content_indent:])
+
+        # Trailing blank lines belong to chomping, not content
+        trailing = 0
+        while lines and lines[-1] == '':
+            lines.pop()
+            trailing += 1
+
+        if folded:
+            value = self._fold(lines)
+        else:
+            value = '\n'.join(lines)
+        if not lines:
+            return '\n' * trailing if chomping == 'keep' else ''
+        if chomping == 'strip':
+            return value
+        if chomping == 'keep':
+            return value + '\n' * (1 + trailing)
+        return value + '\n'
 
-# ============================================================================
-# Validation Schema
-# ============================================================================
+    @staticmethod
+    def _fold(lines: List[str]) -> str:
+        """Folded (>) scalar: single breaks between plain lines become spaces."""
+        out: List[str] = []
+        breaks = 0
+        prev = None
+        for ln in lines:
+            if ln == '':
+                breaks += 1
+                continue
+            if prev is None:
+                out.append('\n' * breaks)
+            elif prev[0] not in ' \t' and ln[0] not in ' \t':
+                out.append('\n' * breaks if breaks else ' ')
+            else:
+                out.append('\n' * (breaks + 1))
+            out.append(ln)
+            prev = ln
+            breaks = 0
+        return ''.join(out)
+
+    def _parse_flow(self, line: _Line, col: int) -> Any:
+        """Flow collection starting at col; may span lines."""
+        reader = _FlowReader(self, line, col)
+        value = reader.parse_node()
+        self._expect_line_end(reader.line, reader.index)
+        return value
+
+    # -- structure ---------------------------------------------------------
+
+    def _advance(self) -> _Entry:
+        entry = self.current
+        self.current = next(self.entries, None)
+        return entry
+
+    def parse(self) -> Any:
+        """Parse the document; None for an empty document."""
+        if self.current is None:
+            return None
+        value = self._parse_block(self.current.indent)
+        if self.current is not None:
+            raise YAMLSubsetError("unexpected indentation", self.current.line, self.current.indent + 1)
+        return value
+
+    def _parse_block(self, indent: int) -> Any:
+        if self.current.kind == self.ITEM:
+            return self._parse_sequence(indent)
+        return self._parse_mapping(indent)
+
+    def _nested_value(self, entry: _Entry) -> Any:
+        """Value of a key/item whose value is on the following lines."""
+        nxt = self.current
+        if nxt is None:
+            return None
+        if nxt.indent > entry.indent:
+            return self._parse_block(nxt.indent)
+        if entry.kind == self.KEY and nxt.kind == self.ITEM and nxt.indent == entry.indent:
+            return self._parse_sequence(entry.indent)  # indentless sequence
+        return None
+
+    def _parse_mapping(self, indent: int) -> Dict[Any, Any]:
+        result: Dict[Any, Any] = {}
+        while self.current is not None and self.current.indent == indent and self.current.kind == self.KEY:
+            entry = self._advance()
+            result[entry.key] = entry.value if entry.has_value else self._nested_value(entry)
+        nxt = self.current
+        if nxt is not None and nxt.indent >= indent:
+            what = "sequence item in a mapping" if nxt.kind == self.ITEM else "unexpected indentation"
+            raise YAMLSubsetError(what, nxt.line, nxt.indent + 1)
+        return result
+
+    def _parse_sequence(self, indent: int) -> List[Any]:
+        items: List[Any] = []
+        while self.current is not None and self.current.indent == indent and self.current.kind == self.ITEM:
+            entry = self._advance()
+            items.append(entry.value if entry.has_value else self._nested_value(entry))
+        nxt = self.current
+        if nxt is not None and nxt.indent > indent:
+            raise YAMLSubsetError("unexpected indentation", nxt.line, nxt.indent + 1)
+        return items
+
+
+class _FlowReader:
+    """Character reader for flow collections ([...], {...}) across lines."""
+
+    def __init__(self, parser: YAMLSubsetParser, line: _Line, index: int):
+        self.parser = parser
+        self.line = line
+        self.index = index
+
+    def error(self, message: str):
+        raise YAMLSubsetError(message, self.line.number, self.index + 1)
+
+    def skip_space(self, multiline: bool = False):
+        while True:
+            text = self.line.text
+            while self.index < len(text) and text[self.index] in ' \t':
+                self.index += 1
+            at_end = self.index >= len(text) or (
+                text[self.index] == '#' and (self.index == 0 or text[self.index - 1] in ' \t'))
+            if not (at_end and multiline):
+                return
+            nxt = self.parser._next_line()
+            if nxt is None:
+                self.error("unterminated flow collection")
+            self.line, self.index = nxt, 0
+
+    def peek(self) -> str:
+        text = self.line.text
+        return text[self.index] if self.index < len(text) else ''
+
+    def parse_node(self) -> Any:
+        ch = self.peek()
+        if ch == '[':
+            return self._parse_sequence()
+        if ch == '{':
+            return self._parse_mapping()
+        if ch in ('"', "'"):
+            value, self.line, self.index = self.parser._scan_quoted(self.line, self.index, multiline=True)
+            return value
+        if ch in '&*!|>%@`':
+            self.error(f"unsupported YAML syntax '{ch}'")
+        return self._parse_plain()
+
+    def _parse_plain(self) -> Any:
+        text = self.line.text
+        start = self.index
+        while self.index < len(text):
+            ch = text[self.index]
+            if ch in ',[]{}':
+                break
+            if ch == ':' and (self.index + 1 == len(text) or text[self.index + 1] in ' ,[]{}'):
+                break
+            if ch == '#' and self.index > start and text[self.index - 1] in ' \t':
+                break
+            self.index += 1
+        return resolve_plain_scalar(text[start:self.index].strip())
+
+    def _parse_sequence(self) -> List[Any]:
+        self.index += 1
+        items: List[Any] = []
+        while True:
+            self.skip_space(multiline=True)
+            if self.peek() == ']':
+                self.index += 1
+                return items
+            item = self.parse_node()
+            self.skip_space(multiline=True)
+            if self.peek() == ':':  # single-pair mapping: [key: value]
+                item = {item: self._parse_pair_value(item, ']')}
+            items.append(item)
+            ch = self.peek()
+            if ch == ',':
+                self.index += 1
+            elif ch != ']':
+                self.error("expected ',' or ']' in flow sequence")
+
+    def _parse_mapping(self) -> Dict[Any, Any]:
+        self.index += 1
+        result: Dict[Any, Any] = {}
+        while True:
+            self.skip_space(multiline=True)
+            if self.peek() == '}':
+                self.index += 1
+                return result
+            key = self.parse_node()
+            self.skip_space(multiline=True)
+            result[key] = self._parse_pair_value(key, '}') if self.peek() == ':' else None
+            ch = self.peek()
+            if ch == ',':
+                self.index += 1
+            elif ch != '}':
+                self.error("expected ',' or '}' in flow mapping")
+
+    def _parse_pair_value(self, key: Any, closing: str) -> Any:
+        """Value after the ':' of a flow pair with this key (None if empty)."""
+        if isinstance(key, (list, dict)):
+            self.error("unsupported YAML syntax: collection as a mapping key")
+        self.index += 1
+        self.skip_space(multiline=True)
+        if self.peek() in (',', closing):
+            return None
+        value = self.parse_node()
+        self.skip_space(multiline=True)
+        return value
 
-SCHEMA = {
-    "version": {
-        "required": True,
-        "type": str,
-        "validator": lambda v: bool(re.match(r'^\d+\.\d+(\.\d+)?(-[a-zA-Z0-9.]+)?$', str(v))),
-        "error_code": "E011",
-    },
-    "default_model": {
-        "required": True,
-        "type": str,
-        "validator": lambda v: v in ("haiku", "sonnet", "opus"),
-        "error_code": "E004",
-    },
-    "max_parallel": {
-        "required": True,
-        "type": int,
-        "validator": lambda v: isinstance(v, int) and 1 <= v <= 20,
-        "error_code": "E005",
-    },
-    "max_retries": {
-        "required": True,
-        "type": int,
-        "validator": lambda v: isinstance(v, int) and 0 <= v <= 10,
-        "error_code": "E006",
-    },
-    "background_threshold": {
-        "required": True,
-        "type": int,
-        "validator": lambda v: isinstance(v, int) and 1 <= v <= 20,
-        "error_code": "E008",
-    },
-    "worker_max_turns": {
-        "required": True,
-        "type": int,
-        "validator": lambda v: isinstance(v, int) and 5 <= v <= 100,
-        "error_code": "E007",
-    },
-    "max_cmd_duration_sec": {
-        "required": False,
-        "type": int,
-        "validator": lambda v: v is None or (isinstance(v, int) and v > 0),
-        "error_code": "E013",
-    },
-}
 
-NESTED_SCHEMA = {
-    "retrospect.enabled": {
-        "required": True,
-        "type": bool,
-        "validator": lambda v: isinstance(v, bool),
-        "error_code": "E009",
-    },
-    "retrospect.filter_threshold": {
-        "required": True,
-        "type": (int, float),
-        "validator": lambda v: isinstance(v, (int, float)),
-        "error_code": "E012",
-    },
-    "retrospect.model": {
-        "required": True,
-        "type": str,
-        "validator": lambda v: v in ("haiku", "sonnet", "opus"),
-        "error_code": "E010",
-    },
-}
+def parse_yaml_dict(yaml_content: str) -> Any:
+    """
+    Parse config YAML with the stdlib-only subset parser.
+    Returns the document (a dict for a valid config; None if empty).
+    Raises YAMLSubsetError with line/column on invalid or unsupported input.
+    """
+    return YAMLSubsetParser(yaml_content).parse()
+
+
+def load_config_file(config_path: str) -> Any:
+    """
+    Parse a config file: shared yaml_io loader (libyaml when available)
+    if PyYAML is installed, else the stdlib-only parse_yaml_dict().
+    """
+    if yaml_io.available():
+        return yaml_io.load(config_path)
+    with open(config_path, 'r') as f:
+        return parse_yaml_dict(f.read())
 
 
 # ============================================================================
 # Validation Functions
 # ============================================================================
 
-def get_nested_value(data: Dict, path: str) -> Tuple[bool, Any]:
-    """Get nested value from dict using dot notation."""
-    parts = path.split('.')
-    current = data
-    for part in parts:
-        if isinstance(current, dict) and part in current:
-            current = current[part]
-        else:
-            return False, None
-    return True, current
-
-
 def validate_config(config_path: str) -> Tuple[bool, List[str], List[str]]:
     """
     Validate config.yaml.
@@ -292,61 +709,16 @@ def validate_config(config_path: str) -> Tuple[bool, List[str], List[str]]:
 
     # Parse YAML
     try:
-        with open(config_path, 'r') as f:
-            yaml_content = f.read()
-        config = parse_yaml_dict(yaml_content)
+        config = load_config_file(config_path)
     except Exception as e:
         errors.append(f"[E002] {ERROR_CODES['E002']} (Details: {str(e)})")
         return False, errors, warnings
+    if not isinstance(config, dict):
+        errors.append(f"[E002] {ERROR_CODES['E002']} (Details: top level is not a mapping)")
+        return False, errors, warnings
 
-    # Validate top-level fields
-    for field_name, field_spec in SCHEMA.items():
-        if field_name not in config:
-            if field_spec["required"]:
-                errors.append(f"[E003] {ERROR_CODES['E003']} (Missing: {field_name})")
-        else:
-            value = config[field_name]
-
-            # Type check (skip if value is None and optional)
-            if value is not None and not field_spec.get("type") is None:
-                expected_type = field_spec["type"]
-                if not isinstance(value, expected_type):
-                    error_code = field_spec["error_code"]
-                    errors.append(f"[{error_code}] {ERROR_CODES[error_code]}")
-                    continue
-
-            # Value validation
-            if not field_spec["validator"](value):
-                error_code = field_spec["error_code"]
-                errors.append(f"[{error_code}] {ERROR_CODES[error_code]}")
-
-    # Validate nested fields (retrospect.*)
-    if "retrospect" in config and isinstance(config["retrospect"], dict):
-        retrospect = config["retrospect"]
-
-        # Check enabled
-        if "enabled" not in retrospect:
-            errors.append(f"[E003] {ERROR_CODES['E003']} (Missing: retrospect.enabled)")
-        else:
-            if not isinstance(retrospect["enabled"], bool):
-                errors.append(f"[E009] {ERROR_CODES['E009']}")
-
-        # Check model
-        if "model" not in retrospect:
-            errors.append(f"[E003] {ERROR_CODES['E003']} (Missing: retrospect.model)")
-        else:
-            if retrospect["model"] not in ("haiku", "sonnet", "opus"):
-                errors.append(f"[E010] {ERROR_CODES['E010']}")
-
-        # Check filter_threshold
-        if "filter_threshold" not in retrospect:
-            errors.append(f"[E003] {ERROR_CODES['E003']} (Missing: retrospect.filter_threshold)")
-        else:
-            if not isinstance(retrospect["filter_threshold"], (int, float)):
-                errors.append(f"[E012] {ERROR_CODES['E012']}")
-    else:
-        if "retrospect" not in config:
-            errors.append(f"[E003] {ERROR_CODES['E003']} (Missing: retrospect section)")
+    # Validate every known path (config_schema.SCHEMA) in one pass
+    errors.extend(format_violation(v) for v in validate(config))
 
     return len(errors) == 0, errors, warnings
 
@@ -375,15 +747,207 @@ def print_validation_results(success: bool, errors: List[str], warnings: List[st
         print()
 
 
+# ============================================================================
+# Batch Validation (every cmd snapshot)
+# ============================================================================
+# Paths are streamed from os.scandir()/glob.iglob() and validated in chunks on
+# a process pool with a fixed number of chunks in flight, so memory stays
+# bounded however many cmds the tree holds. Snapshots of unchanged inputs are
+# hardlinks of one cached file (merge_config.py), so files are keyed by
+# (device, inode, mtime, size) and each distinct file is validated once.
+
+BATCH_CHUNK_SIZE = 32
+BATCH_CHUNKS_PER_JOB = 2
+BATCH_DEDUP_MAX_ENTRIES = 4096
+
+ERROR_CODE_RE = re.compile(r'^\[(E\d{3})\]')
+
+ValidationResult = Tuple[bool, List[str], List[str]]
+
+
+def iter_config_paths(targets: List[str]) -> Iterator[str]:
+    """
+    Config snapshot paths for batch targets, streamed:
+      directory - work root: <dir>/cmd_*/config.yaml
+      other     - glob pattern (** allowed); matched directories are
+                  read as <match>/config.yaml
+    """
+    for target in targets:
+        if os.path.isdir(target):
+            with os.scandir(target) as entries:
+                for entry in entries:
+                    if entry.name.startswith('cmd_') and entry.is_dir():
+                        path = os.path.join(entry.path, 'config.yaml')
+                        if os.path.isfile(path):
+                            yield path
+            continue
+        for match in glob.iglob(target, recursive=True):
+            yield os.path.join(match, 'config.yaml') if os.path.isdir(match) else match
+
+
+def _file_key(path: str) -> Optional[Tuple[int, int, int, int]]:
+    """Identity of the file content at path (None if it cannot be stat'ed)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _validate_chunk(paths: List[str]) -> List[ValidationResult]:
+    """Pool worker: validate_config() for each path."""
+    return [validate_config(path) for path in paths]
+
+
+def _iter_chunks(paths: Iterator[str], size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for path in paths:
+        chunk.append(path)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _BatchChunk:
+    """
+    One chunk of paths in flight. todo holds one path per file not validated
+    yet (todo_keys: its file key); known holds results cached for the others.
+    """
+
+    __slots__ = ('paths', 'keys', 'todo', 'todo_keys', 'known', 'future')
+
+    def __init__(self, paths: List[str], done: 'OrderedDict'):
+        self.paths = paths
+        self.keys = [_file_key(path) for path in paths]
+        self.todo: List[str] = []
+        self.todo_keys: List[Any] = []
+        self.known: Dict[Any, Optional[ValidationResult]] = {}
+        self.future = None
+        for path, key in zip(paths, self.keys):
+            if key is not None:
+                if key in self.known:
+                    continue
+                if key in done:
+                    self.known[key] = done[key]
+                    continue
+                self.known[key] = None
+            self.todo.append(path)  # key None: missing/unreadable, reported as E001
+            self.todo_keys.append(key)
+
+    def results(self, todo_results: List[ValidationResult],
+                done: 'OrderedDict') -> Iterator[Tuple[str, ValidationResult]]:
+        """(path, result) for every path of the chunk, in order."""
+        direct: Dict[str, ValidationResult] = {}
+        for path, key, result in zip(self.todo, self.todo_keys, todo_results):
+            if key is None:
+                direct[path] = result
+                continue
+            self.known[key] = result
+            done[key] = result
+            done.move_to_end(key)
+        while len(done) > BATCH_DEDUP_MAX_ENTRIES:
+            done.popitem(last=False)
+        for path, key in zip(self.paths, self.keys):
+            yield path, (direct[path] if key is None else self.known[key])
+
+
+def _drain(chunk: _BatchChunk, done: 'OrderedDict') -> Iterator[Tuple[str, ValidationResult]]:
+    todo_results = chunk.future.result() if chunk.future is not None else []
+    return chunk.results(todo_results, done)
+
+
+def iter_batch_results(targets: List[str], jobs: int) -> Iterator[Tuple[str, ValidationResult]]:
+    """
+    Validate every config matched by targets. Yields (path, (success,
+    errors, warnings)) in discovery order. jobs > 1 uses a process pool with
+    at most jobs * BATCH_CHUNKS_PER_JOB chunks queued.
+    """
+    done: 'OrderedDict' = OrderedDict()  # file key -> result (bounded LRU)
+    chunks = _iter_chunks(iter_config_paths(targets), BATCH_CHUNK_SIZE)
+
+    if jobs <= 1:
+        for paths in chunks:
+            chunk = _BatchChunk(paths, done)
+            yield from chunk.results(_validate_chunk(chunk.todo), done)
+        return
+
+    window: deque = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for paths in chunks:
+            chunk = _BatchChunk(paths, done)
+            if chunk.todo:
+                chunk.future = pool.submit(_validate_chunk, chunk.todo)
+            window.append(chunk)
+            while len(window) >= jobs * BATCH_CHUNKS_PER_JOB:
+                yield from _drain(window.popleft(), done)
+        while window:
+            yield from _drain(window.popleft(), done)
+
+
+def run_batch(targets: List[str], jobs: int) -> int:
+    """
+    Batch mode: one JSON line per config ({"path", "valid", "errors",
+    "warnings"}), then a summary line with error counts by code.
+    Returns the exit code (0 = all valid, 1 = invalid or nothing matched).
+    """
+    total = invalid = 0
+    by_code: Dict[str, int] = {}
+    for path, (success, errors, warnings) in iter_batch_results(targets, jobs):
+        total += 1
+        if not success:
+            invalid += 1
+        for error in errors:
+            match = ERROR_CODE_RE.match(error)
+            code = match.group(1) if match else 'other'
+            by_code[code] = by_code.get(code, 0) + 1
+        print(json.dumps({
+            'path': path, 'valid': success, 'errors': errors, 'warnings': warnings,
+        }, ensure_ascii=False))
+
+    print(json.dumps({'summary': {
+        'total': total,
+        'valid': total - invalid,
+        'invalid': invalid,
+        'by_code': dict(sorted(by_code.items())),
+    }}))
+    if total == 0:
+        print(f"No config snapshots matched: {' '.join(targets)}", file=sys.stderr)
+        return 1
+    return 0 if invalid == 0 else 1
+
+
 # ============================================================================
 # Main
 # ============================================================================
 
-def main():
+def main(argv=None):
     """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Validate config.yaml (or every cmd config snapshot with --batch)',
+    )
+    parser.add_argument(
+        'config_path', nargs='?',
+        help='config file to validate (default: project root config.yaml)',
+    )
+    parser.add_argument(
+        '--batch', nargs='+', metavar='DIR_OR_GLOB',
+        help='validate many configs: a work root (cmd_*/config.yaml) or a glob; '
+             'prints JSON lines and a summary by error code',
+    )
+    parser.add_argument(
+        '--jobs', type=int, default=os.cpu_count() or 1,
+        help='worker processes for --batch (default: CPU count)',
+    )
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        sys.exit(run_batch(args.batch, max(1, args.jobs)))
+
     # Determine config path
-    if len(sys.argv) > 1:
-        config_path = sys.argv[1]
+    if args.config_path:
+        config_path = args.config_path
     else:
         # Default to project root config.yaml
         script_dir = os.path.dirname(os.path.abspath(__file__))
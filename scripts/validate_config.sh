@@ -20,6 +20,8 @@ if [[ -n "${1:-}" ]] && [[ -f "$1/config.yaml" ]]; then
   CONFIG_PATH="$1/config.yaml"
 elif [[ -n "${1:-}" ]] && [[ -f "$PROJECT_ROOT/$1/config.yaml" ]]; then
   CONFIG_PATH="$PROJECT_ROOT/$1/config.yaml"
+elif [[ -n "${1:-}" ]] && ARCHIVED=$(python3 "$SCRIPT_DIR/cmd_archive.py" --work-root "$PROJECT_ROOT/work" resolve "$1/config.yaml" 2>/dev/null); then
+  CONFIG_PATH="$ARCHIVED"  # archived cmd (work/archive/)
 else
   CONFIG_PATH="$PROJECT_ROOT/config.yaml"
 fi
@@ -45,7 +47,7 @@ if [[ ! -f "$CONFIG_PATH" ]]; then
 fi
 
 # Check 1: version (quoted string, semver-like)
-VERSION=$(grep "^version:" "$CONFIG_PATH" | sed 's/^version:[[:space:]]*//' | tr -d '"' || echo "")
+VERSION=$(grep "^version:" "$CONFIG_PATH" | sed 's/^version:[[:space:]]*//' | tr -d "\"'" || echo "")
 if [[ -n "$VERSION" ]] && [[ "$VERSION" =~ ^[0-9]+\.[0-9]+(\.[0-9]+)?(-[a-zA-Z0-9.]+)?$ ]]; then
   check "version is valid: $VERSION" "pass"
 else
@@ -80,9 +82,11 @@ else
   check "[E006] $ERR_MSG (got: $MAX_RETRIES)" "fail"
 fi
 
-# Check 5: background_threshold (integer, 1-20)
+# Check 5: background_threshold (optional, integer 1-20 if present)
 BG_THRESHOLD=$(grep "^background_threshold:" "$CONFIG_PATH" | awk '{print $2}' | tr -d '[:space:]' || echo "")
-if [[ "$BG_THRESHOLD" =~ ^[0-9]+$ ]] && [[ $BG_THRESHOLD -ge 1 ]] && [[ $BG_THRESHOLD -le 20 ]]; then
+if [[ -z "$BG_THRESHOLD" ]]; then
+  echo "INFO: background_threshold not set (optional)"
+elif [[ "$BG_THRESHOLD" =~ ^[0-9]+$ ]] && [[ $BG_THRESHOLD -ge 1 ]] && [[ $BG_THRESHOLD -le 20 ]]; then
   check "background_threshold is valid: $BG_THRESHOLD" "pass"
 else
   ERR_MSG=$(get_error_message E008)
@@ -138,7 +142,7 @@ fi
 
 # Check 11: local/config.yaml override validation (if exists and merge script available)
 if [[ -f "$PROJECT_ROOT/local/config.yaml" ]]; then
-  if python3 -c "import yaml" 2>/dev/null; then
+  if python3 "$PROJECT_ROOT/scripts/yaml_io.py" --available; then
     TMPDIR=$(mktemp -d)
     MERGE_WARNINGS=$(python3 "$PROJECT_ROOT/scripts/merge_config.py" \
       "$TMPDIR" 2>&1 >/dev/null) || true
@@ -9,21 +9,55 @@ Detects anomalies including:
 - Retry limit violations
 - Duplicate task IDs
 
+Thresholds come from the cmd's own merged config snapshot
+(work/cmd_NNN/config.json, see cmd_config.py) when the log sits in a cmd
+directory, else from the project config.yaml.
+
 Uses error codes E200-E299 (Validation errors).
 
+Batch mode validates many logs (a work root, cmd directories or globs)
+across a process pool: the project config is parsed once and shared,
+cmds with a merged snapshot still use their own. The report groups the
+anomalies of every log by code; each log keeps its own exit code (JSON
+lines with --format json).
+
+Watch mode follows a live log: on each change (inotify where available,
+else mtime/size polling) only task entries whose text changed are
+re-parsed and re-validated,
+and running tasks are checked against max_cmd_duration_sec and the p95
+duration of their role in past cmds (exec_log_stats.py) so a stalled
+subagent is reported while the cmd is still running. It stops once the
+cmd has kept a final status for one quiet --interval and reports a full
+validation of the log at that point.
+
 Usage:
     python3 scripts/validate_exec_log.py <path/to/execution_log.yaml>
+    python3 scripts/validate_exec_log.py --batch <work_root|cmd_dir|glob> ... [--jobs N] [--format json]
+    python3 scripts/validate_exec_log.py --watch <path/to/execution_log.yaml> [--interval SEC] [--history WORK_ROOT]
 
 Exit codes:
-    0: No anomalies found
-    1: Anomalies detected
+    0: No anomalies found (batch: in any log)
+    1: Anomalies detected (batch: in at least one log, or no log matched)
 """
 
 import sys
 import os
-import yaml
+import re
+import glob
+import json
+import time
+import select
+import argparse
+import contextlib
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import yaml_io
+import cmd_archive
+from cmd_config import CmdConfig, load_cmd_config, load_config_file
 
 
 # Error code definitions for validation errors (E200-E299)
@@ -36,8 +70,22 @@ ERROR_CODES = {
     'E284': 'value out of bounds',
     'E285': 'enum value invalid',
     'E286': 'required field null',
+    'E300': 'file not found',
+    'E303': 'file read failed',
+    'E365': 'library import failed',
 }
 
+EXEC_LOG_FILE = 'execution_log.yaml'
+BATCH_CHUNK_SIZE = 16
+BATCH_CHUNKS_PER_JOB = 2
+
+# (path, exit code, anomalies) for one log
+LogResult = Tuple[str, int, List[Dict[str, Any]]]
+
+WATCH_INTERVAL_SEC = 2.0
+HISTORY_MIN_SAMPLES = 20
+FINAL_CMD_STATUSES = {'success', 'failed', 'failure', 'partial'}
+
 
 class ExecutionLogValidator:
     """Validates execution_log.yaml files for anomalies."""
@@ -46,16 +94,22 @@ class ExecutionLogValidator:
     VALID_CMD_STATUSES = {'success', 'failed', 'running', 'pending'}
     VALID_TASK_STATUSES = {'success', 'failed', 'running', 'pending', 'partial'}
 
-    def __init__(self, exec_log_path: str, config_path: str = 'config.yaml'):
-        """Initialize validator with paths."""
+    def __init__(self, exec_log_path: str, config_path: str = 'config.yaml',
+                 default_settings: Optional[CmdConfig] = None):
+        """
+        Initialize validator with paths. default_settings, when given, is
+        used instead of reading config_path for logs without a cmd snapshot.
+        """
         self.exec_log_path = Path(exec_log_path)
         self.config_path = Path(config_path)
+        self.default_settings = default_settings
         self.exec_log = None
         self.config = None
+        self.settings = None
         self.anomalies = []
 
     def load_files(self) -> bool:
-        """Load execution_log.yaml and config.yaml."""
+        """Load execution_log.yaml and the effective config."""
         try:
             if not self.exec_log_path.exists():
                 self.anomalies.append({
@@ -65,17 +119,24 @@ class ExecutionLogValidator:
                 })
                 return False
 
-            with open(self.exec_log_path, 'r') as f:
-                self.exec_log = yaml.safe_load(f)
-                if not isinstance(self.exec_log, dict):
-                    self.anomalies.append({
-                        'type': 'E281',
-                        'message': 'execution_log.yaml is not a valid YAML mapping',
-                        'severity': 'critical'
-                    })
-                    return False
-
-        except yaml.YAMLError as e:
+            if not yaml_io.available():
+                self.anomalies.append({
+                    'type': 'E365',
+                    'message': 'PyYAML not installed (pip3 install pyyaml)',
+                    'severity': 'critical'
+                })
+                return False
+
+            self.exec_log = yaml_io.load(self.exec_log_path)
+            if not isinstance(self.exec_log, dict):
+                self.anomalies.append({
+                    'type': 'E281',
+                    'message': 'execution_log.yaml is not a valid YAML mapping',
+                    'severity': 'critical'
+                })
+                return False
+
+        except yaml_io.YAMLError as e:
             self.anomalies.append({
                 'type': 'E201',
                 'message': f'YAML parse error: {str(e)}',
@@ -90,19 +151,27 @@ class ExecutionLogValidator:
             })
             return False
 
-        # Load config for threshold values
+        self.load_settings()
+        return True
+
+    def load_settings(self) -> None:
+        """
+        Load config for threshold values: the merged snapshot of the cmd
+        this log belongs to, else the project config.
+        """
         try:
-            if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    self.config = yaml.safe_load(f)
-            else:
-                # Use defaults if config not found
-                self.config = {}
+            self.settings = load_cmd_config(str(self.exec_log_path.parent))
+            if self.settings is None and self.default_settings is not None:
+                self.settings = self.default_settings
+            if self.settings is None and self.config_path.exists():
+                self.settings = load_config_file(str(self.config_path))
         except Exception:
             # If config fails to load, use defaults
-            self.config = {}
-
-        return True
+            self.settings = None
+        if self.settings is None:
+            # Use defaults if config not found
+            self.settings = CmdConfig({})
+        self.config = self.settings.data
 
     def validate(self) -> bool:
         """Run all validation checks."""
@@ -113,8 +182,8 @@ class ExecutionLogValidator:
             return False
 
         # Get threshold values from config
-        max_cmd_duration_sec = self.config.get('max_cmd_duration_sec', 1800)
-        max_retries = self.config.get('max_retries', 2)
+        max_cmd_duration_sec = self.settings.max_cmd_duration_sec
+        max_retries = self.settings.max_retries
 
         # Validate cmd-level fields
         self._validate_cmd_status()
@@ -137,23 +206,30 @@ class ExecutionLogValidator:
 
             # Validate each task
             for task in tasks:
-                if not isinstance(task, dict):
-                    self.anomalies.append({
-                        'type': 'E283',
-                        'message': 'task entry is not a dict',
-                        'task': None,
-                        'severity': 'error'
-                    })
-                    continue
-
-                task_id = task.get('id')
-                self._validate_task_status(task, task_id)
-                self._validate_task_finished(task, task_id)
-                self._validate_task_duration(task, max_cmd_duration_sec, task_id)
-                self._validate_task_retries(task, max_retries, task_id)
+                self.validate_task(task, max_cmd_duration_sec, max_retries)
 
         return len(self.anomalies) == 0
 
+    def validate_task(self, task: Any, max_cmd_duration_sec: Optional[int],
+                      max_retries: int) -> List[Dict[str, Any]]:
+        """Run the per-task checks on one entry; returns (and records) its anomalies."""
+        start = len(self.anomalies)
+        if not isinstance(task, dict):
+            self.anomalies.append({
+                'type': 'E283',
+                'message': 'task entry is not a dict',
+                'task': None,
+                'severity': 'error'
+            })
+            return self.anomalies[start:]
+
+        task_id = task.get('id')
+        self._validate_task_status(task, task_id)
+        self._validate_task_finished(task, task_id)
+        self._validate_task_duration(task, max_cmd_duration_sec, task_id)
+        self._validate_task_retries(task, max_retries, task_id)
+        return self.anomalies[start:]
+
     def _validate_cmd_status(self) -> None:
         """Check if cmd status is valid."""
         status = self.exec_log.get('status')
@@ -218,7 +294,7 @@ class ExecutionLogValidator:
                 'severity': 'error'
             })
 
-    def _validate_task_duration(self, task: Dict, max_duration: int, task_id: Any) -> None:
+    def _validate_task_duration(self, task: Dict, max_duration: Optional[int], task_id: Any) -> None:
         """Check if task duration exceeds threshold."""
         duration = task.get('duration_sec')
         status = task.get('status')
@@ -227,6 +303,10 @@ class ExecutionLogValidator:
         if status == 'running':
             return
 
+        # max_cmd_duration_sec: null disables time tracking
+        if max_duration is None:
+            return
+
         if duration is not None and isinstance(duration, (int, float)):
             if duration > max_duration:
                 self.anomalies.append({
@@ -311,14 +391,520 @@ class ExecutionLogValidator:
             print(f'  [{code}] {message}')
 
 
-def main():
+# ============================================================================
+# Batch mode
+# ============================================================================
+
+def iter_exec_log_paths(targets: List[str]) -> Iterator[str]:
+    """
+    execution_log.yaml paths for batch targets, streamed:
+      directory - a cmd directory (has execution_log.yaml), else a work
+                  root: <dir>/cmd_*/execution_log.yaml by cmd number
+      other     - glob pattern (** allowed); matched directories are
+                  read as <match>/execution_log.yaml
+    """
+    for target in targets:
+        if os.path.isdir(target):
+            own = os.path.join(target, EXEC_LOG_FILE)
+            if os.path.isfile(own):
+                yield own
+                continue
+            with os.scandir(target) as entries:
+                cmds = [(cmd_archive.cmd_number(entry.name), entry.path) for entry in entries
+                        if cmd_archive.cmd_number(entry.name) is not None and entry.is_dir()]
+            for _, cmd_dir in sorted(cmds):
+                path = os.path.join(cmd_dir, EXEC_LOG_FILE)
+                if os.path.isfile(path):
+                    yield path
+            continue
+        matches = sorted(glob.iglob(target, recursive=True))
+        if not matches:
+            # Archived cmds (work/archive/) resolve to an extracted copy
+            resolved = cmd_archive.resolve_path(target)
+            if resolved is not None:
+                matches = [resolved]
+        for match in matches:
+            yield os.path.join(match, EXEC_LOG_FILE) if os.path.isdir(match) else match
+
+
+def validate_log(path: str, default_settings: Optional[CmdConfig]) -> LogResult:
+    """Validate one log; exit code as for a single-log run."""
+    validator = ExecutionLogValidator(path, default_settings=default_settings)
+    valid = validator.validate()
+    return path, 0 if valid else 1, validator.anomalies
+
+
+def _validate_chunk(paths: List[str], default_settings: Optional[CmdConfig]) -> List[LogResult]:
+    """Pool worker: validate_log() for each path."""
+    return [validate_log(path, default_settings) for path in paths]
+
+
+def _iter_chunks(paths: Iterator[str], size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for path in paths:
+        chunk.append(path)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_batch_results(targets: List[str], jobs: int,
+                       default_settings: Optional[CmdConfig] = None) -> Iterator[LogResult]:
+    """
+    Validate every log matched by targets, yielding results in discovery
+    order. jobs > 1 uses a process pool with at most
+    jobs * BATCH_CHUNKS_PER_JOB chunks queued.
+    """
+    chunks = _iter_chunks(iter_exec_log_paths(targets), BATCH_CHUNK_SIZE)
+    if jobs <= 1:
+        for paths in chunks:
+            yield from _validate_chunk(paths, default_settings)
+        return
+
+    window: deque = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for paths in chunks:
+            window.append(pool.submit(_validate_chunk, paths, default_settings))
+            while len(window) >= jobs * BATCH_CHUNKS_PER_JOB:
+                yield from window.popleft().result()
+        while window:
+            yield from window.popleft().result()
+
+
+def run_batch(targets: List[str], jobs: int, default_settings: Optional[CmdConfig] = None,
+              report_format: str = 'text') -> int:
+    """
+    Batch mode report. text: anomalies of every log grouped by code, the
+    logs that would exit non-zero, then a summary. json: one line per log
+    ({"path", "exit_code", "anomalies"}), then a summary line with anomaly
+    counts by code. Returns the exit code (0 = no anomalies in any log).
+    """
+    total = failed = 0
+    by_code: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+    failed_logs: List[Tuple[str, int, int]] = []
+    for path, exit_code, anomalies in iter_batch_results(targets, jobs, default_settings):
+        total += 1
+        if exit_code:
+            failed += 1
+            failed_logs.append((path, exit_code, len(anomalies)))
+        for anomaly in anomalies:
+            by_code.setdefault(anomaly['type'], []).append((path, anomaly))
+        if report_format == 'json':
+            print(json.dumps({
+                'path': path, 'exit_code': exit_code, 'anomalies': anomalies,
+            }, ensure_ascii=False, default=str))
+
+    codes = sorted(by_code)
+    if report_format == 'json':
+        print(json.dumps({'summary': {
+            'total': total,
+            'clean': total - failed,
+            'with_anomalies': failed,
+            'by_code': {code: len(by_code[code]) for code in codes},
+        }}))
+    else:
+        for code in codes:
+            description = ERROR_CODES.get(code, '')
+            print(f'=== {code}{": " + description if description else ""} ({len(by_code[code])}) ===')
+            for path, anomaly in by_code[code]:
+                task = anomaly.get('task')
+                where = f'{path}: Task {task}' if task is not None else path
+                print(f'  [{anomaly.get("severity", "error")}] {where}: {anomaly["message"]}')
+            print()
+        if failed_logs:
+            print('=== PER-LOG EXIT CODES (non-zero) ===')
+            for path, exit_code, count in failed_logs:
+                print(f'  {exit_code}  {path} ({count} anomalies)')
+            print()
+        print('=== SUMMARY ===')
+        print(f'Logs: {total}, Clean: {total - failed}, With anomalies: {failed}')
+
+    if total == 0:
+        print(f"No execution logs matched: {' '.join(targets)}", file=sys.stderr)
+        return 1
+    return 0 if failed == 0 else 1
+
+
+# ============================================================================
+# Watch mode
+# ============================================================================
+
+class _Inotify:
+    """
+    inotify on a directory through ctypes (Linux). The directory is watched
+    rather than the file, so replacing the log (write + rename) is seen.
+    Raises OSError where inotify is unavailable.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+
+    def __init__(self, directory: str):
+        import ctypes
+        import ctypes.util
+        if not sys.platform.startswith('linux'):
+            raise OSError('inotify is Linux only')
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f'inotify_add_watch failed: {directory}')
+        self.fd = fd
+
+    def wait(self, timeout: float) -> bool:
+        """Block until an event or timeout; True if any event arrived (events drained)."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+_TASKS_KEY_RE = re.compile(r'^tasks:[ \t]*(?:#.*)?$', re.MULTILINE)
+# Anchors, aliases and tags can tie entries together: parse such logs whole
+_NODE_PROPERTY_RE = re.compile(r'(?:^|[\s\[{,])[&*!]')
+
+
+class _TaskBlockLoader:
+    """
+    Parses a block-style execution log one task entry at a time, reusing
+    the parsed entry while its text is unchanged; load() returns None for
+    layouts it does not handle (the caller parses the whole file).
+    """
+
+    def __init__(self):
+        self.blocks: Dict[str, Any] = {}
+        self.header: Tuple[Optional[str], Any] = (None, None)
+
+    def load(self, text: str) -> Optional[Dict[str, Any]]:
+        keys = list(_TASKS_KEY_RE.finditer(text))
+        if len(keys) != 1 or _NODE_PROPERTY_RE.search(text):
+            return None
+        lines = text[keys[0].end():].split('\n')[1:]
+        blocks: List[List[str]] = []
+        indent = None
+        end = len(lines)
+        for i, line in enumerate(lines):
+            stripped = line.lstrip(' ')
+            if not stripped or stripped.startswith('#'):
+                if blocks:
+                    blocks[-1].append(line)
+                continue
+            width = len(line) - len(stripped)
+            if indent is None:
+                indent = width
+            if width == indent and (stripped == '-' or stripped.startswith('- ')):
+                blocks.append([line])
+            elif width > indent and blocks and not stripped.startswith('\t'):
+                blocks[-1].append(line)
+            elif width == 0:
+                end = i
+                break
+            else:
+                return None
+
+        # Each entry keeps the line break that ends it (block scalars clip to it)
+        texts = ['\n'.join(block) + '\n' for block in blocks]
+        if texts and end == len(lines) and not text.endswith('\n'):
+            texts[-1] = texts[-1][:-1]
+        try:
+            tasks = [self._task(block) for block in texts]
+            header = text[:keys[0].start()] + '\n'.join(lines[end:])
+            if header != self.header[0]:
+                self.header = (header, yaml_io.loads(header) or {})
+        except (yaml_io.YAMLError, ValueError):
+            return None
+        if not isinstance(self.header[1], dict) or 'tasks' in self.header[1]:
+            return None
+        self.blocks = dict(zip(texts, tasks))
+        document = dict(self.header[1])
+        document['tasks'] = tasks or None
+        return document
+
+    def _task(self, block: str) -> Any:
+        if block in self.blocks:
+            return self.blocks[block]
+        parsed = yaml_io.loads('tasks:\n' + block)
+        if not isinstance(parsed, dict) or not isinstance(parsed.get('tasks'), list) \
+                or len(parsed['tasks']) != 1:
+            raise ValueError('not a single task entry')
+        return parsed['tasks'][0]
+
+
+def role_p95(targets: List[str], exclude: Optional[str] = None) -> Dict[str, float]:
+    """p95 duration_sec per role over past logs (roles with HISTORY_MIN_SAMPLES+ timed tasks)."""
+    from exec_log_stats import TaskColumns, group_stats
+    columns = TaskColumns()
+    skip = os.path.realpath(exclude) if exclude else None
+    for path in iter_exec_log_paths(targets):
+        if os.path.realpath(path) != skip:
+            columns.add_file(path)
+    return {role: stats['p95'] for role, stats in group_stats(columns)['role'].items()
+            if stats['timed'] >= HISTORY_MIN_SAMPLES and stats['p95'] is not None}
+
+
+def _parse_started(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.strip()).replace(tzinfo=None)
+        except ValueError:
+            return None
+    return None
+
+
+class ExecutionLogWatcher:
+    """
+    Follows one live execution log. Keeps the anomalies of each task entry,
+    keyed by id and occurrence, with the parsed entry they were found on;
+    a change re-validates only entries that no longer compare equal.
+    """
+
+    CMD_KEY = ('cmd',)
+
+    def __init__(self, exec_log_path: str, config_path: str = 'config.yaml',
+                 role_limits: Optional[Dict[str, float]] = None, out=None):
+        self.path = exec_log_path
+        self.config_path = config_path
+        self.validator = ExecutionLogValidator(exec_log_path, config_path)
+        self.role_limits = role_limits or {}
+        self.out = out or sys.stdout
+        self.signature: Optional[Tuple[int, int, int]] = None
+        self.loader = _TaskBlockLoader()
+        self.entries: Dict[Any, Tuple[Any, List[Dict[str, Any]]]] = {}
+        self.running: Dict[Any, Tuple[Any, str, datetime]] = {}
+        self.stall_warned: set = set()
+        self.load_error: Optional[str] = None
+        self.revalidated = 0
+        self.finished = False
+
+    def _emit(self, text: str) -> None:
+        print(f'[{datetime.now():%H:%M:%S}] {text}', file=self.out, flush=True)
+
+    def anomalies(self) -> List[Dict[str, Any]]:
+        return [a for _, found in self.entries.values() for a in found]
+
+    def refresh(self) -> bool:
+        """Re-read the log if its signature changed; returns True if it was re-read."""
+        signature = _file_signature(self.path)
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        validator = self.validator
+        validator.anomalies = []
+        try:
+            with open(self.path, 'rb') as f:
+                log = self.loader.load(f.read().decode('utf-8'))
+        except (OSError, UnicodeDecodeError, ImportError):
+            log = None
+        if log is not None:
+            validator.exec_log = log
+            validator.load_settings()
+        elif not validator.load_files():
+            error = validator.anomalies[0]['message'] if validator.anomalies else 'unreadable'
+            if error != self.load_error:
+                self._emit(f'cannot read log (waiting for the next change): {error}')
+            self.load_error = error
+            return True
+        self.load_error = None
+        log = validator.exec_log
+        max_duration = validator.settings.max_cmd_duration_sec
+        max_retries = validator.settings.max_retries
+        # Thresholds are part of every task's state: a new cmd snapshot re-checks all
+        limits = (max_duration, max_retries)
+
+        seen = set()
+        running: Dict[Any, Tuple[Any, str, datetime]] = {}
+        if log:  # an empty mapping has nothing to check (as in validate())
+            state = {k: v for k, v in log.items() if k != 'tasks'}
+            self._update(self.CMD_KEY, state, self._cmd_anomalies)
+            seen.add(self.CMD_KEY)
+
+        tasks = log.get('tasks', [])
+        if not isinstance(tasks, list):
+            self._update(('tasks',), 'not a list', lambda: [{
+                'type': 'E283', 'message': 'tasks field must be a list', 'task': None,
+                'severity': 'critical'}])
+            seen.add(('tasks',))
+            tasks = []
+        elif tasks:
+            ids = [task.get('id') if isinstance(task, dict) else None for task in tasks]
+            self._update(('duplicates',), ids,
+                         lambda: self._duplicate_anomalies(tasks))
+            seen.add(('duplicates',))
+
+        occurrences: Dict[str, int] = {}
+        for task in tasks:
+            task_id = task.get('id') if isinstance(task, dict) else None
+            # Key by id and occurrence so an inserted entry doesn't shift the others
+            name = repr(task_id)
+            occurrence = occurrences[name] = occurrences.get(name, -1) + 1
+            key = ('task', name, occurrence)
+            seen.add(key)
+            self._update(key, (limits, task),
+                         lambda task=task: validator.validate_task(task, max_duration, max_retries))
+            if isinstance(task, dict) and task.get('status') == 'running':
+                started = _parse_started(task.get('started'))
+                if started is not None:
+                    role = task.get('role')
+                    running[key] = (task_id, str(role) if role is not None else '', started)
+
+        for key in [k for k in self.entries if k not in seen]:
+            del self.entries[key]
+        self.running = running
+        self.stall_warned &= {(key, kind) for key, kind in self.stall_warned if key in running}
+        self.finished = log.get('status') in FINAL_CMD_STATUSES and not running
+        return True
+
+    def _cmd_anomalies(self) -> List[Dict[str, Any]]:
+        validator = self.validator
+        start = len(validator.anomalies)
+        validator._validate_cmd_status()
+        validator._validate_cmd_finished()
+        return validator.anomalies[start:]
+
+    def _duplicate_anomalies(self, tasks: List[Any]) -> List[Dict[str, Any]]:
+        validator = self.validator
+        start = len(validator.anomalies)
+        validator._check_duplicate_ids(tasks)
+        return validator.anomalies[start:]
+
+    def _update(self, key: Any, state: Any, check) -> None:
+        previous = self.entries.get(key)
+        if previous is not None and previous[0] == state:
+            return
+        found = check()
+        self.revalidated += 1
+        known = {(a['type'], a['message']) for a in previous[1]} if previous else set()
+        for anomaly in found:
+            if (anomaly['type'], anomaly['message']) not in known:
+                self._emit(f'{anomaly.get("severity", "error").upper()} [{anomaly["type"]}] '
+                           f'{anomaly["message"]}')
+        self.entries[key] = (state, found)
+
+    def check_stalls(self, now: Optional[datetime] = None) -> None:
+        """Warn (once per task and limit) about running tasks past their limits."""
+        now = now or datetime.now()
+        max_duration = self.validator.settings.max_cmd_duration_sec if self.validator.settings else None
+        for key, (task_id, role, started) in self.running.items():
+            elapsed = (now - started).total_seconds()
+            limits = []
+            if max_duration is not None:
+                limits.append(('max_cmd_duration_sec', max_duration))
+            if role in self.role_limits:
+                limits.append((f'{role} p95', self.role_limits[role]))
+            for kind, limit in limits:
+                if elapsed > limit and (key, kind) not in self.stall_warned:
+                    self.stall_warned.add((key, kind))
+                    self._emit(f'WARNING [E284] task {task_id} ({role or "no role"}) running for '
+                               f'{elapsed:.0f}s, exceeds {kind} {limit:g}s (possible stall)')
+
+    def run(self, interval: float = WATCH_INTERVAL_SEC) -> int:
+        """
+        Watch until the cmd has kept a final status for one quiet interval
+        (the parent session may still be writing `finished` or the last
+        task entries), or Ctrl-C. The exit code comes from a full
+        validation of the log as it is at that point.
+        """
+        try:
+            notifier: Optional[_Inotify] = _Inotify(os.path.dirname(os.path.abspath(self.path)))
+        except (OSError, AttributeError):
+            notifier = None
+        self._emit(f'watching {self.path} ({"inotify" if notifier else "polling"}, '
+                   f'stall check every {interval:g}s)')
+        last_change = time.monotonic()
+        try:
+            while True:
+                if self.refresh():
+                    last_change = time.monotonic()
+                self.check_stalls()
+                quiet = time.monotonic() - last_change
+                if self.finished and quiet >= interval:
+                    break
+                # Events for other files in the directory wake the wait early
+                timeout = interval - quiet if self.finished else interval
+                if notifier is not None:
+                    notifier.wait(timeout)
+                else:
+                    time.sleep(timeout)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if notifier is not None:
+                notifier.close()
+        state = 'finished' if self.finished else 'stopped'
+        self._emit(f'{state} ({self.revalidated} entry checks); final log:')
+        final = ExecutionLogValidator(self.path, self.config_path)
+        final.validate()
+        with contextlib.redirect_stdout(self.out):
+            final.report()
+        return 1 if final.anomalies else 0
+
+
+def main(argv=None):
     """Main entry point."""
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(
+        description='Validate execution_log.yaml (or many logs with --batch)',
+    )
+    parser.add_argument(
+        'exec_log', nargs='?',
+        help='execution_log.yaml to validate',
+    )
+    parser.add_argument(
+        '--batch', nargs='+', metavar='DIR_OR_GLOB',
+        help='validate many logs: a work root (cmd_*/execution_log.yaml), a cmd '
+             'directory or a glob; report grouped by anomaly code',
+    )
+    parser.add_argument(
+        '--jobs', type=int, default=os.cpu_count() or 1,
+        help='worker processes for --batch (default: CPU count)',
+    )
+    parser.add_argument(
+        '--format', choices=('text', 'json'), default='text',
+        help='--batch report: text grouped by code (default) or JSON lines per log',
+    )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help='follow the live log: re-validate changed entries, warn about stalled running tasks',
+    )
+    parser.add_argument(
+        '--interval', type=float, default=WATCH_INTERVAL_SEC,
+        help=f'--watch: stall check / polling interval in seconds (default: {WATCH_INTERVAL_SEC:g})',
+    )
+    parser.add_argument(
+        '--history', nargs='+', metavar='DIR_OR_GLOB',
+        help='--watch: logs for the per-role p95 limits (default: the work root of the '
+             'watched cmd; roles with fewer than %d timed tasks are skipped)' % HISTORY_MIN_SAMPLES,
+    )
+    args = parser.parse_args(argv)
+    if not args.exec_log and not args.batch:
         print('Usage: python3 scripts/validate_exec_log.py <path/to/execution_log.yaml>')
         sys.exit(1)
 
-    exec_log_path = sys.argv[1]
-
     # Determine config.yaml path (look in same directory or parent)
     config_path = 'config.yaml'
     if not Path(config_path).exists():
@@ -328,6 +914,29 @@ def main():
         if potential_config.exists():
             config_path = str(potential_config)
 
+    if args.batch:
+        # Parsed once here and shared by every log without a cmd snapshot
+        try:
+            default_settings = load_config_file(config_path) if Path(config_path).exists() else None
+        except Exception:
+            default_settings = None
+        sys.exit(run_batch(args.batch, max(1, args.jobs), default_settings or CmdConfig({}),
+                           args.format))
+
+    if args.watch:
+        if args.interval <= 0:
+            parser.error('--interval must be > 0')
+        history = args.history
+        if history is None:
+            split = cmd_archive.split_cmd_path(os.path.abspath(args.exec_log))
+            history = [split[0]] if split else []
+        role_limits = role_p95(history, exclude=args.exec_log) if history else {}
+        watcher = ExecutionLogWatcher(args.exec_log, config_path, role_limits)
+        sys.exit(watcher.run(args.interval))
+
+    # Archived cmds (work/archive/) resolve to an extracted copy
+    exec_log_path = cmd_archive.resolve_path(args.exec_log) or args.exec_log
+
     validator = ExecutionLogValidator(exec_log_path, config_path)
     has_anomalies = not validator.validate()
     validator.report()
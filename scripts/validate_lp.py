@@ -3,15 +3,23 @@
 # Validates LP (Learned Preference) entities for format correctness.
 # Usage:
 #   echo '{"name": "lp:vocabulary:simplicity", ...}' | scripts/validate_lp.py
-#   scripts/validate_lp.py --file lp_export.json
+#   scripts/validate_lp.py --file lp_export.json     # array, object or JSON Lines
+#   scripts/validate_lp.py --file lp_export.jsonl --jobs 4 --format json
+#   scripts/validate_lp.py --file lp_export.json --cache   # reuse verdicts of unchanged entities
 #   scripts/validate_lp.py --candidate "lp:defaults:typescript" "[what] ... [evidence] ... [scope] ... [action] ..."
-# Exit code: 0 = valid, 1 = validation errors found
+#   scripts/validate_lp.py --serve        # JSON-lines requests on stdin (--socket PATH: Unix socket)
+# Exit code: 0 = valid, 1 = validation errors found (server modes: 0 on exit)
 
+import os
 import sys
 import json
 import re
+import hashlib
 import argparse
-from typing import Dict, List, Tuple, Optional
+import tempfile
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Optional
 
 # Allowed cluster names (from result_8.md Section 1, with Mutation 2 rename)
 ALLOWED_CLUSTERS = {
@@ -53,11 +61,254 @@ QUALITY_FORBIDDEN_ACTIONS = [
     "never confirm destructive", "always use", "ignore performance"
 ]
 
+# Personal identity references in [scope] (heuristic check)
+IDENTITY_KEYWORDS = ["user's", "user is", "my", "personal"]
+
+# Keywords up to this length only match as whole words ("iq" not in "unique",
+# "eq" not in "frequent", "my" not in "economy")
+WHOLE_WORD_MAX_LEN = 3
+
 # Observation length constraints
 MIN_OBSERVATION_LENGTH = 100
 MAX_OBSERVATION_LENGTH = 500
 
 
+# Keyword matching (privacy / quality / identity scans)
+_TRIE_END = ''  # trie node key holding the index of the keyword ending there
+_WORD_CHAR = re.compile(r'\w')
+
+# Distinct words remembered per automaton (cleared when full)
+KEYWORD_MEMO_MAX_ENTRIES = 65536
+
+
+class KeywordAutomaton:
+    """
+    Multi-keyword matcher compiled once (at import for the lists above).
+
+    Keywords without spaces go into a trie that is emitted as one regex
+    (shared prefixes factored: 'co(?:gnitive|mpensation|...)'), so a word is
+    scanned once for all of them; the trie is walked at each stop to report
+    every keyword starting there, overlapping ones included. Keywords with
+    spaces ('political views') are matched as runs of words.
+
+    Text is split on single spaces - a keyword can only span a split at its
+    own spaces - and each distinct word is scanned once: words without hits
+    go into a set, so once the vocabulary is warm a clean observation costs
+    one split and one set check instead of one substring search per keyword.
+
+    Keywords of at most whole_word_max_len characters only match as whole
+    words ('iq' does not match in 'unique'). Keywords are lower-cased;
+    callers pass lower-cased text.
+    """
+
+    def __init__(self, keywords: List[str], whole_word_max_len: int = 0):
+        self.keywords = [k.lower() for k in keywords]
+        self._whole_word = {i for i, k in enumerate(self.keywords) if len(k) <= whole_word_max_len}
+        self._trie: Dict[str, dict] = {}
+        self._phrases: List[Tuple[int, List[str]]] = []  # (index, words) for keywords with spaces
+        for index, keyword in enumerate(self.keywords):
+            if not keyword.strip():
+                raise ValueError(f"blank keyword: {keyword!r}")
+            if ' ' in keyword:
+                self._phrases.append((index, keyword.split(' ')))
+                continue
+            node = self._trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node.setdefault(_TRIE_END, index)  # duplicates: first index wins
+        self._pattern = re.compile(self._trie_pattern(self._trie, 0)) if self._trie else None
+        self._clean: set = set()  # words without hits
+        self._hits: Dict[str, tuple] = {}  # word -> hits inside it (_word_entries)
+
+    def _trie_pattern(self, node: dict, depth: int) -> str:
+        alternatives = [
+            re.escape(ch) + self._trie_pattern(child, depth + 1)
+            for ch, child in sorted(node.items()) if ch != _TRIE_END
+        ]
+        index = node.get(_TRIE_END)
+        if index is not None:
+            # Longer keywords first; a whole-word keyword ends only if no word
+            # character precedes its start or follows its end
+            alternatives.append(
+                rf'(?<!\w.{{{depth}}})(?!\w)' if index in self._whole_word else ''
+            )
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+
+    def _word_entries(self, word: str) -> tuple:
+        """
+        Hits inside one word (remembered): (start, end, keyword index) for
+        trie keywords, (start, -1, phrase number) where the word ends with
+        the first word of a phrase keyword.
+        """
+        entries = []
+        if self._pattern is not None:
+            search = self._pattern.search
+            pos = 0
+            while True:
+                match = search(word, pos)
+                if match is None:
+                    break
+                start = i = match.start()
+                node = self._trie
+                while i < len(word):
+                    node = node.get(word[i])
+                    if node is None:
+                        break
+                    i += 1
+                    index = node.get(_TRIE_END)
+                    if index is not None and (index not in self._whole_word
+                                              or self._bounded(word, start, word, i)):
+                        entries.append((start, i, index))
+                pos = start + 1
+        for number, (_, parts) in enumerate(self._phrases):
+            if word.endswith(parts[0]):
+                entries.append((len(word) - len(parts[0]), -1, number))
+
+        if len(self._clean) + len(self._hits) >= KEYWORD_MEMO_MAX_ENTRIES:
+            self._clean.clear()
+            self._hits.clear()
+        if entries:
+            entries = self._hits[word] = tuple(entries)
+        else:
+            self._clean.add(word)
+        return entries
+
+    @staticmethod
+    def _bounded(first: str, start: int, last: str, end: int) -> bool:
+        """No word character before first[start] or at last[end]."""
+        if start > 0 and _WORD_CHAR.match(first, start - 1):
+            return False
+        return not _WORD_CHAR.match(last, end)
+
+    def _scan(self, text: str, pos: int, endpos: Optional[int]) -> List[Tuple[int, int, int]]:
+        """Sorted (start, end, keyword index) hits in text[pos:endpos]."""
+        if pos or endpos is not None:
+            text = text[pos:endpos]
+        words = text.split(' ')
+        clean = self._clean
+        if clean.issuperset(words):
+            return []
+
+        hits = []
+        offset = pos
+        for i, word in enumerate(words):
+            if word in clean:
+                offset += len(word) + 1
+                continue
+            entries = self._hits.get(word)
+            if entries is None:
+                entries = self._word_entries(word)
+            for start, end, ref in entries:
+                if end >= 0:
+                    hits.append((offset + start, offset + end, ref))
+                    continue
+                index, parts = self._phrases[ref]
+                last = i + len(parts) - 1
+                if (last < len(words) and words[i + 1:last] == parts[1:-1]
+                        and words[last].startswith(parts[-1])
+                        and (index not in self._whole_word
+                             or self._bounded(words[i], start, words[last], len(parts[-1])))):
+                    end = offset + sum(len(w) + 1 for w in words[i:last]) + len(parts[-1])
+                    hits.append((offset + start, end, index))
+            offset += len(word) + 1
+        hits.sort()
+        return hits
+
+    def finditer(self, text: str, pos: int = 0,
+                 endpos: Optional[int] = None) -> Iterator[Tuple[int, int, str]]:
+        """
+        Every keyword occurrence in text[pos:endpos] as (start, end, keyword),
+        ordered by start then end; overlapping occurrences are all reported.
+        The slice edges count as word boundaries.
+        """
+        for start, end, index in self._scan(text, pos, endpos):
+            yield start, end, self.keywords[index]
+
+    def found(self, text: str, pos: int = 0, endpos: Optional[int] = None) -> List[str]:
+        """Distinct keywords occurring in text[pos:endpos], in keyword list order."""
+        hits = self._scan(text, pos, endpos)
+        if not hits:
+            return []
+        return [self.keywords[i] for i in sorted({index for _, _, index in hits})]
+
+
+PRIVACY_AUTOMATON = KeywordAutomaton(PRIVACY_FORBIDDEN_KEYWORDS, WHOLE_WORD_MAX_LEN)
+IDENTITY_AUTOMATON = KeywordAutomaton(IDENTITY_KEYWORDS, WHOLE_WORD_MAX_LEN)
+QUALITY_AUTOMATON = KeywordAutomaton(QUALITY_FORBIDDEN_ACTIONS, WHOLE_WORD_MAX_LEN)
+
+
+# Observation parsing (once per observation, shared by all validators)
+OBSERVATION_TAGS = ("[what]", "[evidence]", "[scope]", "[action]")
+
+
+class ParsedObservation:
+    """
+    One observation parsed once: the tag offsets and every section the
+    validators read, so none of them rescans the text.
+      text        - the observation
+      lower       - text lower-cased (privacy keyword scan)
+      offsets     - first offset of [what] [evidence] [scope] [action] (-1: missing)
+      sections    - stripped contents of the four sections, None unless all
+                    four tags are present and in order
+      scope_text  - [scope] up to the next '[', stripped and lower-cased
+                    (identity check); None if there is none
+      action_text - first line of [action], stripped and lower-cased
+                    (quality check); None without an [action] tag
+    """
+
+    __slots__ = ('text', 'lower', 'offsets', 'sections', 'scope_text', 'action_text')
+
+    def __init__(self, text: str):
+        find = text.find
+        what = find("[what]")
+        evidence = find("[evidence]")
+        scope = find("[scope]")
+        action = find("[action]")
+
+        self.text = text
+        self.lower = text.lower()
+        self.offsets = (what, evidence, scope, action)
+
+        sections = None
+        if 0 <= what < evidence < scope < action:
+            sections = (
+                text[what + 6:evidence].strip(),
+                text[evidence + 11:scope].strip(),
+                text[scope + 7:action].strip(),
+                text[action + 8:].strip(),
+            )
+        self.sections = sections
+
+        # First [scope] not directly followed by '[' runs to the next '['
+        self.scope_text = None
+        while scope >= 0:
+            end = find("[", scope + 7)
+            if end < 0:
+                end = len(text)
+            if end > scope + 7:
+                if sections is not None and end == action and scope == self.offsets[2]:
+                    self.scope_text = sections[2].lower()  # same slice
+                else:
+                    self.scope_text = text[scope + 7:end].strip().lower()
+                break
+            scope = find("[scope]", scope + 1)
+
+        self.action_text = None
+        if sections is not None:
+            self.action_text = sections[3].partition("\n")[0].rstrip().lower()
+        elif action >= 0:
+            self.action_text = text[action + 8:].lstrip().partition("\n")[0].rstrip().lower()
+
+
+def parse_observation(observation) -> ParsedObservation:
+    """ParsedObservation for a str (records are returned as is)."""
+    if isinstance(observation, ParsedObservation):
+        return observation
+    return ParsedObservation(observation)
+
+
 def validate_naming_convention(name: str) -> Tuple[bool, str]:
     """
     Validate LP entity naming convention: lp:{cluster}:{topic}
@@ -99,13 +350,14 @@ def validate_naming_convention(name: str) -> Tuple[bool, str]:
     return True, ""
 
 
-def validate_observation_format(observation: str, is_internal: bool = False) -> Tuple[bool, str]:
+def validate_observation_format(observation, is_internal: bool = False) -> Tuple[bool, str]:
     """
     Validate 4-element observation format:
     [what] ... [evidence] ... [scope] ... [action] ...
 
     For internal entities, the format is different (e.g., signal_log, metadata).
     Internal entities are exempt from strict format validation.
+    observation: str or ParsedObservation.
 
     Returns: (is_valid, error_message)
     """
@@ -113,39 +365,20 @@ def validate_observation_format(observation: str, is_internal: bool = False) ->
     if is_internal:
         return True, ""
 
-    required_elements = ["[what]", "[evidence]", "[scope]", "[action]"]
-    missing_elements = []
-
-    for element in required_elements:
-        if element not in observation:
-            missing_elements.append(element)
+    parsed = parse_observation(observation)
+    missing_elements = [tag for tag, offset in zip(OBSERVATION_TAGS, parsed.offsets) if offset < 0]
 
     if missing_elements:
         return False, f"Observation missing required elements: {', '.join(missing_elements)}"
 
     # Check element order (what -> evidence -> scope -> action)
-    what_pos = observation.find("[what]")
-    evidence_pos = observation.find("[evidence]")
-    scope_pos = observation.find("[scope]")
-    action_pos = observation.find("[action]")
-
-    if not (what_pos < evidence_pos < scope_pos < action_pos):
+    if parsed.sections is None:
         return False, "Observation elements must appear in order: [what] [evidence] [scope] [action]"
 
     # Check each section has content (not just the tag)
-    what_content = observation[what_pos + 6:evidence_pos].strip()
-    evidence_content = observation[evidence_pos + 11:scope_pos].strip()
-    scope_content = observation[scope_pos + 7:action_pos].strip()
-    action_content = observation[action_pos + 8:].strip()
-
-    if not what_content:
-        return False, "[what] section is empty"
-    if not evidence_content:
-        return False, "[evidence] section is empty"
-    if not scope_content:
-        return False, "[scope] section is empty"
-    if not action_content:
-        return False, "[action] section is empty"
+    for tag, content in zip(OBSERVATION_TAGS, parsed.sections):
+        if not content:
+            return False, f"{tag} section is empty"
 
     return True, ""
 
@@ -166,65 +399,60 @@ def validate_entity_type(entity_type: str, name: str) -> Tuple[bool, str]:
     return True, ""
 
 
-def validate_privacy_safeguards(observation: str) -> Tuple[bool, List[str]]:
+def validate_privacy_safeguards(observation) -> Tuple[bool, List[str]]:
     """
     Check observation does not violate privacy safeguards.
     From result_13.md: no personality traits, emotional patterns, cognitive abilities.
+    observation: str or ParsedObservation.
 
     Returns: (is_valid, list_of_violations)
     """
     violations = []
-    observation_lower = observation.lower()
+    parsed = parse_observation(observation)
 
-    # Check for forbidden keywords
-    for keyword in PRIVACY_FORBIDDEN_KEYWORDS:
-        if keyword.lower() in observation_lower:
-            violations.append(f"Privacy violation: contains forbidden keyword '{keyword}'")
+    # Check for forbidden keywords (one scan; short keywords as whole words)
+    for keyword in PRIVACY_AUTOMATON.found(parsed.lower):
+        violations.append(f"Privacy violation: contains forbidden keyword '{keyword}'")
 
     # Check scope doesn't reference personal identity (heuristic check)
-    scope_match = re.search(r'\[scope\]\s*([^\[]+)', observation)
-    if scope_match:
-        scope_content = scope_match.group(1).strip().lower()
-        identity_keywords = ["user's", "user is", "my", "personal"]
-        for keyword in identity_keywords:
-            if keyword in scope_content:
-                violations.append(f"Privacy violation: scope references personal identity ('{keyword}')")
+    if parsed.scope_text is not None:
+        for keyword in IDENTITY_AUTOMATON.found(parsed.scope_text):
+            violations.append(f"Privacy violation: scope references personal identity ('{keyword}')")
 
     return len(violations) == 0, violations
 
 
-def validate_quality_guardrails(observation: str) -> Tuple[bool, List[str]]:
+def validate_quality_guardrails(observation) -> Tuple[bool, List[str]]:
     """
     Check observation does not violate quality guardrails.
     From result_8.md Section 5: action must not reference absolute quality aspects.
+    observation: str or ParsedObservation.
 
     Returns: (is_valid, list_of_violations)
     """
     violations = []
 
-    # Extract action section
-    action_match = re.search(r'\[action\]\s*(.+)', observation)
-    if not action_match:
+    # Action section (first line)
+    action_content = parse_observation(observation).action_text
+    if action_content is None:
         # This should be caught by format validation, but be defensive
         return True, []
 
-    action_content = action_match.group(1).strip().lower()
-
-    # Check for forbidden action patterns
-    for pattern in QUALITY_FORBIDDEN_ACTIONS:
-        if pattern.lower() in action_content:
-            violations.append(f"Quality violation: action contains forbidden pattern '{pattern}'")
+    # Check for forbidden action patterns (one scan)
+    for pattern in QUALITY_AUTOMATON.found(action_content):
+        violations.append(f"Quality violation: action contains forbidden pattern '{pattern}'")
 
     return len(violations) == 0, violations
 
 
-def validate_observation_length(observation: str) -> Tuple[bool, str]:
+def validate_observation_length(observation) -> Tuple[bool, str]:
     """
     Check observation length is within acceptable range (100-500 characters).
+    observation: str or ParsedObservation.
 
     Returns: (is_valid, error_message)
     """
-    length = len(observation)
+    length = len(parse_observation(observation).text)
 
     if length < MIN_OBSERVATION_LENGTH:
         return False, f"Observation too short ({length} chars, minimum {MIN_OBSERVATION_LENGTH})"
@@ -289,6 +517,9 @@ def validate_lp_entity(entity: Dict) -> Tuple[bool, List[str]]:
         if is_internal:
             continue
 
+        # Parse once; every check below reads the same record
+        obs = ParsedObservation(obs)
+
         # Validate format
         valid, error = validate_observation_format(obs, is_internal)
         if not valid:
@@ -314,7 +545,316 @@ def validate_lp_entity(entity: Dict) -> Tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
-def validate_from_stdin() -> int:
+# Verdict cache (--cache): skip entities validated by an earlier run
+LP_CACHE_VERSION = 1
+LP_CACHE_MAX_ENTRIES = 100000  # least recently used verdicts evicted past this
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "work", ".lp_cache.json")
+
+
+def rules_fingerprint() -> str:
+    """
+    Hash of everything a verdict depends on: clusters, keyword lists,
+    length limits and the code of this file.
+    """
+    rules = {
+        "clusters": sorted(ALLOWED_CLUSTERS),
+        "privacy": PRIVACY_FORBIDDEN_KEYWORDS,
+        "identity": IDENTITY_KEYWORDS,
+        "quality": QUALITY_FORBIDDEN_ACTIONS,
+        "whole_word_max_len": WHOLE_WORD_MAX_LEN,
+        "observation_length": [MIN_OBSERVATION_LENGTH, MAX_OBSERVATION_LENGTH],
+    }
+    h = hashlib.sha256(json.dumps(rules, sort_keys=True).encode("utf-8"))
+    with open(os.path.abspath(__file__), "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+class LPValidationCache:
+    """
+    Persistent verdicts: sha256 of an entity's canonical JSON -> (valid,
+    errors), in least-recently-used order. The file records the rules
+    fingerprint it was built with; a different fingerprint (or an unreadable
+    file) starts the cache empty. Hits only reorder in memory: a run where
+    every entity hits writes nothing, and the recency is saved with the
+    next insert or eviction.
+    """
+
+    def __init__(self, path: str, max_entries: int = LP_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.rules = rules_fingerprint()
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f, object_pairs_hook=OrderedDict)
+            if data["version"] == LP_CACHE_VERSION and data["rules"] == self.rules:
+                self.entries = data["entries"]
+            else:
+                self.dirty = True  # rules changed: rewrite without the stale verdicts
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError):
+            self.dirty = True
+
+    @staticmethod
+    def key(entity: object) -> str:
+        return hashlib.sha256(_CANONICAL_JSON.encode(entity).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[bool, List[str]]]:
+        verdict = self.entries.get(key)
+        if verdict is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return verdict[0], verdict[1]
+
+    def put(self, key: str, valid: bool, errors: List[str]) -> None:
+        self.entries[key] = [valid, errors]
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically if it changed (a failed write only warns)."""
+        if not self.dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".lp_cache-", dir=directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": LP_CACHE_VERSION, "rules": self.rules,
+                               "entries": self.entries},
+                              f, separators=(",", ":"), ensure_ascii=False)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            print(f"WARNING: Could not write LP cache {self.path}: {e}", file=sys.stderr)
+            return
+        self.dirty = False
+
+
+def validate_lp_entity_cached(entity: Dict, cache: Optional[LPValidationCache]) -> Tuple[bool, List[str]]:
+    """validate_lp_entity(), reusing a cached verdict for identical content."""
+    if cache is None:
+        return validate_lp_entity(entity)
+    key = cache.key(entity)
+    verdict = cache.get(key)
+    if verdict is None:
+        verdict = validate_lp_entity(entity)
+        cache.put(key, *verdict)
+    return verdict
+
+
+# Streaming file input (--file): JSON array, single object or JSON Lines
+JSON_READ_CHUNK = 1 << 16   # characters per read; doubled while a value spans the buffer
+FILE_BATCH_SIZE = 256       # entities per pool task
+FILE_BATCHES_PER_JOB = 2    # pool tasks in flight per worker (bounds memory)
+_NON_WS = re.compile(r'\S')
+_NUMBER_TAIL = re.compile(r'[\d.eE+-]*')
+_TOKEN_END = re.compile(r'[\s,:\[\]{}"]')
+
+
+class _JSONStream:
+    """Text file decoded one JSON value at a time; holds about one value in memory."""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.consumed = 0  # characters dropped before buf
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> None:
+        if self.pos:
+            self.consumed += self.pos
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.f.read(max(JSON_READ_CHUNK, len(self.buf)))
+        if chunk:
+            self.buf += chunk
+        else:
+            self.eof = True
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message}: char {self.consumed + self.pos}")
+
+    def peek(self) -> str:
+        """Skip whitespace; the next character ('' at end of input)."""
+        while True:
+            match = _NON_WS.search(self.buf, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buf[self.pos]
+            self.pos = len(self.buf)
+            if self.eof:
+                return ''
+            self._fill()
+
+    def decode(self):
+        """The JSON value at the next non-whitespace character."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # Only an error at the end of the buffer (a token or string
+                # cut off by it) can be fixed by reading more; past a token
+                # boundary it is malformed, so don't read the rest of the file.
+                if self.eof or (not e.msg.startswith('Unterminated string')
+                                and _TOKEN_END.search(self.buf, e.pos)):
+                    raise ValueError(f"{e.msg}: char {self.consumed + e.pos}") from None
+                self._fill()  # value continues past the buffer
+                continue
+            if (not self.eof and type(value) in (int, float)
+                    and _NUMBER_TAIL.match(self.buf, end).end() == len(self.buf)):
+                self._fill()  # "2." of "2.5e3": the number may continue past the buffer
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_entities(filepath: str) -> Iterator[object]:
+    """
+    Entities of an LP export, parsed incrementally: a JSON array, a single
+    object, or JSON Lines (any whitespace-separated sequence of values).
+    Raises OSError, or ValueError for malformed JSON (after yielding the
+    entities before it).
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        stream = _JSONStream(f)
+        first = stream.peek()
+        if first == '':
+            raise stream.error("Expecting value")
+        if first != '[':
+            while stream.peek():
+                yield stream.decode()
+            return
+
+        stream.pos += 1
+        if stream.peek() == ']':
+            stream.pos += 1
+        else:
+            while True:
+                yield stream.decode()
+                delimiter = stream.peek()
+                stream.pos += 1
+                if delimiter == ']':
+                    break
+                if delimiter != ',':
+                    stream.pos -= 1
+                    raise stream.error("Expecting ',' delimiter")
+        if stream.peek():
+            raise stream.error("Extra data")
+
+
+EntityResult = Tuple[Optional[str], bool, List[str]]  # (name, valid, errors)
+
+
+def _validate_entities(entities: List[object]) -> List[EntityResult]:
+    """Pool worker: (name, valid, errors) per entity; name None if not an object."""
+    results: List[EntityResult] = []
+    for entity in entities:
+        if not isinstance(entity, dict):
+            results.append((None, False, ["Entity is not a JSON object"]))
+            continue
+        valid, errors = validate_lp_entity(entity)
+        results.append((entity.get("name", "<unnamed>"), valid, errors))
+    return results
+
+
+def _iter_batches(items: Iterator[object], size: int) -> Iterator[List[object]]:
+    batch: List[object] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class _FileBatch:
+    """
+    One batch of entities in flight. results holds cached verdicts; todo
+    holds the entities still to validate (todo_refs: their positions).
+    """
+
+    __slots__ = ('keys', 'results', 'todo', 'todo_refs', 'future')
+
+    def __init__(self, entities: List[object], cache: Optional[LPValidationCache]):
+        self.keys: List[Optional[str]] = []
+        self.results: List[Optional[EntityResult]] = [None] * len(entities)
+        self.todo: List[object] = []
+        self.todo_refs: List[int] = []
+        self.future = None
+        for ref, entity in enumerate(entities):
+            key = None
+            if cache is not None and isinstance(entity, dict):
+                key = cache.key(entity)
+                verdict = cache.get(key)
+                if verdict is not None:
+                    self.keys.append(key)
+                    self.results[ref] = (entity.get("name", "<unnamed>"),) + verdict
+                    continue
+            self.keys.append(key)
+            self.todo.append(entity)
+            self.todo_refs.append(ref)
+
+    def finish(self, cache: Optional[LPValidationCache]) -> List[EntityResult]:
+        """Results for the whole batch, in order (validates inline without a future)."""
+        if self.future is not None:
+            todo_results = self.future.result()
+        else:
+            todo_results = _validate_entities(self.todo) if self.todo else []
+        for ref, result in zip(self.todo_refs, todo_results):
+            self.results[ref] = result
+            key = self.keys[ref]
+            if key is not None:
+                cache.put(key, result[1], result[2])
+        return self.results
+
+
+def iter_file_results(filepath: str, jobs: int = 1,
+                      cache: Optional[LPValidationCache] = None) -> Iterator[EntityResult]:
+    """
+    Validate every entity of filepath; yields (name, valid, errors) in file
+    order. Entities with a verdict in cache are not revalidated. jobs > 1
+    uses a process pool with at most jobs * FILE_BATCHES_PER_JOB batches
+    queued.
+    """
+    batches = (_FileBatch(batch, cache)
+               for batch in _iter_batches(iter_json_entities(filepath), FILE_BATCH_SIZE))
+    if jobs <= 1:
+        for batch in batches:
+            yield from batch.finish(cache)
+        return
+
+    window: deque = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for batch in batches:
+            if batch.todo:
+                batch.future = pool.submit(_validate_entities, batch.todo)
+            window.append(batch)
+            while len(window) >= jobs * FILE_BATCHES_PER_JOB:
+                yield from window.popleft().finish(cache)
+        while window:
+            yield from window.popleft().finish(cache)
+
+
+def validate_from_stdin(cache: Optional[LPValidationCache] = None) -> int:
     """
     Validate LP entity from stdin (JSON input).
 
@@ -326,7 +866,7 @@ def validate_from_stdin() -> int:
         print(f"ERROR: Invalid JSON input: {e}", file=sys.stderr)
         return 1
 
-    valid, errors = validate_lp_entity(data)
+    valid, errors = validate_lp_entity_cached(data, cache)
 
     if valid:
         print(f"✓ VALID: {data['name']}")
@@ -338,68 +878,63 @@ def validate_from_stdin() -> int:
         return 1
 
 
-def validate_from_file(filepath: str) -> int:
+def validate_from_file(filepath: str, jobs: int = 1, report_format: str = "text",
+                       cache: Optional[LPValidationCache] = None) -> int:
     """
-    Validate LP entities from a JSON file (array of entities or single entity).
+    Validate LP entities from a JSON file (array of entities, single entity,
+    or JSON Lines), streamed. report_format "json" prints one JSON line per
+    entity ({"name", "valid", "errors"}) and a summary line instead of text.
 
     Returns: exit code (0 = all valid, 1 = some invalid)
     """
+    total_valid = 0
+    total_invalid = 0
+
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        for name, valid, errors in iter_file_results(filepath, jobs, cache):
+            if valid:
+                total_valid += 1
+            else:
+                total_invalid += 1
+
+            if report_format == "json":
+                print(json.dumps({"name": name, "valid": valid, "errors": errors},
+                                 ensure_ascii=False))
+            elif valid:
+                print(f"✓ VALID: {name}")
+            elif name is None:
+                print(f"✗ INVALID: {errors[0]}", file=sys.stderr)
+            else:
+                print(f"✗ INVALID: {name}", file=sys.stderr)
+                for error in errors:
+                    print(f"  - {error}", file=sys.stderr)
     except FileNotFoundError:
         print(f"ERROR: File not found: {filepath}", file=sys.stderr)
         return 1
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # json.JSONDecodeError, UnicodeDecodeError
         print(f"ERROR: Invalid JSON in file: {e}", file=sys.stderr)
         return 1
 
-    # Handle both single entity and array of entities
-    if isinstance(data, list):
-        entities = data
+    if report_format == "json":
+        summary = {"valid": total_valid, "invalid": total_invalid}
+        if cache is not None:
+            summary["cache"] = {"hits": cache.hits, "misses": cache.misses}
+        print(json.dumps({"summary": summary}))
     else:
-        entities = [data]
-
-    total_valid = 0
-    total_invalid = 0
-
-    for entity in entities:
-        if not isinstance(entity, dict):
-            print(f"✗ INVALID: Entity is not a JSON object", file=sys.stderr)
-            total_invalid += 1
-            continue
-
-        name = entity.get("name", "<unnamed>")
-        valid, errors = validate_lp_entity(entity)
-
-        if valid:
-            print(f"✓ VALID: {name}")
-            total_valid += 1
-        else:
-            print(f"✗ INVALID: {name}", file=sys.stderr)
-            for error in errors:
-                print(f"  - {error}", file=sys.stderr)
-            total_invalid += 1
-
-    print(f"\n=== SUMMARY ===")
-    print(f"Valid: {total_valid}, Invalid: {total_invalid}")
+        print(f"\n=== SUMMARY ===")
+        print(f"Valid: {total_valid}, Invalid: {total_invalid}")
 
     return 0 if total_invalid == 0 else 1
 
 
-def validate_candidate(name: str, observation: str) -> int:
+def validate_candidate(name: str, observation: str,
+                       cache: Optional[LPValidationCache] = None) -> int:
     """
     Validate a single LP candidate (name + observation).
 
     Returns: exit code (0 = valid, 1 = invalid)
     """
-    entity = {
-        "name": name,
-        "entityType": "lp_internal" if name.startswith("lp:_internal:") else "learned_preference",
-        "observations": [observation]
-    }
-
-    valid, errors = validate_lp_entity(entity)
+    valid, errors = validate_lp_entity_cached(candidate_entity(name, observation), cache)
 
     if valid:
         print(f"✓ VALID: {name}")
@@ -411,7 +946,132 @@ def validate_candidate(name: str, observation: str) -> int:
         return 1
 
 
-def main():
+def candidate_entity(name: str, observation: str) -> Dict:
+    """The entity a --candidate (name + observation) is validated as."""
+    return {
+        "name": name,
+        "entityType": "lp_internal" if name.startswith("lp:_internal:") else "learned_preference",
+        "observations": [observation]
+    }
+
+
+# Server mode (--serve / --socket): one JSON request per line, one JSON
+# response line each. Requests:
+#   {"name": NAME, "observation": OBSERVATION}   candidate (as --candidate)
+#   {"entity": {...}}                             full entity
+#   {"candidates": [<candidate or entity>, ...]}  batch -> {"results": [...]}
+# An "id" field is echoed back. Verdicts: {"name", "valid", "errors"};
+# a malformed request or item gets {"error": MESSAGE} instead.
+
+def _verdict(item: object, cache: Optional[LPValidationCache]) -> Dict:
+    if not isinstance(item, dict):
+        return {"error": "Request is not a JSON object"}
+    if "entity" in item:
+        entity = item["entity"]
+        if not isinstance(entity, dict):
+            return {"error": "entity is not a JSON object"}
+    elif isinstance(item.get("name"), str) and isinstance(item.get("observation"), str):
+        entity = candidate_entity(item["name"], item["observation"])
+    else:
+        return {"error": "Expected {\"name\", \"observation\"} or {\"entity\"}"}
+    try:
+        valid, errors = validate_lp_entity_cached(entity, cache)
+    except (AttributeError, TypeError, ValueError) as e:  # wrongly typed fields
+        return {"name": entity.get("name"), "error": f"Malformed entity: {e}"}
+    return {"name": entity.get("name"), "valid": valid, "errors": errors}
+
+
+def handle_request(line: str, cache: Optional[LPValidationCache] = None) -> str:
+    """One request line -> one response line (without the newline)."""
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return json.dumps({"error": f"Invalid JSON request: {e}"})
+
+    if isinstance(request, dict) and "candidates" in request:
+        items = request["candidates"]
+        if isinstance(items, list):
+            response = {"results": [_verdict(item, cache) for item in items]}
+        else:
+            response = {"error": "candidates is not a JSON array"}
+    else:
+        response = _verdict(request, cache)
+    if isinstance(request, dict) and "id" in request:
+        response = {"id": request["id"], **response}
+    return json.dumps(response, ensure_ascii=False)
+
+
+def serve_stream(infile, outfile, cache: Optional[LPValidationCache] = None) -> int:
+    """--serve: answer requests from infile until EOF. Returns exit code 0."""
+    for line in infile:
+        if line.strip():
+            outfile.write(handle_request(line, cache) + "\n")
+            outfile.flush()
+    return 0
+
+
+def serve_socket(path: str, cache: Optional[LPValidationCache] = None) -> int:
+    """
+    --socket: answer requests on a Unix socket (one thread per connection,
+    validation serialized: the keyword memos are shared) until SIGINT or
+    SIGTERM. Returns exit code (1 if the socket cannot be created).
+    """
+    import signal
+    import socketserver
+    import stat
+    import threading
+
+    lock = threading.Lock()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode("utf-8", errors="replace")
+                if not line.strip():
+                    continue
+                with lock:
+                    response = handle_request(line, cache)
+                try:
+                    self.wfile.write(response.encode("utf-8") + b"\n")
+                except OSError:  # client went away
+                    return
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    try:
+        if stat.S_ISSOCK(os.lstat(path).st_mode):
+            os.unlink(path)  # stale socket from an earlier server
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"ERROR: Cannot use socket path {path}: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        server = Server(path, Handler)
+    except OSError as e:
+        print(f"ERROR: Cannot listen on {path}: {e}", file=sys.stderr)
+        return 1
+
+    def stop(signum, frame):
+        threading.Thread(target=server.shutdown).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    return 0
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Validate LP (Learned Preference) entities for format correctness",
         epilog="""
@@ -419,18 +1079,42 @@ Examples:
   # Validate from stdin
   echo '{"name": "lp:vocabulary:simplicity", ...}' | scripts/validate_lp.py
 
-  # Validate from file
+  # Validate from file (JSON array or JSON Lines), 4 processes, JSON report
   scripts/validate_lp.py --file lp_export.json
+  scripts/validate_lp.py --file lp_export.jsonl --jobs 4 --format json
+
+  # Skip entities unchanged since the last run (verdict cache in work/)
+  scripts/validate_lp.py --file lp_export.json --cache
 
   # Validate a candidate
   scripts/validate_lp.py --candidate "lp:defaults:typescript" "[what] ... [evidence] ... [scope] ... [action] ..."
+
+  # Server mode: one JSON request per line, one JSON verdict per line
+  scripts/validate_lp.py --serve            # or: --socket /tmp/validate_lp.sock
+  {"id": 1, "name": "lp:defaults:typescript", "observation": "[what] ... [action] ..."}
+  {"id": 2, "candidates": [{"name": ..., "observation": ...}, {"entity": {...}}]}
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
     parser.add_argument(
         "--file",
-        help="JSON file containing LP entities (array or single object)"
+        help="JSON file containing LP entities (array, single object or JSON Lines)"
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate --file entities in N worker processes (output order unchanged)"
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="--file report format: text (default) or JSON lines with a summary line"
     )
 
     parser.add_argument(
@@ -440,17 +1124,47 @@ Examples:
         help="Validate a single LP candidate (name and observation)"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_CACHE_PATH,
+        metavar="PATH",
+        help="Reuse verdicts of unchanged entities from a persistent cache "
+             "(default PATH: work/.lp_cache.json; reset when the rules change)"
+    )
 
-    # Determine input mode
-    if args.file:
-        return validate_from_file(args.file)
-    elif args.candidate:
-        name, observation = args.candidate
-        return validate_candidate(name, observation)
-    else:
-        # Default: read from stdin
-        return validate_from_stdin()
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Server mode: read JSON-lines requests on stdin, write one JSON verdict per line"
+    )
+
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Server mode on a Unix socket (JSON lines per connection)"
+    )
+
+    args = parser.parse_args(argv)
+    cache = LPValidationCache(args.cache) if args.cache else None
+
+    try:
+        # Determine input mode
+        if args.socket:
+            return serve_socket(args.socket, cache)
+        elif args.serve:
+            return serve_stream(sys.stdin, sys.stdout, cache)
+        elif args.file:
+            return validate_from_file(args.file, args.jobs, args.format, cache)
+        elif args.candidate:
+            name, observation = args.candidate
+            return validate_candidate(name, observation, cache)
+        else:
+            # Default: read from stdin
+            return validate_from_stdin(cache)
+    finally:
+        if cache is not None:
+            cache.save()
 
 
 if __name__ == "__main__":
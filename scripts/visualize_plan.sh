@@ -10,7 +10,12 @@ SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
 
 # Parse plan.md path (default to latest cmd)
-PLAN_PATH="${1:-$(ls -t "$PROJECT_ROOT"/work/cmd_*/plan.md 2>/dev/null | head -n1)}"
+# (archived cmds are resolved through cmd_archive.py)
+if [[ -n "${1:-}" ]]; then
+  PLAN_PATH=$(python3 "$SCRIPT_DIR/cmd_archive.py" --work-root "$PROJECT_ROOT/work" resolve "$1" 2>/dev/null || echo "$1")
+else
+  PLAN_PATH=$(python3 "$SCRIPT_DIR/cmd_archive.py" --work-root "$PROJECT_ROOT/work" latest plan.md 2>/dev/null || echo "")
+fi
 
 # Validate plan exists
 if [[ ! -f "$PLAN_PATH" ]]; then
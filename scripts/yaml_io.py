@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+scripts/yaml_io.py
+Shared YAML loader/dumper for claude-crew scripts.
+
+- Uses the libyaml C loader/dumper (CSafeLoader/CSafeDumper) when PyYAML
+  was built with libyaml, the pure-Python SafeLoader/SafeDumper otherwise.
+- PyYAML is imported lazily on first parse/dump, so scripts that never
+  touch YAML (or only probe availability) don't pay its import cost.
+- load() keeps a bounded in-process parse cache keyed by path, mtime and
+  size. Cached documents are shared between callers: treat them as
+  read-only (copy.deepcopy() before mutating).
+
+Usage (availability probe, does not import PyYAML):
+  python3 scripts/yaml_io.py --available
+Exit code: 0 = PyYAML installed, 1 = not installed
+"""
+
+import os
+import sys
+import importlib.util
+from collections import OrderedDict
+
+# Parsed documents kept by load() (least recently used are evicted)
+PARSE_CACHE_MAX_ENTRIES = 64
+
+_yaml = None
+_parse_cache = OrderedDict()  # realpath -> ((mtime_ns, size), document)
+
+
+class YAMLError(Exception):
+    """
+    YAML parse error. Wraps yaml.YAMLError so callers can catch parse
+    errors without importing PyYAML themselves.
+    """
+
+
+def available():
+    """True if PyYAML is installed (checked without importing it)."""
+    return _yaml is not None or importlib.util.find_spec('yaml') is not None
+
+
+def has_libyaml():
+    """True if PyYAML has the libyaml C bindings (imports PyYAML)."""
+    return hasattr(_module(), 'CSafeLoader')
+
+
+def _module():
+    """Import PyYAML on first use. Raises ImportError if not installed."""
+    global _yaml
+    if _yaml is None:
+        import yaml
+        _yaml = yaml
+    return _yaml
+
+
+def loads(content):
+    """Parse a YAML document from str or bytes. Raises YAMLError."""
+    yaml = _module()
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        return yaml.load(content, Loader=loader)
+    except yaml.YAMLError as e:
+        raise YAMLError(str(e)) from e
+
+
+def load(path):
+    """
+    Parse a YAML file, reusing the previous result while the file's mtime
+    and size are unchanged. Raises OSError (e.g. FileNotFoundError) or
+    YAMLError.
+    """
+    st = os.stat(path)
+    key = os.path.realpath(path)
+    signature = (st.st_mtime_ns, st.st_size)
+
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        _parse_cache.move_to_end(key)
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        document = loads(f.read())
+
+    _parse_cache[key] = (signature, document)
+    _parse_cache.move_to_end(key)
+    while len(_parse_cache) > PARSE_CACHE_MAX_ENTRIES:
+        _parse_cache.popitem(last=False)
+    return document
+
+
+def dump(data, stream=None, **kwargs):
+    """
+    Serialize data as block-style YAML, keeping key order and unicode.
+    Writes to stream if given, else returns the YAML string.
+    """
+    yaml = _module()
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    kwargs.setdefault('default_flow_style', False)
+    kwargs.setdefault('allow_unicode', True)
+    kwargs.setdefault('sort_keys', False)
+    return yaml.dump(data, stream, Dumper=dumper, **kwargs)
+
+
+def clear_cache():
+    """Drop all cached parse results."""
+    _parse_cache.clear()
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--available']:
+        sys.exit(0 if available() else 1)
+    print('Usage: python3 scripts/yaml_io.py --available', file=sys.stderr)
+    sys.exit(1)